@@ -11,17 +11,56 @@ class Settings(BaseSettings):
     
     # Algorand Network
     algorand_network: str = "testnet"
-    algorand_algod_address: str = "https://testnet-api.algonode.cloud"
-    algorand_indexer_address: str = "https://testnet-idx.algonode.cloud"
+    algorand_algod_address: str = "https://testnet-api.algonode.cloud"  # Comma-separated for failover
+    algorand_indexer_address: str = "https://testnet-idx.algonode.cloud"  # Comma-separated for failover
+    algorand_pool_size: int = 20  # Max open connections per node
+    algorand_keepalive_connections: int = 10  # Idle connections kept warm per node
+    algorand_connect_timeout: float = 3.0  # Seconds
+    algorand_request_timeout: float = 10.0  # Seconds
+    algorand_hedge_min_delay_ms: float = 20.0  # Floor of the p95-based hedge delay
+    algorand_breaker_failures: int = 5  # Consecutive failures that open a node's circuit
+    algorand_breaker_cooldown_seconds: float = 30.0  # How long an open circuit skips the node
+    algorand_fake_node: bool = False  # Serve algod/indexer from the in-process fake (offline/load tests)
+    algorand_fake_latency_ms: float = 0.0
+    algorand_fake_jitter_ms: float = 0.0
+    algorand_fake_failure_rate: float = 0.0  # Fraction of fake responses that are 503s
+    algorand_account_cache_ttl: float = 5.0  # Seconds an account lookup is reused
+    algorand_account_cache_round_invalidation: bool = False  # Drop entries once a newer round is seen
+    algorand_account_cache_max_entries: int = 10000  # Addresses kept; least recently used are evicted
     
     # JWT Configuration
     jwt_secret_key: str = "change-this-in-production"
     jwt_algorithm: str = "HS256"
     jwt_expire_minutes: int = 60
+    auth_token_cache_size: int = 10_000  # Decoded access tokens kept in memory
+    auth_verify_workers: int = 0  # Signature verification threads, 0 = one per CPU core
+    auth_verify_batch_size: int = 64  # Max signatures verified per worker hop
+    auth_verify_batch_delay_ms: float = 2.0  # Max wait for a batch to fill
+    auth_nonce_backend: str = "memory"  # 'memory' (single worker) or 'redis' (shared)
+    auth_nonce_redis_url: str = "redis://localhost:6379/0"
+    auth_nonce_ttl_seconds: float = 300.0  # How long a login challenge stays valid
+    auth_nonce_max_entries: int = 100_000  # Bound of the in-memory store
     
     # College Information
     college_name: str = "VIT Pune"
     
+    # Escrow transaction builder
+    escrow_params_max_age_rounds: int = 5  # Rounds suggested params are reused for
+    
+    # On-chain state sync
+    algorand_artifacts_dir: str = ""  # Generated ARC-56 specs; empty = projects/contracts artifacts
+    chain_sync_enabled: bool = True  # Mirror contract activity from the indexer in the background
+    chain_sync_interval_seconds: float = 15.0
+    chain_sync_page_size: int = 1000
+    # Sender of simulated readonly calls; must hold funds for fees (default: the fee sink)
+    algorand_readonly_sender: str = "Y76M3MSY6DKBRHBL7C3NNDXGS5IIMQVQVUAB6MP4XEMMGVF2QWNPL226CA"
+    
+    # Escrow reconciliation against on-chain MilestoneEscrow state
+    escrow_reconcile_enabled: bool = True
+    escrow_reconcile_interval_seconds: float = 60.0
+    escrow_reconcile_batch_size: int = 64  # Escrows per read (simulated 16 per group)
+    escrow_reconcile_concurrency: int = 4  # Batches read at once
+    
     # CORS
     cors_origins: str = "http://localhost:5173,http://localhost:3000"
     
@@ -35,10 +74,36 @@ class Settings(BaseSettings):
     oauth_redirect_uri: str = "http://localhost:8000/api/oauth"
     frontend_url: str = "http://localhost:5173"
     
+    # AI Skill-Matcher
+    ai_matching_mode: str = "jaccard"  # 'jaccard', 'semantic' or 'lsh'
+    ai_encoder: str = "hashing"  # 'hashing' (offline) or 'sentence-transformers'
+    ai_embedding_model: str = "all-MiniLM-L6-v2"
+    ai_embedding_dim: int = 384  # Used by the hashing encoder
+    ai_lsh_num_perm: int = 128  # MinHash signature length
+    ai_lsh_bands: int = 64  # More bands = higher recall, more candidates
+    ai_batch_parallel_min_users: int = 1024  # Batches this large use the process pool
+    ai_pool_workers: int = 0  # Matching worker processes, 0 = one per CPU core
+    ai_pool_min_projects: int = 2000  # Catalogues this large are matched on the pool
+    ai_recommendations_k: int = 20  # Matches returned by /api/ai/match (and materialized per user)
+    
+    # Personalized Feed
+    feed_weight_match: float = 0.6
+    feed_weight_recency: float = 0.3
+    feed_weight_budget: float = 0.1
+    feed_recency_half_life_days: float = 7.0  # Freshness score halves every N days
+    
     @property
     def cors_origins_list(self) -> list[str]:
         return [origin.strip() for origin in self.cors_origins.split(",")]
     
+    @property
+    def algod_addresses(self) -> list[str]:
+        return [address.strip() for address in self.algorand_algod_address.split(",") if address.strip()]
+    
+    @property
+    def indexer_addresses(self) -> list[str]:
+        return [address.strip() for address in self.algorand_indexer_address.split(",") if address.strip()]
+    
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
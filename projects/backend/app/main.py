@@ -2,20 +2,47 @@
 CampusNexus - FastAPI Main Application
 Decentralized LinkedIn & Marketplace for VIT Pune Students
 """
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.config import get_settings
-from app.routers import auth, feed, escrow, marketplace, ai, oauth, notifications
+from app.routers import auth, feed, escrow, marketplace, ai, oauth, notifications, chain
+from app.services.account_cache import get_account_cache
+from app.services.algorand import close_algorand_clients, get_algorand_clients, init_algorand_clients
+from app.services.chain_sync import start_chain_sync, stop_chain_sync
+from app.services.escrow_reconcile import start_escrow_reconciler, stop_escrow_reconciler
+from app.services.matching_pool import shutdown_matching_pool
+from app.services.nonce_store import get_nonce_store
+from app.services.signatures import shutdown_signature_verifier
 
 settings = get_settings()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start-up and shutdown of long-lived resources."""
+    # Built now so a bad nonce backend (unknown, redis missing or unreachable) fails at boot
+    get_nonce_store()
+    init_algorand_clients()
+    start_chain_sync()
+    start_escrow_reconciler()
+    yield
+    await stop_escrow_reconciler()
+    await stop_chain_sync()
+    await close_algorand_clients()
+    shutdown_matching_pool()
+    shutdown_signature_verifier()
+
+
 app = FastAPI(
     title="CampusNexus API",
     description=f"Decentralized Campus Ecosystem for {settings.college_name} on Algorand",
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
 )
 
 # CORS Middleware
@@ -43,6 +70,7 @@ app.include_router(escrow.router, prefix="/api/escrow", tags=["Escrow"])
 app.include_router(marketplace.router, prefix="/api/marketplace", tags=["Marketplace"])
 app.include_router(ai.router, prefix="/api/ai", tags=["AI & Automation"])
 app.include_router(notifications.router, prefix="/api/notifications", tags=["Notifications"])
+app.include_router(chain.router, prefix="/api/chain", tags=["On-Chain State"])
 
 
 @app.get("/", tags=["Health"])
@@ -63,4 +91,6 @@ async def health_check():
         "status": "healthy",
         "algorand_network": settings.algorand_network,
         "algorand_node": settings.algorand_algod_address,
+        "algorand_nodes": get_algorand_clients().stats(),
+        "account_cache": get_account_cache().stats(),
     }
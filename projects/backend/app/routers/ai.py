@@ -2,21 +2,27 @@
 CampusNexus - AI Router
 Endpoints for AI features (Skill Matcher, Hustle Score verification)
 """
-from fastapi import APIRouter, HTTPException, Body
+from fastapi import APIRouter, HTTPException, Body, Query
 from pydantic import BaseModel
-from typing import List
+from typing import List, Optional
 
-from app.services.ai_matching import rank_projects
+from app.config import get_settings
+from app.services.ai_matching import rank_projects, rank_candidates, cached_recommendations, MATCH_MODES
+from app.services.batch_matching import rank_projects_batch
+from app.services.matching_pool import get_matching_pool
+from app.services.skill_trie import get_skill_trie
 # Import database function instead of in-memory variable
-from app.utils.database import get_all_projects
+from app.utils.database import get_all_projects, get_project_by_id
 
 router = APIRouter(
-    prefix="/ai",
     tags=["ai"],
 )
+settings = get_settings()
 
 class MatchRequest(BaseModel):
     skills: List[str]
+    mode: Optional[str] = None  # 'jaccard', 'semantic' or 'lsh', defaults to settings
+    user_id: Optional[str] = None  # Enables the precomputed top-k for this user's own skills
 
 class MatchResponse(BaseModel):
     project_id: int
@@ -24,18 +30,66 @@ class MatchResponse(BaseModel):
     match_score: float
     skills_required: List[str]
 
+class BatchMatchItem(BaseModel):
+    user_id: Optional[str] = None  # Echoed back to identify the result
+    skills: List[str]
+
+class BatchMatchRequest(BaseModel):
+    users: List[BatchMatchItem]
+    top_k: int = 10
+    mode: Optional[str] = None
+    parallel: Optional[bool] = None  # None = use the process pool for large batches only
+
+class BatchMatchResult(BaseModel):
+    user_id: Optional[str] = None
+    matches: List[MatchResponse]
+
+class SkillSuggestion(BaseModel):
+    skill: str
+    count: int
+
+class CandidateResponse(BaseModel):
+    user_id: str
+    name: Optional[str] = None
+    avatar: Optional[str] = None
+    match_score: float
+    skills: List[str]
+
+
+def _resolve_mode(mode: Optional[str]) -> str:
+    """Fall back to the configured matching mode and reject unknown ones."""
+    mode = mode or settings.ai_matching_mode
+    if mode not in MATCH_MODES:
+        raise HTTPException(status_code=400, detail=f"Mode must be one of {', '.join(MATCH_MODES)}")
+    return mode
+
+
 @router.post("/match", response_model=List[MatchResponse])
 async def match_projects(request: MatchRequest):
     """
     AI Skill-Matcher: Match user skills with available projects.
-    Returns a list of projects ranked by relevance score.
+    Returns the ai_recommendations_k best projects ranked by relevance score,
+    whether or not they come from the recommendation cache.
     """
     if not request.skills:
         raise HTTPException(status_code=400, detail="Skills list cannot be empty")
     
-    # Fetch projects from database
-    projects = get_all_projects()
-    ranked_projects = rank_projects(request.skills, projects)
+    mode = _resolve_mode(request.mode)
+    
+    ranked_projects = None
+    if request.user_id and mode == "jaccard":
+        ranked_projects = cached_recommendations(request.user_id, request.skills)
+    
+    if ranked_projects is None:
+        # Fetch projects from database
+        projects = get_all_projects()
+        if mode == "semantic" or len(projects) >= settings.ai_pool_min_projects:
+            # Heavy scoring runs on the matching pool, not on the event loop
+            ranked_projects = (await get_matching_pool().rank(
+                [request.skills], mode=mode, k=settings.ai_recommendations_k
+            ))[0]
+        else:
+            ranked_projects = rank_projects(request.skills, projects, mode=mode)[:settings.ai_recommendations_k]
     
     # Format response
     results = [
@@ -49,3 +103,85 @@ async def match_projects(request: MatchRequest):
     ]
     
     return results
+
+
+@router.post("/match/batch", response_model=List[BatchMatchResult])
+async def match_projects_batch(request: BatchMatchRequest):
+    """
+    Batch Skill-Matcher: top-k projects for many users in one call.
+    The project catalogue is loaded and encoded once for the whole batch.
+    """
+    if not request.users:
+        raise HTTPException(status_code=400, detail="Users list cannot be empty")
+    if request.top_k < 1:
+        raise HTTPException(status_code=400, detail="top_k must be at least 1")
+    
+    mode = _resolve_mode(request.mode)
+    parallel = request.parallel
+    if parallel is None:
+        parallel = len(request.users) >= settings.ai_batch_parallel_min_users
+    
+    skill_sets = [u.skills for u in request.users]
+    if parallel:
+        ranked = await get_matching_pool().rank(skill_sets, mode=mode, k=request.top_k)
+    else:
+        ranked = rank_projects_batch(skill_sets, get_all_projects(), mode=mode, k=request.top_k)
+    
+    return [
+        BatchMatchResult(
+            user_id=user.user_id,
+            matches=[
+                MatchResponse(
+                    project_id=p["id"],
+                    title=p["title"],
+                    match_score=p["match_score"],
+                    skills_required=p["skills_required"]
+                )
+                for p in user_ranked
+            ]
+        )
+        for user, user_ranked in zip(request.users, ranked)
+    ]
+
+
+@router.get("/project/{project_id}/candidates", response_model=List[CandidateResponse])
+async def match_candidates(
+    project_id: int,
+    limit: int = Query(10, ge=1, le=100, description="Maximum number of candidates"),
+    mode: Optional[str] = Query(None, description="Matching mode, defaults to settings")
+):
+    """
+    Reverse Skill-Matcher: rank students whose skills fit a project.
+    Served from the in-memory user skill index, not a users.json scan.
+    """
+    project = get_project_by_id(project_id)
+    if not project:
+        raise HTTPException(status_code=404, detail="Project not found")
+    
+    candidates = rank_candidates(project, mode=_resolve_mode(mode), limit=limit)
+    
+    return [
+        CandidateResponse(
+            user_id=c["id"],
+            name=c["name"],
+            avatar=c["avatar"],
+            match_score=c["match_score"],
+            skills=c["skills"]
+        )
+        for c in candidates
+    ]
+
+
+@router.get("/skills/suggest", response_model=List[SkillSuggestion])
+async def suggest_skills(
+    prefix: str = Query(..., min_length=1, description="What the user has typed so far"),
+    limit: int = Query(10, ge=1, le=20, description="Maximum number of suggestions")
+):
+    """
+    Skill autocomplete ranked by popularity across projects and profiles.
+    Served from an in-memory prefix trie kept current on project/profile writes.
+    """
+    return [
+        SkillSuggestion(skill=skill, count=count)
+        for skill, count in get_skill_trie().suggest(prefix, limit)
+    ]
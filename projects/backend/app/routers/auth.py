@@ -2,13 +2,15 @@
 CampusNexus - Authentication Router
 Wallet-based authentication using Pera Wallet
 """
+import re
 from datetime import datetime, timedelta
 from fastapi import APIRouter, HTTPException, Depends
 from pydantic import BaseModel
 from jose import jwt
 
 from app.config import get_settings
-from app.services.algorand import verify_wallet_signature, get_account_info
+from app.services.algorand import verify_wallet_signature, get_account_info, is_valid_address
+from app.services.nonce_store import get_nonce_store
 
 from app.utils.database import (
     find_user_by_wallet,
@@ -20,6 +22,9 @@ from app.utils.database import (
 router = APIRouter()
 settings = get_settings()
 
+# The nonce line of the signed login message
+NONCE_LINE = re.compile(r"^Nonce: (\S+)$", re.MULTILINE)
+
 
 class WalletConnectRequest(BaseModel):
     """Request model for wallet connection."""
@@ -48,11 +53,15 @@ async def get_nonce(address: str):
     Generate a nonce for wallet signing.
     The frontend will sign this message with Pera Wallet.
     """
+    if not is_valid_address(address):
+        raise HTTPException(status_code=400, detail="Invalid Algorand address")
+    
+    nonce = get_nonce_store().issue(address)
     timestamp = datetime.utcnow().isoformat()
-    message = f"Sign this message to authenticate with CampusNexus\nAddress: {address}\nTimestamp: {timestamp}\nCollege: {settings.college_name}"
+    message = f"Sign this message to authenticate with CampusNexus\nAddress: {address}\nNonce: {nonce}\nTimestamp: {timestamp}\nCollege: {settings.college_name}"
     
     return NonceResponse(
-        nonce=timestamp,
+        nonce=nonce,
         message=message
     )
 
@@ -62,8 +71,12 @@ async def verify_wallet(request: WalletConnectRequest):
     """
     Verify wallet signature and issue JWT token.
     """
+    # Checked locally, so logins never wait on algod
+    if not is_valid_address(request.address):
+        raise HTTPException(status_code=400, detail="Invalid Algorand address")
+    
     # Verify the signature
-    is_valid = verify_wallet_signature(
+    is_valid = await verify_wallet_signature(
         request.address,
         request.message,
         request.signature
@@ -72,11 +85,10 @@ async def verify_wallet(request: WalletConnectRequest):
     if not is_valid:
         raise HTTPException(status_code=401, detail="Invalid signature")
     
-    # Get account info to verify it exists
-    account_info = get_account_info(request.address)
-    if "error" in account_info:
-        raise HTTPException(status_code=400, detail="Invalid Algorand address")
-    
+    # Consumed only after the signature checks out, so forged requests cannot burn a nonce
+    nonce = NONCE_LINE.search(request.message)
+    if not nonce or not get_nonce_store().consume(request.address, nonce.group(1)):
+        raise HTTPException(status_code=401, detail="Login message expired or already used")
     
     # Create JWT token
     expires_delta = timedelta(minutes=settings.jwt_expire_minutes)
@@ -122,7 +134,10 @@ async def verify_wallet(request: WalletConnectRequest):
 @router.get("/me")
 async def get_current_user(address: str):
     """Get current user info by wallet address."""
-    account_info = get_account_info(address)
+    if not is_valid_address(address):
+        raise HTTPException(status_code=400, detail="Invalid Algorand address")
+    
+    account_info = await get_account_info(address)
     
     return {
         "address": address,
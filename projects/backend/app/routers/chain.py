@@ -0,0 +1,97 @@
+"""
+CampusNexus - On-Chain State Router
+Escrow and reputation state mirrored from our contracts by the chain sync
+worker (served locally), plus live readonly contract reads batched through
+algod's simulate endpoint
+"""
+from typing import List
+
+from fastapi import APIRouter, HTTPException, Query
+
+from app.services.algorand import is_valid_address
+from app.services.chain_sync import get_chain_store, get_chain_sync
+from app.services.contract_reads import (
+    ContractReadError,
+    get_contract_reader,
+    read_escrow_infos,
+    read_hustle_score_summary,
+)
+
+# Upper bound of app ids per live read request
+MAX_LIVE_READS = 256
+
+router = APIRouter()
+
+
+@router.get("/status")
+async def sync_status():
+    """Sync cursor per app and the last sync error, if any."""
+    sync = get_chain_sync()
+    return {
+        "cursors": {app_id: cursor["round"] for app_id, cursor in get_chain_store().cursors.items()},
+        "last_error": sync.last_error,
+    }
+
+
+@router.get("/escrows")
+async def list_chain_escrows(status: str = None):
+    """Escrows as last seen on chain."""
+    escrows = list(get_chain_store().escrows.values())
+    if status:
+        escrows = [e for e in escrows if e["status"] == status]
+    return escrows
+
+
+@router.get("/escrows/live")
+async def read_live_escrows(app_ids: List[int] = Query(...)):
+    """Current get_info of many escrow apps, read from the chain in batches."""
+    if len(app_ids) > MAX_LIVE_READS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_LIVE_READS} app ids per request")
+    
+    try:
+        infos = await read_escrow_infos(app_ids)
+    except Exception as e:
+        raise HTTPException(status_code=502, detail=f"Contract read failed: {e}")
+    return {
+        str(app_id): {"app_id": app_id, "error": str(info)} if isinstance(info, ContractReadError) else info
+        for app_id, info in infos.items()
+    }
+
+
+@router.get("/hustle-score")
+async def read_hustle_score():
+    """HustleScore admin and total points minted, read live from the chain."""
+    try:
+        return await read_hustle_score_summary()
+    except Exception as e:
+        raise HTTPException(status_code=502, detail=f"Contract read failed: {e}")
+
+
+@router.get("/reads/stats")
+async def contract_read_stats():
+    """Readonly call cache and simulate counters."""
+    return get_contract_reader().stats()
+
+
+@router.get("/escrows/{app_id}")
+async def get_chain_escrow(app_id: int):
+    """On-chain state of one escrow app."""
+    escrow = get_chain_store().escrows.get(str(app_id))
+    if not escrow:
+        raise HTTPException(status_code=404, detail="Escrow not found on chain")
+    return escrow
+
+
+@router.get("/reputation/{address}")
+async def get_reputation(address: str, limit: int = 50):
+    """A student's Hustle Score total and most recent reputation events."""
+    if not is_valid_address(address):
+        raise HTTPException(status_code=400, detail="Invalid Algorand address")
+    
+    store = get_chain_store()
+    events = [e for e in store.reputation_events if e["student"] == address]
+    return {
+        "address": address,
+        "score": store.reputation.get(address, 0),
+        "events": events[-limit:][::-1],
+    }
@@ -2,15 +2,24 @@
 CampusNexus - Escrow Router
 Milestone-based escrow for freelancing
 """
+import asyncio
 from datetime import datetime
 from typing import Optional
 from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
-router = APIRouter()
+from app.services.algorand import is_valid_address
+from app.services.escrow_reconcile import get_escrow_reconciler
+from app.services.escrow_store import get_escrow_store
+from app.services.escrow_txns import (
+    build_cancel_escrow,
+    build_create_escrow,
+    build_fund_escrow,
+    build_release_payment,
+    get_params_cache,
+)
 
-# In-memory store (replace with smart contract in production)
-escrows_db: list[dict] = []
+router = APIRouter()
 
 
 class MilestoneCreate(BaseModel):
@@ -27,6 +36,7 @@ class EscrowCreate(BaseModel):
     freelancer_address: str
     total_amount_algo: float
     milestones: list[MilestoneCreate]
+    app_id: Optional[int] = None  # MilestoneEscrow app deployed for this escrow, if any
 
 
 class EscrowResponse(BaseModel):
@@ -39,6 +49,113 @@ class EscrowResponse(BaseModel):
     milestones: list[dict]
     status: str
     created_at: str
+    app_id: Optional[int] = None
+    released_amount_algo: float = 0
+    chain_error: Optional[str] = None
+
+
+class CreateEscrowTxnRequest(BaseModel):
+    """Unsigned create_escrow call, sent by the client."""
+    app_id: int = Field(gt=0)  # Freshly deployed MilestoneEscrow app (one escrow per app)
+    client_address: str
+    freelancer_address: str
+    total_amount_algo: float = Field(gt=0)
+
+
+class AmountTxnRequest(BaseModel):
+    """Unsigned fund_escrow / release_payment group, sent by the client."""
+    app_id: int = Field(gt=0)  # MilestoneEscrow app of the escrow
+    client_address: str
+    amount_algo: float = Field(gt=0)
+
+
+class CancelEscrowTxnRequest(BaseModel):
+    """Unsigned cancel_escrow call, sent by the client."""
+    app_id: int = Field(gt=0)  # MilestoneEscrow app of the escrow
+    client_address: str
+
+
+class UnsignedGroupResponse(BaseModel):
+    """Ready-to-sign transaction group (base64 msgpack, in submission order)."""
+    method: str
+    app_id: int
+    group_id: Optional[str]
+    first_valid: int
+    last_valid: int
+    transactions: list[str]
+
+
+def _check_addresses(*addresses: str):
+    for address in addresses:
+        if not is_valid_address(address):
+            raise HTTPException(status_code=400, detail=f"Invalid Algorand address: {address}")
+
+
+async def _build(builder, *args) -> dict:
+    try:
+        return await builder(*args)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=502, detail=f"Could not fetch suggested params: {e}")
+
+
+@router.post("/txns/create", response_model=UnsignedGroupResponse)
+async def create_escrow_txn(request: CreateEscrowTxnRequest):
+    """
+    Unsigned create_escrow call for the client's wallet to sign. app_id must
+    be a MilestoneEscrow app deployed for this escrow: an app holds one escrow.
+    """
+    _check_addresses(request.client_address, request.freelancer_address)
+    return await _build(
+        build_create_escrow,
+        request.app_id,
+        request.client_address,
+        request.freelancer_address,
+        request.total_amount_algo,
+    )
+
+
+@router.post("/txns/fund", response_model=UnsignedGroupResponse)
+async def fund_escrow_txn(request: AmountTxnRequest):
+    """Unsigned [payment to app, fund_escrow] group for the client's wallet to sign."""
+    _check_addresses(request.client_address)
+    return await _build(build_fund_escrow, request.app_id, request.client_address, request.amount_algo)
+
+
+@router.post("/txns/release", response_model=UnsignedGroupResponse)
+async def release_payment_txn(request: AmountTxnRequest):
+    """Unsigned release_payment call (fee covers the inner payment)."""
+    _check_addresses(request.client_address)
+    return await _build(build_release_payment, request.app_id, request.client_address, request.amount_algo)
+
+
+@router.post("/txns/cancel", response_model=UnsignedGroupResponse)
+async def cancel_escrow_txn(request: CancelEscrowTxnRequest):
+    """Unsigned cancel_escrow call for the client's wallet to sign."""
+    _check_addresses(request.client_address)
+    return await _build(build_cancel_escrow, request.app_id, request.client_address)
+
+
+@router.get("/txns/params/stats")
+async def suggested_params_stats():
+    """Suggested-params cache hits and refreshes."""
+    return get_params_cache().stats()
+
+
+@router.get("/reconcile/stats")
+async def reconcile_stats():
+    """Divergence counts and duration of the on-chain reconciliation job."""
+    return get_escrow_reconciler().stats()
+
+
+@router.post("/reconcile")
+async def reconcile_now():
+    """Run one reconciliation pass against on-chain state now."""
+    try:
+        return await get_escrow_reconciler().reconcile_once()
+    except Exception as e:
+        raise HTTPException(status_code=502, detail=f"Reconciliation failed: {e}")
 
 
 @router.post("/", response_model=EscrowResponse)
@@ -57,8 +174,8 @@ async def create_escrow(escrow: EscrowCreate):
         for m in escrow.milestones
     ]
     
-    new_escrow = {
-        "id": len(escrows_db) + 1,
+    # Store writes wait on a file lock, so they run off the event loop
+    return await asyncio.to_thread(get_escrow_store().create, {
         "project_id": escrow.project_id,
         "client_address": escrow.client_address,
         "freelancer_address": escrow.freelancer_address,
@@ -66,63 +183,104 @@ async def create_escrow(escrow: EscrowCreate):
         "milestones": milestones_with_status,
         "status": "active",
         "created_at": datetime.utcnow().isoformat(),
-    }
-    
-    escrows_db.append(new_escrow)
-    return new_escrow
+        "app_id": escrow.app_id,
+    })
+
+
+def _filter_status(escrows: list[dict], status: Optional[str]) -> list[dict]:
+    return [e for e in escrows if e["status"] == status] if status else escrows
+
+
+@router.get("/client/{address}", response_model=list[EscrowResponse])
+async def list_client_escrows(address: str, status: Optional[str] = None):
+    """Escrows the address funds as client, oldest first."""
+    _check_addresses(address)
+    return _filter_status(get_escrow_store().by_client(address), status)
+
+
+@router.get("/freelancer/{address}", response_model=list[EscrowResponse])
+async def list_freelancer_escrows(address: str, status: Optional[str] = None):
+    """Escrows the address works on as freelancer, oldest first."""
+    _check_addresses(address)
+    return _filter_status(get_escrow_store().by_freelancer(address), status)
+
+
+@router.get("/project/{project_id}", response_model=list[EscrowResponse])
+async def list_project_escrows(project_id: int):
+    """Escrows opened for a project."""
+    return get_escrow_store().by_project(project_id)
 
 
 @router.get("/{escrow_id}", response_model=EscrowResponse)
 async def get_escrow(escrow_id: int):
     """Get escrow details by ID."""
-    for escrow in escrows_db:
-        if escrow["id"] == escrow_id:
-            return escrow
-    raise HTTPException(status_code=404, detail="Escrow not found")
+    escrow = get_escrow_store().get(escrow_id)
+    if not escrow:
+        raise HTTPException(status_code=404, detail="Escrow not found")
+    return escrow
+
+
+def _complete_milestone(escrow_id: int, milestone_index: int, freelancer_address: str) -> dict:
+    store = get_escrow_store()
+    with store.batch():
+        escrow = store.get(escrow_id)
+        if not escrow:
+            raise HTTPException(status_code=404, detail="Escrow not found")
+        
+        if escrow["freelancer_address"] != freelancer_address:
+            raise HTTPException(status_code=403, detail="Only freelancer can complete milestones")
+        
+        if not 0 <= milestone_index < len(escrow["milestones"]):
+            raise HTTPException(status_code=400, detail="Invalid milestone index")
+        
+        milestone = escrow["milestones"][milestone_index]
+        milestone["status"] = "completed"
+        milestone["completed_at"] = datetime.utcnow().isoformat()
+        store.update(escrow_id, {"milestones": escrow["milestones"]})
+    return milestone
+
+
+def _approve_milestone(escrow_id: int, milestone_index: int, client_address: str) -> dict:
+    store = get_escrow_store()
+    with store.batch():
+        escrow = store.get(escrow_id)
+        if not escrow:
+            raise HTTPException(status_code=404, detail="Escrow not found")
+        
+        if escrow["client_address"] != client_address:
+            raise HTTPException(status_code=403, detail="Only client can approve milestones")
+        
+        if not 0 <= milestone_index < len(escrow["milestones"]):
+            raise HTTPException(status_code=400, detail="Invalid milestone index")
+        
+        milestone = escrow["milestones"][milestone_index]
+        if milestone["status"] != "completed":
+            raise HTTPException(status_code=400, detail="Milestone not marked as complete")
+        
+        milestone["status"] = "approved"
+        milestone["approved_at"] = datetime.utcnow().isoformat()
+        changes = {"milestones": escrow["milestones"]}
+        
+        # Check if all milestones are approved
+        all_approved = all(m["status"] == "approved" for m in escrow["milestones"])
+        if all_approved:
+            changes["status"] = "completed"
+        store.update(escrow_id, changes)
+    return milestone
 
 
 @router.post("/{escrow_id}/milestone/{milestone_index}/complete")
 async def complete_milestone(escrow_id: int, milestone_index: int, freelancer_address: str):
     """Mark a milestone as complete (by freelancer)."""
-    for escrow in escrows_db:
-        if escrow["id"] == escrow_id:
-            if escrow["freelancer_address"] != freelancer_address:
-                raise HTTPException(status_code=403, detail="Only freelancer can complete milestones")
-            
-            if milestone_index >= len(escrow["milestones"]):
-                raise HTTPException(status_code=400, detail="Invalid milestone index")
-            
-            escrow["milestones"][milestone_index]["status"] = "completed"
-            escrow["milestones"][milestone_index]["completed_at"] = datetime.utcnow().isoformat()
-            
-            return {"message": "Milestone marked as complete", "milestone": escrow["milestones"][milestone_index]}
-    
-    raise HTTPException(status_code=404, detail="Escrow not found")
+    milestone = await asyncio.to_thread(_complete_milestone, escrow_id, milestone_index, freelancer_address)
+    return {"message": "Milestone marked as complete", "milestone": milestone}
 
 
 @router.post("/{escrow_id}/milestone/{milestone_index}/approve")
 async def approve_milestone(escrow_id: int, milestone_index: int, client_address: str):
     """Approve a milestone and release funds (by client)."""
-    for escrow in escrows_db:
-        if escrow["id"] == escrow_id:
-            if escrow["client_address"] != client_address:
-                raise HTTPException(status_code=403, detail="Only client can approve milestones")
-            
-            milestone = escrow["milestones"][milestone_index]
-            if milestone["status"] != "completed":
-                raise HTTPException(status_code=400, detail="Milestone not marked as complete")
-            
-            milestone["status"] = "approved"
-            milestone["approved_at"] = datetime.utcnow().isoformat()
-            
-            # Check if all milestones are approved
-            all_approved = all(m["status"] == "approved" for m in escrow["milestones"])
-            if all_approved:
-                escrow["status"] = "completed"
-            
-            return {
-                "message": f"Milestone approved. {milestone['amount_algo']} ALGO released.",
-                "milestone": milestone
-            }
-    
-    raise HTTPException(status_code=404, detail="Escrow not found")
+    milestone = await asyncio.to_thread(_approve_milestone, escrow_id, milestone_index, client_address)
+    return {
+        "message": f"Milestone approved. {milestone['amount_algo']} ALGO released.",
+        "milestone": milestone
+    }
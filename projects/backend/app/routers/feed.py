@@ -7,10 +7,15 @@ from typing import Optional, List
 from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel
 
+from app.services.ai_matching import index_project
+from app.services.feed_ranking import rank_feed
+from app.services.skills import get_skill_registry, skill_ids
+from app.services.user_index import get_user_index
 from app.utils.database import (
     create_project,
     get_all_projects,
     get_project_by_id,
+    get_projects_version,
     apply_to_project
 )
 
@@ -45,6 +50,12 @@ class ProjectResponse(BaseModel):
     applications: List[dict]
 
 
+class FeedItem(ProjectResponse):
+    """A project in the personalized feed, with its ranking scores."""
+    feed_score: float
+    match_score: float
+
+
 class ApplicationRequest(BaseModel):
     """Request model for applying to a project."""
     applicant_id: str
@@ -65,7 +76,11 @@ async def list_projects(
     filtered = projects
     
     if skill:
-        filtered = [p for p in filtered if skill.lower() in [s.lower() for s in p.get("skills_required", [])]]
+        # Compare canonical skill ids, so 'js' also finds 'JavaScript' projects.
+        # The query skill is only looked up: an unknown skill matches no project.
+        project_sets = [(p, skill_ids(p.get("skills_required", []))) for p in filtered]
+        skill_id = get_skill_registry().lookup(skill)
+        filtered = [p for p, ids in project_sets if skill_id is not None and skill_id in ids]
     
     if min_budget:
         filtered = [p for p in filtered if p.get("budget_algo", 0) >= min_budget]
@@ -84,10 +99,32 @@ async def create_new_project(project: ProjectCreate):
     """
     Create a new project/gig opportunity.
     """
+    base_version = get_projects_version()
     new_project = create_project(project.model_dump())
+    index_project(new_project, base_version)
     return new_project
 
 
+@router.get("/for-you", response_model=List[FeedItem])
+async def personalized_feed(
+    user_id: Optional[str] = Query(None, description="Rank for this user's profile skills"),
+    skills: Optional[List[str]] = Query(None, description="Rank for these skills instead"),
+    offset: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100)
+):
+    """
+    Open projects ranked for a student by skill match, recency and budget.
+    """
+    if user_id:
+        user_skills = get_user_index().skills.get(user_id)
+        if user_skills is None:
+            raise HTTPException(status_code=404, detail="User not found")
+    else:
+        user_skills = skills or []
+    
+    return rank_feed(user_skills, offset=offset, limit=limit)
+
+
 @router.get("/{project_id}", response_model=ProjectResponse)
 async def get_project(project_id: int):
     """Get a specific project by ID."""
@@ -3,18 +3,22 @@ CampusNexus - OAuth Authentication Router
 Google and GitHub OAuth 2.0 authentication
 """
 from datetime import datetime, timedelta
-from fastapi import APIRouter, HTTPException, Request
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Request
 from fastapi.responses import RedirectResponse
 from authlib.integrations.starlette_client import OAuth
 from jose import jwt
 from pydantic import BaseModel
 
 from app.config import get_settings
-from app.models.user import UserCreate, UserResponse, OAuthUserInfo, UserUpdate
+from app.models.user import User, UserCreate, UserResponse, OAuthUserInfo, UserUpdate
+from app.services.ai_matching import index_user
+from app.services.auth_tokens import get_current_user as get_authenticated_user
 from app.utils.database import (
     find_user_by_email, 
     find_user_by_oauth, 
     create_user,
+    get_users_version,
     update_user_login,
     update_user_profile
 )
@@ -215,32 +219,44 @@ async def github_callback(request: Request):
         return RedirectResponse(url=error_url)
 
 
+def _require_same_user(current_user: User, user_id: Optional[str]):
+    """Reject requests naming a different user than the bearer token."""
+    if user_id is not None and user_id != current_user.id:
+        raise HTTPException(status_code=403, detail="Token does not belong to this user")
+
+
 @router.get("/me", response_model=UserResponse)
-async def get_current_user(user_id: str):
+async def get_current_user(
+    user_id: Optional[str] = None,
+    current_user: User = Depends(get_authenticated_user)
+):
     """Get current authenticated user info."""
-    from app.utils.database import load_users
-    
-    users = load_users()
-    for user_data in users:
-        if user_data.get('id') == user_id:
-            return UserResponse(**user_data)
-    
-    raise HTTPException(status_code=404, detail="User not found")
+    _require_same_user(current_user, user_id)
+    return UserResponse(**current_user.model_dump())
 
 
 @router.put("/profile", response_model=UserResponse)
-async def update_profile(user_id: str, profile: UserUpdate):
+async def update_profile(
+    profile: UserUpdate,
+    user_id: Optional[str] = None,
+    current_user: User = Depends(get_authenticated_user)
+):
     """Update user profile."""
-    # In a real app, verify that the current user matches user_id via JWT
+    _require_same_user(current_user, user_id)
+    user_id = current_user.id
     
     # We need to convert pydantic model to dict, excluding unset fields
     update_data = profile.model_dump(exclude_unset=True)
     
+    base_version = get_users_version()
     updated_user = update_user_profile(user_id, update_data)
     
     if not updated_user:
         raise HTTPException(status_code=404, detail="User not found")
     
+    if "skills" in update_data:
+        index_user(updated_user.model_dump(), base_version)
+    
     return UserResponse(**updated_user.model_dump())
 
 
@@ -251,11 +267,16 @@ class ProfilePictureUpload(BaseModel):
 
 
 @router.post("/upload-profile-picture")
-async def upload_profile_picture(upload: ProfilePictureUpload):
+async def upload_profile_picture(
+    upload: ProfilePictureUpload,
+    current_user: User = Depends(get_authenticated_user)
+):
     """
     Upload profile picture (Base64 encoded).
     In production, this should upload to cloud storage and return URL.
     """
+    _require_same_user(current_user, upload.user_id)
+    
     try:
         # For now, we'll store the Base64 string directly
         # In production, decode and upload to S3/Cloudinary
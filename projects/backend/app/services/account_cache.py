@@ -0,0 +1,132 @@
+"""
+CampusNexus - Account Info Cache
+Short-lived cache of algod account lookups. Concurrent misses for the same
+address share one upstream request, and entries can be dropped as soon as
+a newer round is observed. The cache holds at most max_entries addresses,
+evicting the least recently used.
+"""
+import asyncio
+import time
+from collections import OrderedDict, deque
+from typing import Awaitable, Callable, Deque, Dict, Optional, Tuple
+
+from app.config import get_settings
+
+Fetch = Callable[[str], Awaitable[dict]]
+
+
+class AccountCache:
+    """
+    Address -> account info with a TTL, LRU eviction and single-flight loading.
+    Failed lookups are not cached; every caller waiting on them gets the error.
+    """
+
+    def __init__(
+        self,
+        ttl: float,
+        invalidate_on_round: bool = False,
+        max_entries: int = 10000,
+        latency_window: int = 1000,
+    ):
+        self.ttl = ttl
+        self.invalidate_on_round = invalidate_on_round
+        self.max_entries = max_entries
+        # Least recently used first
+        self._entries: OrderedDict[str, Tuple[float, int, dict]] = OrderedDict()
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self.last_round = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+        self._latencies: Deque[float] = deque(maxlen=latency_window)
+
+    async def get(self, address: str, fetch: Fetch) -> dict:
+        entry = self._entries.get(address)
+        if entry is not None:
+            expires_at, fetched_round, info = entry
+            if time.monotonic() < expires_at and not self._stale(fetched_round):
+                self.hits += 1
+                self._entries.move_to_end(address)
+                return info
+            del self._entries[address]
+
+        task = self._inflight.get(address)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            self.misses += 1
+            task = asyncio.ensure_future(self._load(address, fetch))
+            self._inflight[address] = task
+        # Shielded so one cancelled caller does not cancel the lookup for the others
+        return await asyncio.shield(task)
+
+    async def _load(self, address: str, fetch: Fetch) -> dict:
+        started = time.perf_counter()
+        try:
+            info = await fetch(address)
+        finally:
+            self._latencies.append(time.perf_counter() - started)
+            self._inflight.pop(address, None)
+
+        fetched_round = info.get("round", 0)
+        self.observe_round(fetched_round)
+        self._entries[address] = (time.monotonic() + self.ttl, fetched_round, info)
+        self._entries.move_to_end(address)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return info
+
+    def _stale(self, fetched_round: int) -> bool:
+        return self.invalidate_on_round and fetched_round < self.last_round
+
+    def observe_round(self, round_number: int):
+        """Record the newest round seen; older entries become stale if round invalidation is on."""
+        if round_number > self.last_round:
+            self.last_round = round_number
+
+    def invalidate(self, address: Optional[str] = None):
+        """Drop one address, or everything."""
+        if address is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(address, None)
+
+    def stats(self) -> dict:
+        """Hit ratio and upstream latency for monitoring."""
+        lookups = self.hits + self.misses + self.coalesced
+        latencies = sorted(self._latencies)
+
+        def percentile(p: float) -> float:
+            if not latencies:
+                return 0.0
+            return round(latencies[min(len(latencies) - 1, int(p * len(latencies)))] * 1000, 2)
+
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "evictions": self.evictions,
+            "hit_ratio": round((self.hits + self.coalesced) / lookups, 4) if lookups else 0.0,
+            "upstream_latency_ms": {"p50": percentile(0.5), "p95": percentile(0.95), "samples": len(latencies)},
+            "last_round": self.last_round,
+        }
+
+
+_cache: Optional[AccountCache] = None
+
+
+def get_account_cache() -> AccountCache:
+    """Get the process-wide account cache."""
+    global _cache
+    if _cache is None:
+        settings = get_settings()
+        _cache = AccountCache(
+            settings.algorand_account_cache_ttl,
+            settings.algorand_account_cache_round_invalidation,
+            settings.algorand_account_cache_max_entries,
+        )
+    return _cache
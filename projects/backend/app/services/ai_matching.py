@@ -2,36 +2,90 @@
 CampusNexus - AI Matching Service
 Implements skill matching logic for matching students to projects.
 """
+import heapq
+
+from app.config import get_settings
+from app.services.embeddings import get_embedding_index, get_encoder, skills_text
+from app.services.minhash import get_lsh_index
+from app.services.recommendations import get_recommendation_cache
+from app.services.skill_trie import get_skill_trie
+from app.services.skills import get_skill_registry, jaccard, query_skill_ids, skill_ids
+from app.services.user_index import get_user_index
+from app.utils.database import get_all_projects
+
+# Matching modes accepted by rank_projects
+MATCH_MODES = ("jaccard", "semantic", "lsh")
+
+# Cosine similarity below which a semantic match is not reported
+SEMANTIC_MIN_SCORE = 0.2
+
 
 def calculate_match_score(user_skills: list[str], project_skills: list[str]) -> float:
     """
     Calculate a match score between user skills and project requirements.
     Uses Jaccard similarity coefficient suitable for set comparison.
+    Skills are canonicalized through the skill registry (e.g. 'js' == 'javascript').
     """
     if not user_skills or not project_skills:
         return 0.0
         
-    # Normalize skills to lowercase
-    u_skills = set(s.lower().strip() for s in user_skills)
-    p_skills = set(s.lower().strip() for s in project_skills)
-    
-    intersection = u_skills.intersection(p_skills)
-    union = u_skills.union(p_skills)
-    
-    if not union:
-        return 0.0
-        
-    return len(intersection) / len(union)
+    # Compared by canonical name: request-supplied skills are never interned
+    registry = get_skill_registry()
+    return jaccard(
+        {registry.canonical(s) for s in user_skills if s and s.strip()},
+        {registry.canonical(s) for s in project_skills if s and s.strip()},
+    )
+
 
-def rank_projects(user_skills: list[str], projects: list[dict]) -> list[dict]:
+def _semantic_scores(user_skills: list[str], projects: list[dict]) -> dict[int, float]:
+    """
+    Cosine similarity of the user's skills against every project, computed as
+    one matrix-vector product over the memory-mapped embedding index.
+    """
+    index = get_embedding_index()
+    # Backfill projects created before the index existed (embedded only once)
+    index.add_many(projects)
+    return index.scores(user_skills)
+
+
+def _lsh_candidates(user_skills: list[str], projects: list[dict]) -> list[dict]:
+    """
+    Candidate-generation stage: only projects whose MinHash signature collides
+    with the user's skills in at least one LSH band are scored exactly.
+    """
+    index = get_lsh_index()
+    for project in projects:
+        if project.get("id") not in index:
+            index.add(project["id"], project.get("skills_required", []))
+
+    candidate_ids = index.candidates(user_skills)
+    return [p for p in projects if p.get("id") in candidate_ids]
+
+
+def rank_projects(user_skills: list[str], projects: list[dict], mode: str = "jaccard") -> list[dict]:
     """
     Rank projects based on skill match score.
     Returns projects with their match score attached.
     """
+    if mode not in MATCH_MODES:
+        raise ValueError(f"Unknown match mode: {mode}")
+
     ranked = []
+    semantic = _semantic_scores(user_skills, projects) if mode == "semantic" else None
+    if mode == "lsh":
+        projects = _lsh_candidates(user_skills, projects)
+    # Intern the catalogue before resolving the request's skills, so a skill
+    # this worker has not stored yet is not mistaken for an unknown one
+    project_sets = [skill_ids(p.get("skills_required", [])) for p in projects] if semantic is None else None
+    user_ids = query_skill_ids(user_skills)
     
-    for project in projects:
-        score = calculate_match_score(user_skills, project.get("skills_required", []))
+    for i, project in enumerate(projects):
+        if semantic is not None:
+            score = semantic.get(project.get("id"), 0.0)
+            if score < SEMANTIC_MIN_SCORE:
+                continue
+        else:
+            score = jaccard(user_ids, project_sets[i])
         if score > 0:
             # Create a copy to avoid mutating original
             p_with_score = project.copy()
@@ -42,3 +96,88 @@ def rank_projects(user_skills: list[str], projects: list[dict]) -> list[dict]:
     ranked.sort(key=lambda x: x["match_score"], reverse=True)
     
     return ranked
+
+
+def index_project(project: dict, projects_version: str | None = None):
+    """
+    Index a newly created project for matching.
+    Its MinHash signature is always computed here; its embedding only when
+    semantic matching is the default mode. Cached recommendations are only
+    updated for users sharing at least one skill with the project.
+    projects_version is the projects.json version the project was written
+    on top of (see get_recommendation_cache).
+    """
+    skills = project.get("skills_required", [])
+    get_lsh_index().add(project["id"], skills)
+    get_skill_trie(projects_base=projects_version).add_project(project["id"], skills)
+    get_recommendation_cache(projects_version).add_project(project, get_user_index().candidates(skills))
+    if get_settings().ai_matching_mode == "semantic":
+        get_embedding_index().add(project)
+
+
+def index_user(user: dict, users_version: str | None = None):
+    """
+    Refresh a user's entry in the skill index after a profile update, and
+    recompute that user's cached recommendations if they were materialized.
+    users_version is the users.json version the update was written on top of
+    (see get_user_index).
+    """
+    get_user_index(users_version).update(user)
+    get_skill_trie(users_base=users_version).set_user_skills(user["id"], user.get("skills") or [])
+    cache = get_recommendation_cache()
+    if cache.is_materialized(user["id"]):
+        cache.refresh_user(user["id"], user.get("skills") or [], get_all_projects())
+
+
+def cached_recommendations(user_id: str, skills: list[str]) -> list[dict] | None:
+    """
+    Top-k Jaccard matches for a known user from the recommendation cache.
+    Materializes the user on first use; returns None when the requested
+    skills are not the user's stored skills (the caller ranks normally).
+    """
+    cache = get_recommendation_cache()
+    cached = cache.get(user_id, skills)
+    if cached is not None:
+        return cached
+
+    index = get_user_index()
+    if user_id not in index.skills:
+        return None
+    cache.refresh_user(user_id, index.skills[user_id], get_all_projects())
+    return cache.get(user_id, skills)
+
+
+def rank_candidates(project: dict, mode: str = "jaccard", limit: int = 10) -> list[dict]:
+    """
+    Rank students for a project by how well their skills fit skills_required.
+    Uses the same scores as rank_projects. For 'jaccard' and 'lsh' the skill
+    inverted index already yields exactly the users with a non-zero score.
+    """
+    if mode not in MATCH_MODES:
+        raise ValueError(f"Unknown match mode: {mode}")
+
+    index = get_user_index()
+    project_skills = project.get("skills_required", [])
+    scored: list[tuple[float, str]] = []
+
+    if mode == "semantic":
+        user_ids, vectors = index.vectors(get_encoder())
+        if vectors is not None:
+            query = get_encoder().encode([skills_text(project_skills)])[0]
+            similarities = (vectors @ query).tolist()
+            scored = [(score, uid) for uid, score in zip(user_ids, similarities) if score >= SEMANTIC_MIN_SCORE]
+    else:
+        project_ids = query_skill_ids(project_skills)
+        for user_id in index.candidates(project_skills):
+            score = jaccard(index.skill_ids[user_id], project_ids)
+            if score > 0:
+                scored.append((score, user_id))
+
+    return [
+        {
+            **index.profiles[user_id],
+            "skills": index.skills[user_id],
+            "match_score": round(score * 100, 1),  # Convert to percentage
+        }
+        for score, user_id in heapq.nlargest(limit, scored)
+    ]
@@ -2,9 +2,16 @@
 CampusNexus - Algorand Service
 Handles all Algorand blockchain interactions
 """
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+import httpx
 from algosdk.v2client import algod, indexer
 from algosdk import transaction, encoding
 from app.config import get_settings
+from app.services.account_cache import get_account_cache
+from app.services.node_pool import NodePool
+from app.services.signatures import get_signature_verifier
 
 settings = get_settings()
 
@@ -14,43 +21,151 @@ CONTRACT_IDS = {
     "HUSTLE_SCORE": 755290900,
 }
 
+# Approximate block time, for estimating how far the chain has moved
+ROUND_SECONDS = 2.8
+
+
+class AlgorandClients:
+    """
+    Long-lived keep-alive async HTTP clients for the algod and indexer REST
+    APIs, so chain lookups never block the event loop or reconnect per call.
+    Each API is a NodePool over one or more equivalent nodes.
+    """
+
+    def __init__(self, algod_addresses: List[str], indexer_addresses: List[str]):
+        limits = httpx.Limits(
+            max_connections=settings.algorand_pool_size,
+            max_keepalive_connections=settings.algorand_keepalive_connections,
+        )
+        timeout = httpx.Timeout(settings.algorand_request_timeout, connect=settings.algorand_connect_timeout)
+
+        def pool(clients: List[httpx.AsyncClient]) -> NodePool:
+            return NodePool(
+                clients,
+                min_hedge_delay=settings.algorand_hedge_min_delay_ms / 1000,
+                failure_threshold=settings.algorand_breaker_failures,
+                cooldown=settings.algorand_breaker_cooldown_seconds,
+            )
+
+        if settings.algorand_fake_node:
+            self.algod, self.indexer = (pool([client]) for client in _fake_node_clients(timeout))
+            return
+
+        self.algod = pool([httpx.AsyncClient(base_url=a, limits=limits, timeout=timeout) for a in algod_addresses])
+        self.indexer = pool([httpx.AsyncClient(base_url=a, limits=limits, timeout=timeout) for a in indexer_addresses])
+
+    def stats(self) -> dict:
+        return {"algod": self.algod.stats(), "indexer": self.indexer.stats()}
+
+    async def close(self):
+        await self.algod.close()
+        await self.indexer.close()
+
+
+def _fake_node_clients(timeout: httpx.Timeout) -> Tuple[httpx.AsyncClient, httpx.AsyncClient]:
+    """In-process algod and indexer stand-ins (ALGORAND_FAKE_NODE), reached without any socket."""
+    from app.services.fake_algod import FakeChain, create_fake_algod, create_fake_indexer
+
+    chain = FakeChain(CONTRACT_IDS.values())
+    faults = dict(
+        latency_ms=settings.algorand_fake_latency_ms,
+        jitter_ms=settings.algorand_fake_jitter_ms,
+        failure_rate=settings.algorand_fake_failure_rate,
+        chain=chain,
+    )
+    return (
+        httpx.AsyncClient(base_url="http://fake-algod", transport=httpx.ASGITransport(app=create_fake_algod(**faults)), timeout=timeout),
+        httpx.AsyncClient(base_url="http://fake-indexer", transport=httpx.ASGITransport(app=create_fake_indexer(**faults)), timeout=timeout),
+    )
+
+
+_clients: Optional[AlgorandClients] = None
+
+
+def init_algorand_clients() -> AlgorandClients:
+    """Open the shared node clients (called on application start-up)."""
+    global _clients
+    if _clients is None:
+        _clients = AlgorandClients(settings.algod_addresses, settings.indexer_addresses)
+    return _clients
+
 
+def get_algorand_clients() -> AlgorandClients:
+    """Get the shared node clients, opening them if start-up has not run (e.g. scripts)."""
+    return _clients or init_algorand_clients()
+
+
+async def close_algorand_clients():
+    """Close the shared node clients (called on application shutdown)."""
+    global _clients
+    if _clients is not None:
+        await _clients.close()
+        _clients = None
+
+
+async def algod_get(path: str, **params) -> dict:
+    """GET an algod REST endpoint and return its JSON body."""
+    response = await get_algorand_clients().algod.get(path, params=params or None)
+    response.raise_for_status()
+    return response.json()
+
+
+async def algod_post(path: str, content: bytes, content_type: str = "application/msgpack") -> dict:
+    """POST a raw body to an algod REST endpoint and return its JSON body."""
+    response = await get_algorand_clients().algod.post(path, content=content, headers={"Content-Type": content_type})
+    response.raise_for_status()
+    return response.json()
+
+
+async def indexer_get(path: str, **params) -> dict:
+    """GET an indexer REST endpoint and return its JSON body."""
+    response = await get_algorand_clients().indexer.get(path, params=params or None)
+    response.raise_for_status()
+    return response.json()
+
+
+@lru_cache
 def get_algod_client() -> algod.AlgodClient:
-    """Get Algorand Algod client."""
-    return algod.AlgodClient("", settings.algorand_algod_address)
+    """Get the algosdk Algod client (synchronous; used for transaction encoding helpers)."""
+    return algod.AlgodClient("", settings.algod_addresses[0])
 
 
+@lru_cache
 def get_indexer_client() -> indexer.IndexerClient:
     """Get Algorand Indexer client."""
-    return indexer.IndexerClient("", settings.algorand_indexer_address)
+    return indexer.IndexerClient("", settings.indexer_addresses[0])
 
 
-def verify_wallet_signature(address: str, message: str, signature: str) -> bool:
+@lru_cache(maxsize=4096)
+def is_valid_address(address: str) -> bool:
+    """
+    Offline format and checksum check of an Algorand address.
+    Results (including rejections) are memoized, so repeated bad logins cost a dict lookup.
+    """
+    return encoding.is_valid_address(address)
+
+
+async def verify_wallet_signature(address: str, message: str, signature: str) -> bool:
     """
     Verify a message was signed by the given wallet address.
-    Used for wallet-based authentication.
+    Used for wallet-based authentication; runs on the batched verifier pool.
     """
+    return await get_signature_verifier().verify(address, message, signature)
+
+
+async def _fetch_account_info(address: str) -> dict:
+    return await algod_get(f"/v2/accounts/{address}")
+
+
+async def get_account_info(address: str) -> dict:
+    """Get account information from Algorand (cached briefly, concurrent lookups shared)."""
     try:
-        message_bytes = message.encode("utf-8")
-        signature_bytes = encoding.base64.b64decode(signature)
-        public_key = encoding.decode_address(address)
-        
-        # Verify the signature
-        return encoding.verify_bytes(message_bytes, signature_bytes, public_key)
-    except Exception:
-        return False
-
-
-def get_account_info(address: str) -> dict:
-    """Get account information from Algorand."""
-    client = get_algod_client()
-    try:
-        return client.account_info(address)
+        return await get_account_cache().get(address, _fetch_account_info)
     except Exception as e:
         return {"error": str(e)}
 
 
-def get_account_balance(address: str) -> int:
+async def get_account_balance(address: str) -> int:
     """Get account ALGO balance in microAlgos."""
-    info = get_account_info(address)
+    info = await get_account_info(address)
     return info.get("amount", 0)
@@ -0,0 +1,90 @@
+"""
+CampusNexus - Access Token Verification
+FastAPI dependencies that authenticate requests from the JWT bearer token
+issued at wallet or OAuth login. Decoded claims are cached per token, so
+a repeat request skips signature verification and JSON decoding.
+"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from fastapi import Depends, HTTPException
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from jose import JWTError, jwt
+
+from app.config import get_settings
+from app.models.user import User
+from app.utils.database import find_user_by_id
+
+bearer_scheme = HTTPBearer(auto_error=False)
+
+
+class TokenCache:
+    """Bounded LRU of token digest -> (claims, exp); entries are never served past exp."""
+
+    def __init__(self, max_entries: int = 10_000):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[bytes, Tuple[Dict, float]]" = OrderedDict()
+
+    def get(self, key: bytes) -> Optional[Dict]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            claims, expires_at = entry
+            if time.time() >= expires_at:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return claims
+
+    def put(self, key: bytes, claims: Dict):
+        with self._lock:
+            self._entries[key] = (claims, claims.get("exp", 0))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+_token_cache = TokenCache(get_settings().auth_token_cache_size)
+
+
+def decode_access_token(token: str) -> Dict:
+    """Verified claims of an access token; raises 401 if it is invalid or expired."""
+    # Keyed by digest so the cache never holds usable tokens
+    key = hashlib.sha256(token.encode()).digest()
+    claims = _token_cache.get(key)
+    if claims is not None:
+        return claims
+
+    settings = get_settings()
+    try:
+        claims = jwt.decode(token, settings.jwt_secret_key, algorithms=[settings.jwt_algorithm])
+    except JWTError:
+        raise HTTPException(status_code=401, detail="Invalid or expired token")
+    if not claims.get("sub") or "exp" not in claims:
+        raise HTTPException(status_code=401, detail="Invalid or expired token")
+
+    _token_cache.put(key, claims)
+    return claims
+
+
+async def get_token_claims(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(bearer_scheme),
+) -> Dict:
+    """Dependency: claims of the request's bearer token."""
+    if credentials is None:
+        raise HTTPException(status_code=401, detail="Not authenticated", headers={"WWW-Authenticate": "Bearer"})
+    return decode_access_token(credentials.credentials)
+
+
+async def get_current_user(claims: Dict = Depends(get_token_claims)) -> User:
+    """Dependency: the user the bearer token was issued to."""
+    # Wallet users are stored with their address as id, so 'sub' is always a user id
+    user = find_user_by_id(claims["sub"])
+    if not user:
+        raise HTTPException(status_code=401, detail="User not found")
+    return user
@@ -0,0 +1,128 @@
+"""
+CampusNexus - Batch Matching Service
+Scores many skill sets against the project catalogue in one matrix operation.
+Used by the weekly digest job through POST /api/ai/match/batch.
+"""
+from typing import Dict, List
+
+import numpy as np
+
+from app.services.ai_matching import MATCH_MODES, SEMANTIC_MIN_SCORE
+from app.services.embeddings import get_embedding_index, get_encoder, skills_text
+from app.services.skills import SkillIds, query_skill_ids, skill_ids
+
+# Users scored per matrix multiplication (bounds the dense score block in memory)
+CHUNK_SIZE = 256
+
+
+def _incidence(skill_sets: List[SkillIds], vocab: Dict[int, int]) -> np.ndarray:
+    """Binary skill matrix with one row per skill set and one column per known skill."""
+    matrix = np.zeros((len(skill_sets), len(vocab)), dtype=np.float32)
+    for row, skills in enumerate(skill_sets):
+        cols = [vocab[s] for s in skills if s in vocab]
+        matrix[row, cols] = 1.0
+    return matrix
+
+
+def _top_k(scores: np.ndarray, k: int, min_score: float) -> List[List[tuple[int, float]]]:
+    """Per-row (column, score) pairs of the k best scores at or above min_score."""
+    k = min(k, scores.shape[1])
+    if k == 0:
+        return [[] for _ in range(scores.shape[0])]
+    top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    results = []
+    for row, cols in enumerate(top):
+        pairs = [(int(c), float(scores[row, c])) for c in cols if scores[row, c] >= min_score]
+        pairs.sort(key=lambda x: x[1], reverse=True)
+        results.append(pairs)
+    return results
+
+
+def build_catalogue(projects: List[Dict]) -> tuple[Dict[int, int], np.ndarray, np.ndarray]:
+    """Skill-id -> column vocabulary, project incidence matrix and project skill counts."""
+    project_sets = [skill_ids(p.get("skills_required", [])) for p in projects]
+    # Compact column per skill id that appears in the catalogue
+    vocab = {skill: col for col, skill in enumerate(sorted(set().union(*project_sets)))}
+    project_sizes = np.array([len(s) for s in project_sets], dtype=np.float32)
+    return vocab, _incidence(project_sets, vocab), project_sizes
+
+
+def encode_users(skill_sets: List[List[str]], vocab: Dict[int, int]) -> tuple[np.ndarray, np.ndarray]:
+    """User incidence matrix over the catalogue vocabulary, plus full skill counts for the union."""
+    user_sets = [query_skill_ids(skills) for skills in skill_sets]
+    user_sizes = np.array([len(s) for s in user_sets], dtype=np.float32)
+    return _incidence(user_sets, vocab), user_sizes
+
+
+def chunk_bounds(count: int) -> List[tuple[int, int]]:
+    return [(start, start + CHUNK_SIZE) for start in range(0, count, CHUNK_SIZE)]
+
+
+def attach_scores(projects: List[Dict], chunk_results: List[List[List[tuple[int, float]]]]) -> List[List[Dict]]:
+    """Turn per-chunk (column, score) pairs back into ranked project copies."""
+    results = []
+    for chunk in chunk_results:
+        for pairs in chunk:
+            ranked = []
+            for col, score in pairs:
+                p_with_score = projects[col].copy()
+                p_with_score["match_score"] = round(score * 100, 1)  # Convert to percentage
+                ranked.append(p_with_score)
+            results.append(ranked)
+    return results
+
+
+def jaccard_chunk(
+    user_matrix: np.ndarray,
+    user_sizes: np.ndarray,
+    project_matrix: np.ndarray,
+    project_sizes: np.ndarray,
+    k: int,
+) -> List[List[tuple[int, float]]]:
+    """Jaccard of every user against every project: |A∩B| / (|A| + |B| - |A∩B|)."""
+    intersection = user_matrix @ project_matrix.T
+    union = user_sizes[:, None] + project_sizes[None, :] - intersection
+    scores = np.divide(intersection, union, out=np.zeros_like(intersection), where=union > 0)
+    # Jaccard is only reported when above zero, like calculate_match_score
+    return _top_k(scores, k, 1e-9)
+
+
+def cosine_chunk(query_matrix: np.ndarray, project_matrix: np.ndarray, k: int) -> List[List[tuple[int, float]]]:
+    return _top_k(query_matrix @ project_matrix.T, k, SEMANTIC_MIN_SCORE)
+
+
+def rank_projects_batch(
+    skill_sets: List[List[str]],
+    projects: List[Dict],
+    mode: str = "jaccard",
+    k: int = 10,
+) -> List[List[Dict]]:
+    """
+    Rank projects for many users at once, in this process.
+    The catalogue is loaded and encoded a single time; users are scored in
+    chunks of CHUNK_SIZE. 'lsh' falls back to exact Jaccard since the matrix
+    path already scores every project in one operation. See matching_pool
+    for the multi-core variant.
+    """
+    if mode not in MATCH_MODES:
+        raise ValueError(f"Unknown match mode: {mode}")
+    if not projects or not skill_sets:
+        return [[] for _ in skill_sets]
+
+    chunks = chunk_bounds(len(skill_sets))
+
+    if mode == "semantic":
+        index = get_embedding_index()
+        index.add_many(projects)
+        project_matrix = index.vectors_for([p["id"] for p in projects])
+        query_matrix = get_encoder().encode([skills_text(skills) for skills in skill_sets])
+        chunk_results = [cosine_chunk(query_matrix[a:b], project_matrix, k) for a, b in chunks]
+    else:
+        vocab, project_matrix, project_sizes = build_catalogue(projects)
+        user_matrix, user_sizes = encode_users(skill_sets, vocab)
+        chunk_results = [
+            jaccard_chunk(user_matrix[a:b], user_sizes[a:b], project_matrix, project_sizes, k)
+            for a, b in chunks
+        ]
+
+    return attach_scores(projects, chunk_results)
@@ -0,0 +1,263 @@
+"""
+CampusNexus - On-Chain State Sync
+Background worker that follows our deployed contracts through the indexer
+and mirrors their activity into a local store: escrow status per
+MilestoneEscrow app and HustleScore reputation events and totals. API
+reads use the store and never wait on the chain. A persisted cursor means
+a restart resumes where the last run stopped.
+
+With several uvicorn workers only one of them (the holder of
+chain_state.leader) runs the sync; the others reload the mirror file when
+it changes.
+"""
+import asyncio
+import json
+import logging
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from app.config import get_settings
+from app.services.algorand import CONTRACT_IDS, indexer_get
+from app.services.contract_specs import decode_method_call
+from app.utils.file_lock import atomic_write_text, file_lock, try_hold_lock
+
+logger = logging.getLogger(__name__)
+
+# Chain mirror file path
+CHAIN_DB_FILE = Path(__file__).parent.parent.parent / "data" / "chain_state.json"
+
+
+class ChainStore:
+    """
+    JSON-backed mirror of contract state.
+    cursors[app_id] = {"round": last round processed, "txids": ids already applied at that round}
+    """
+
+    def __init__(self, path: Path = CHAIN_DB_FILE):
+        self.path = path
+        self._load(self._file_version())
+
+    def _file_version(self):
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def refresh(self):
+        """Reload the mirror if another process has written it since we last read or wrote it."""
+        version = self._file_version()
+        if version != self._version:
+            self._load(version)
+
+    def _load(self, version):
+        data = json.loads(self.path.read_text()) if version else {}
+        self.cursors: Dict[str, Dict] = data.get("cursors", {})
+        self.escrows: Dict[str, Dict] = data.get("escrows", {})
+        self.reputation_events: List[Dict] = data.get("reputation_events", [])
+        self.reputation: Dict[str, int] = data.get("reputation", {})
+        self._version = version
+
+    def save(self):
+        """Write atomically under a file lock, so a crash or a concurrent writer never leaves a broken file."""
+        with file_lock(self.path.with_suffix(".lock")):
+            atomic_write_text(self.path, json.dumps({
+                "cursors": self.cursors,
+                "escrows": self.escrows,
+                "reputation_events": self.reputation_events,
+                "reputation": self.reputation,
+            }, indent=2))
+            self._version = self._file_version()
+
+    def cursor(self, app_id: int) -> Dict:
+        return self.cursors.setdefault(str(app_id), {"round": 0, "txids": []})
+
+    # ----- Transaction handlers -----
+
+    def apply_escrow_call(self, app_id: int, txn: Dict, method: str, args: List):
+        key = str(app_id)
+        escrow = self.escrows.get(key)
+        round_number = txn["confirmed-round"]
+
+        if method == "create_escrow":
+            freelancer, total = args
+            self.escrows[key] = {
+                "app_id": app_id,
+                "client_address": txn["sender"],
+                "freelancer_address": freelancer,
+                "total_amount": total,
+                "released_amount": 0,
+                "funded": False,
+                "status": "active",
+                "created_round": round_number,
+                "updated_round": round_number,
+            }
+            return
+        if escrow is None:
+            return  # Call on an escrow created before this app was tracked
+
+        if method == "fund_escrow":
+            escrow["funded"] = True
+        elif method == "release_payment":
+            escrow["released_amount"] += args[0]
+            if escrow["released_amount"] >= escrow["total_amount"]:
+                escrow["status"] = "completed"
+        elif method == "cancel_escrow":
+            escrow["status"] = "cancelled"
+        escrow["updated_round"] = round_number
+
+    def apply_reputation_call(self, app_id: int, txn: Dict, method: str, args: List):
+        if method not in ("add_reputation", "remove_reputation"):
+            return
+        student, points = args
+        delta = points if method == "add_reputation" else -points
+        self.reputation_events.append({
+            "txid": txn["id"],
+            "round": txn["confirmed-round"],
+            "student": student,
+            "points": delta,
+        })
+        self.reputation[student] = self.reputation.get(student, 0) + delta
+
+
+def app_calls(txn: Dict, app_id: int) -> Iterator[Dict]:
+    """
+    Calls to app_id within one indexer transaction: the root and/or inner
+    transactions at any depth. The indexer's application-id search also
+    returns roots that only touched the app through an inner call, so every
+    call is checked. Inner calls get the root's round and a derived id.
+    """
+    stack = [(txn, txn["id"])]
+    while stack:
+        current, txn_id = stack.pop()
+        call = current.get("application-transaction") or {}
+        if call.get("application-id") == app_id:
+            yield {**current, "id": txn_id, "confirmed-round": txn["confirmed-round"]}
+        inner = current.get("inner-txns") or []
+        # Reversed so calls come off the stack in execution order
+        for index in reversed(range(len(inner))):
+            stack.append((inner[index], f"{txn_id}/inner/{index}"))
+
+
+class ChainSync:
+    """Pages through each app's transactions from its cursor and applies them to the store."""
+
+    def __init__(self, store: ChainStore, page_size: int = 1000):
+        self.store = store
+        self.page_size = page_size
+        self.apps = {
+            CONTRACT_IDS["MILESTONE_ESCROW"]: ("MILESTONE_ESCROW", store.apply_escrow_call),
+            CONTRACT_IDS["HUSTLE_SCORE"]: ("HUSTLE_SCORE", store.apply_reputation_call),
+        }
+        self.last_error: Optional[str] = None
+
+    async def sync_app(self, app_id: int) -> int:
+        """Apply every new transaction of one app; returns how many were applied."""
+        contract, handler = self.apps[app_id]
+        cursor = self.store.cursor(app_id)
+        applied = 0
+        next_token = None
+        start_round = cursor["round"]
+
+        while True:
+            params = {"application-id": app_id, "limit": self.page_size}
+            if start_round:
+                # The cursor round is scanned again; txids already applied there are skipped
+                params["min-round"] = start_round
+            if next_token:
+                params["next"] = next_token
+            page = await indexer_get("/v2/transactions", **params)
+
+            seen = set(cursor["txids"])
+            for txn in page.get("transactions", []):
+                if txn["id"] in seen:
+                    continue
+                for call_txn in app_calls(txn, app_id):
+                    call = call_txn["application-transaction"]
+                    decoded = decode_method_call(contract, call.get("application-args", []))
+                    if decoded:
+                        handler(app_id, call_txn, *decoded)
+                        applied += 1
+
+                round_number = txn["confirmed-round"]
+                if round_number != cursor["round"]:
+                    cursor["round"] = round_number
+                    cursor["txids"] = []
+                    seen = set()
+                cursor["txids"].append(txn["id"])
+                seen.add(txn["id"])
+
+            # Persist per page, so a restart loses at most the page in flight
+            await asyncio.to_thread(self.store.save)
+            next_token = page.get("next-token")
+            if not next_token or len(page.get("transactions", [])) < self.page_size:
+                return applied
+
+    async def sync_once(self) -> int:
+        applied = 0
+        for app_id in self.apps:
+            applied += await self.sync_app(app_id)
+        return applied
+
+    async def run(self, interval: float):
+        """Sync forever; failures are logged and retried on the next tick."""
+        while True:
+            try:
+                applied = await self.sync_once()
+                self.last_error = None
+                if applied:
+                    logger.info("Chain sync applied %d transactions", applied)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.last_error = str(e)
+                logger.warning("Chain sync failed: %s", e)
+            await asyncio.sleep(interval)
+
+
+_sync: Optional[ChainSync] = None
+_task: Optional[asyncio.Task] = None
+# Open lock file while this process is the sync leader
+_leader_lock = None
+
+
+def get_chain_store() -> ChainStore:
+    """Get the process-wide chain mirror (reloaded if the sync leader has written it)."""
+    store = get_chain_sync().store
+    store.refresh()
+    return store
+
+
+def get_chain_sync() -> ChainSync:
+    global _sync
+    if _sync is None:
+        _sync = ChainSync(ChainStore(), get_settings().chain_sync_page_size)
+    return _sync
+
+
+def start_chain_sync():
+    """Start the background sync task (called on application start-up)."""
+    global _task, _leader_lock
+    settings = get_settings()
+    if not settings.chain_sync_enabled or _task is not None:
+        return
+    _leader_lock = try_hold_lock(CHAIN_DB_FILE.with_suffix(".leader"))
+    if _leader_lock is None:
+        logger.info("Chain sync runs in another worker; serving its mirror file")
+        return
+    _task = asyncio.create_task(get_chain_sync().run(settings.chain_sync_interval_seconds))
+
+
+async def stop_chain_sync():
+    """Cancel the background sync task (called on application shutdown)."""
+    global _task, _leader_lock
+    if _task is not None:
+        _task.cancel()
+        try:
+            await _task
+        except asyncio.CancelledError:
+            pass
+        _task = None
+    if _leader_lock is not None:
+        _leader_lock.close()
+        _leader_lock = None
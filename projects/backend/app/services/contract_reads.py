@@ -0,0 +1,179 @@
+"""
+CampusNexus - Batched Contract Reads
+Runs many readonly ABI calls (get_info, get_total_minted, ...) through
+algod's simulate endpoint, up to 16 per transaction group, so reading N
+contracts costs about N/16 round trips. Results are cached for the round
+they were read at.
+"""
+import asyncio
+import base64
+import time
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from algosdk import encoding, transaction
+from algosdk.atomic_transaction_composer import AtomicTransactionComposer, EmptySigner
+from algosdk.v2client import models
+
+from app.config import get_settings
+from app.services.algorand import CONTRACT_IDS, ROUND_SECONDS, algod_post
+from app.services.contract_specs import decode_return, get_contract
+from app.services.escrow_txns import get_params_cache
+
+# Protocol maximum transactions per group
+MAX_GROUP_SIZE = 16
+
+ESCROW_STATUS = {0: "inactive", 1: "active", 2: "completed", 3: "cancelled"}
+
+
+class ReadCall(NamedTuple):
+    """One readonly method call; `contract` is a CONTRACT_IDS key naming the ABI."""
+    app_id: int
+    contract: str
+    method: str
+    args: Tuple = ()
+
+
+class ContractReadError(Exception):
+    """A readonly call failed in simulation (e.g. the app does not exist)."""
+
+
+class ContractReader:
+    """Simulate-backed batch reader with a per-round result cache."""
+
+    def __init__(self, sender: str):
+        self.sender = sender
+        self._cache: Dict[ReadCall, Tuple[float, int, Any]] = {}
+        self.last_round = 0
+        self.hits = 0
+        self.simulations = 0
+
+    def _cached(self, call: ReadCall) -> Optional[Tuple[int, Any]]:
+        entry = self._cache.get(call)
+        if entry is None:
+            return None
+        fetched_at, round_number, value = entry
+        # Valid until the chain has (by estimate) moved past the round it was read at
+        if time.monotonic() - fetched_at >= ROUND_SECONDS or round_number < self.last_round:
+            del self._cache[call]
+            return None
+        return round_number, value
+
+    def _build_group(self, calls: List[ReadCall], params: transaction.SuggestedParams) -> bytes:
+        atc = AtomicTransactionComposer()
+        for call in calls:
+            atc.add_method_call(
+                app_id=call.app_id,
+                method=get_contract(call.contract).get_method_by_name(call.method),
+                sender=self.sender,
+                sp=params,
+                signer=EmptySigner(),
+                method_args=list(call.args),
+            )
+        signed = [transaction.SignedTransaction(tws.txn, None) for tws in atc.build_group()]
+        request = models.SimulateRequest(
+            txn_groups=[models.SimulateRequestTransactionGroup(txns=signed)],
+            allow_empty_signatures=True,
+            allow_unnamed_resources=True,
+        )
+        return base64.b64decode(encoding.msgpack_encode(request))
+
+    async def _simulate(self, calls: List[ReadCall]) -> Dict[ReadCall, Any]:
+        """Read one group; a call that fails is reported and the rest are re-simulated without it."""
+        results: Dict[ReadCall, Any] = {}
+        # Real params: simulate still checks validity windows and fees (paid by the sender)
+        params = await get_params_cache().get()
+        while calls:
+            self.simulations += 1
+            response = await algod_post("/v2/transactions/simulate", self._build_group(calls, params))
+            round_number = response.get("last-round", 0)
+            self.last_round = max(self.last_round, round_number)
+            group = response["txn-groups"][0]
+
+            failed_at = group.get("failed-at")
+            if failed_at:
+                bad = failed_at[0]
+                results[calls[bad]] = ContractReadError(group.get("failure-message", "simulation failed"))
+                calls = calls[:bad] + calls[bad + 1:]
+                continue
+
+            now = time.monotonic()
+            for call, txn_result in zip(calls, group["txn-results"]):
+                method = get_contract(call.contract).get_method_by_name(call.method)
+                logs = txn_result["txn-result"].get("logs", [])
+                try:
+                    value = decode_return(method, base64.b64decode(logs[-1]))
+                except (IndexError, ValueError) as e:
+                    results[call] = ContractReadError(f"{call.method}: {e}")
+                    continue
+                results[call] = value
+                self._cache[call] = (now, round_number, value)
+            return results
+        return results
+
+    async def read(self, calls: List[ReadCall]) -> List[Any]:
+        """
+        Values of `calls` in order. A failed call yields a ContractReadError
+        instance in its slot instead of raising, so one bad app does not
+        sink the batch.
+        """
+        values: Dict[ReadCall, Any] = {}
+        misses: List[ReadCall] = []
+        for call in dict.fromkeys(calls):
+            cached = self._cached(call)
+            if cached is not None:
+                self.hits += 1
+                values[call] = cached[1]
+            else:
+                misses.append(call)
+
+        groups = [misses[i:i + MAX_GROUP_SIZE] for i in range(0, len(misses), MAX_GROUP_SIZE)]
+        for group_results in await asyncio.gather(*[self._simulate(group) for group in groups]):
+            values.update(group_results)
+        return [values[call] for call in calls]
+
+    def stats(self) -> dict:
+        return {"entries": len(self._cache), "hits": self.hits, "simulations": self.simulations, "last_round": self.last_round}
+
+
+_reader: Optional[ContractReader] = None
+
+
+def get_contract_reader() -> ContractReader:
+    """Get the process-wide contract reader."""
+    global _reader
+    if _reader is None:
+        _reader = ContractReader(get_settings().algorand_readonly_sender)
+    return _reader
+
+
+async def read_escrow_infos(app_ids: List[int]) -> Dict[int, Any]:
+    """MilestoneEscrow get_info for many apps: app id -> state dict or ContractReadError."""
+    values = await get_contract_reader().read([ReadCall(a, "MILESTONE_ESCROW", "get_info") for a in app_ids])
+    infos: Dict[int, Any] = {}
+    for app_id, value in zip(app_ids, values):
+        if isinstance(value, ContractReadError):
+            infos[app_id] = value
+            continue
+        client, freelancer, total, released, status = value
+        infos[app_id] = {
+            "app_id": app_id,
+            "client_address": client,
+            "freelancer_address": freelancer,
+            "total_amount": total,
+            "released_amount": released,
+            "status": ESCROW_STATUS.get(status, "unknown"),
+        }
+    return infos
+
+
+async def read_hustle_score_summary() -> Dict[str, Any]:
+    """HustleScore admin and total minted, in one simulate call."""
+    app_id = CONTRACT_IDS["HUSTLE_SCORE"]
+    total, admin = await get_contract_reader().read([
+        ReadCall(app_id, "HUSTLE_SCORE", "get_total_minted"),
+        ReadCall(app_id, "HUSTLE_SCORE", "get_admin"),
+    ])
+    for value in (total, admin):
+        if isinstance(value, ContractReadError):
+            raise value
+    return {"app_id": app_id, "total_minted": total, "admin": admin}
@@ -0,0 +1,63 @@
+"""
+CampusNexus - Contract ABI Specs
+Loads the ABI of our deployed contracts from the ARC-56 app specs
+generated in projects/contracts, and decodes ABI method calls.
+"""
+import base64
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from algosdk import abi
+
+from app.config import get_settings
+
+# Generated artifacts of projects/contracts
+DEFAULT_ARTIFACTS_DIR = Path(__file__).parent.parent.parent.parent / "contracts" / "smart_contracts" / "artifacts"
+
+# CONTRACT_IDS key -> (artifact directory, contract name)
+CONTRACT_SPECS = {
+    "MILESTONE_ESCROW": ("escrow", "MilestoneEscrow"),
+    "HUSTLE_SCORE": ("hustle_score", "HustleScore"),
+}
+
+# ARC-4 prefix of a method's logged return value
+RETURN_PREFIX = bytes.fromhex("151f7c75")
+
+
+@lru_cache
+def get_contract(key: str) -> abi.Contract:
+    """ABI of one of our contracts, read once from its ARC-56 spec."""
+    directory, name = CONTRACT_SPECS[key]
+    artifacts = Path(get_settings().algorand_artifacts_dir or DEFAULT_ARTIFACTS_DIR)
+    return abi.Contract.from_json((artifacts / directory / f"{name}.arc56.json").read_text())
+
+
+@lru_cache
+def _selectors(key: str) -> Dict[bytes, abi.Method]:
+    return {method.get_selector(): method for method in get_contract(key).methods}
+
+
+def decode_method_call(key: str, app_args: List[str]) -> Optional[Tuple[str, List]]:
+    """
+    (method name, decoded arguments) of an application call's base64 args,
+    or None if they do not start with one of the contract's selectors.
+    """
+    if not app_args:
+        return None
+    method = _selectors(key).get(base64.b64decode(app_args[0]))
+    if method is None or len(app_args) - 1 < len(method.args):
+        return None
+    values = [
+        arg.type.decode(base64.b64decode(raw))
+        for arg, raw in zip(method.args, app_args[1:])
+        if isinstance(arg.type, abi.ABIType)
+    ]
+    return method.name, values
+
+
+def decode_return(method: abi.Method, log: bytes):
+    """Decode a method's return value from its ARC-4 return log."""
+    if not log.startswith(RETURN_PREFIX):
+        raise ValueError(f"{method.name}: missing ARC-4 return prefix")
+    return method.returns.type.decode(log[len(RETURN_PREFIX):])
@@ -0,0 +1,244 @@
+"""
+CampusNexus - Embedding Service
+Pluggable skill encoders and a memory-mapped project embedding index
+used by the semantic mode of the AI Skill-Matcher.
+"""
+import hashlib
+import json
+import re
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Protocol
+
+import numpy as np
+
+from app.config import get_settings
+from app.utils.file_lock import atomic_write_text, file_lock
+
+
+# Embedding index file paths
+EMBEDDINGS_FILE = Path(__file__).parent.parent.parent / "data" / "project_embeddings.f32"
+EMBEDDINGS_META_FILE = Path(__file__).parent.parent.parent / "data" / "project_embeddings.json"
+
+_TOKEN_RE = re.compile(r"[a-z0-9+#]+")
+
+
+class Encoder(Protocol):
+    """Anything that turns a batch of texts into L2-normalized float32 vectors."""
+    name: str
+    dim: int
+
+    def encode(self, texts: List[str]) -> np.ndarray:
+        ...
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    """L2-normalize rows so a dot product is a cosine similarity."""
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return (vectors / norms).astype(np.float32, copy=False)
+
+
+@lru_cache(maxsize=65536)
+def _gram_slot(gram: str, dim: int) -> tuple[int, float]:
+    """Map an n-gram to a (column, sign) pair using a stable hash."""
+    h = int.from_bytes(hashlib.blake2b(gram.encode("utf-8"), digest_size=8).digest(), "little")
+    return h % dim, 1.0 if h >> 63 else -1.0
+
+
+class HashingEncoder:
+    """
+    Deterministic offline encoder.
+    Hashes character trigrams of every token into a fixed-size signed vector,
+    so 'ReactJS' and 'React' share most of their features. Needs no model
+    download, which makes it the default for tests and local development.
+    """
+
+    def __init__(self, dim: int = 384, ngram: int = 3):
+        self.dim = dim
+        self.ngram = ngram
+        self.name = f"hashing-{dim}-{ngram}"
+
+    def encode(self, texts: List[str]) -> np.ndarray:
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for token in _TOKEN_RE.findall(text.lower()):
+                padded = f"<{token}>"
+                for i in range(max(1, len(padded) - self.ngram + 1)):
+                    col, sign = _gram_slot(padded[i:i + self.ngram], self.dim)
+                    vectors[row, col] += sign
+        return _normalize(vectors)
+
+
+class SentenceTransformerEncoder:
+    """
+    Encoder backed by a sentence-transformers model.
+    The model is loaded lazily on construction, so importing this module
+    never triggers a download.
+    """
+
+    def __init__(self, model_name: str):
+        from sentence_transformers import SentenceTransformer
+
+        self._model = SentenceTransformer(model_name)
+        self.dim = self._model.get_sentence_embedding_dimension()
+        self.name = f"st-{model_name}"
+
+    def encode(self, texts: List[str]) -> np.ndarray:
+        vectors = self._model.encode(texts, batch_size=64, normalize_embeddings=True)
+        return np.asarray(vectors, dtype=np.float32)
+
+
+@lru_cache
+def get_encoder() -> Encoder:
+    """Get the configured skill encoder (cached per process)."""
+    settings = get_settings()
+    if settings.ai_encoder == "sentence-transformers":
+        return SentenceTransformerEncoder(settings.ai_embedding_model)
+    if settings.ai_encoder == "hashing":
+        return HashingEncoder(dim=settings.ai_embedding_dim)
+    raise ValueError(f"Unknown AI encoder: {settings.ai_encoder}")
+
+
+def skills_text(skills: List[str]) -> str:
+    """Text embedded for a user's skill set."""
+    return ", ".join(skills)
+
+
+def project_text(project: Dict) -> str:
+    """Text embedded for a project: its skills followed by its description."""
+    skills = skills_text(project.get("skills_required", []))
+    return f"{skills}. {project.get('description') or ''}"
+
+
+class EmbeddingIndex:
+    """
+    Project embeddings persisted as a raw float32 matrix on disk and read
+    back through np.memmap. Rows are only ever appended, so each project
+    is embedded exactly once; the row order lives in a JSON sidecar.
+    Appends hold a file lock, and every worker reloads the sidecar when
+    another one has changed it, so rows always map to the right project.
+    """
+
+    def __init__(self, encoder: Encoder, path: Path = EMBEDDINGS_FILE, meta_path: Path = EMBEDDINGS_META_FILE):
+        self.encoder = encoder
+        self.path = path
+        self.meta_path = meta_path
+        # Re-entrant: add_many refreshes while holding it
+        self._lock = threading.RLock()
+        self.ids: List[int] = []
+        self._row_of: Dict[int, int] = {}
+        self._vectors: Optional[np.memmap] = None
+        self._meta_version = None
+        with self._lock, file_lock(self._lock_path()):
+            self._load()
+
+    def _lock_path(self) -> Path:
+        return self.path.with_suffix(".lock")
+
+    def _read_meta_version(self):
+        try:
+            stat = self.meta_path.stat()
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _load(self):
+        """Open the on-disk index, discarding it if it was built by another encoder (file lock held)."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        meta = {}
+        if self.meta_path.exists():
+            meta = json.loads(self.meta_path.read_text())
+
+        if meta.get("encoder") != self.encoder.name or not self.path.exists():
+            self.path.write_bytes(b"")
+            self._set_ids([])
+            self._save_meta()
+        else:
+            # Keep only rows recorded in both files (guards against a crash mid-append)
+            row_bytes = self.encoder.dim * 4
+            rows_on_disk = self.path.stat().st_size // row_bytes
+            self._set_ids(meta.get("ids", [])[:rows_on_disk])
+            with open(self.path, "r+b") as f:
+                f.truncate(len(self.ids) * row_bytes)
+            self._meta_version = self._read_meta_version()
+
+    def _set_ids(self, ids: List[int]):
+        self.ids = ids
+        self._row_of = {pid: row for row, pid in enumerate(ids)}
+        self._remap()
+
+    def _refresh(self):
+        """Pick up rows appended by other workers since we last read the sidecar."""
+        version = self._read_meta_version()
+        if version == self._meta_version or version is None:
+            return
+        with self._lock:
+            meta = json.loads(self.meta_path.read_text())
+            if meta.get("encoder") == self.encoder.name:
+                rows_on_disk = self.path.stat().st_size // (self.encoder.dim * 4)
+                self._set_ids(meta.get("ids", [])[:rows_on_disk])
+            self._meta_version = version
+
+    def _save_meta(self):
+        atomic_write_text(self.meta_path, json.dumps({"encoder": self.encoder.name, "ids": self.ids}))
+        self._meta_version = self._read_meta_version()
+
+    def _remap(self):
+        if self.ids:
+            self._vectors = np.memmap(self.path, dtype=np.float32, mode="r", shape=(len(self.ids), self.encoder.dim))
+        else:
+            self._vectors = None
+
+    def __contains__(self, project_id: int) -> bool:
+        self._refresh()
+        return project_id in self._row_of
+
+    def add_many(self, projects: List[Dict]):
+        """Embed and append every project that is not indexed yet, in one batch."""
+        self._refresh()
+        missing = [p for p in projects if p.get("id") not in self._row_of]
+        if not missing:
+            return
+
+        vectors = self.encoder.encode([project_text(p) for p in missing])
+
+        with self._lock, file_lock(self._lock_path()):
+            # Another request or worker may have indexed some of these while we were encoding
+            self._refresh()
+            fresh = [row for row, p in enumerate(missing) if p["id"] not in self._row_of]
+            if not fresh:
+                return
+            with open(self.path, "ab") as f:
+                f.write(np.ascontiguousarray(vectors[fresh], dtype=np.float32).tobytes())
+            self._set_ids(self.ids + [missing[row]["id"] for row in fresh])
+            self._save_meta()
+
+    def add(self, project: Dict):
+        """Embed a single newly created project."""
+        self.add_many([project])
+
+    def rows_for(self, project_ids: List[int]) -> List[int]:
+        """Matrix rows of the given (already indexed) projects, in order."""
+        self._refresh()
+        return [self._row_of[pid] for pid in project_ids]
+
+    def vectors_for(self, project_ids: List[int]) -> np.ndarray:
+        """Embedding rows of the given (already indexed) projects, in order."""
+        return np.asarray(self._vectors[self.rows_for(project_ids)])
+
+    def scores(self, query_skills: List[str]) -> Dict[int, float]:
+        """Cosine similarity between the query skills and every indexed project."""
+        self._refresh()
+        if self._vectors is None:
+            return {}
+        query = self.encoder.encode([skills_text(query_skills)])[0]
+        similarities = self._vectors @ query
+        return dict(zip(self.ids, similarities.tolist()))
+
+
+@lru_cache
+def get_embedding_index() -> EmbeddingIndex:
+    """Get the process-wide project embedding index."""
+    return EmbeddingIndex(get_encoder())
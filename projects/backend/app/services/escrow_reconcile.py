@@ -0,0 +1,189 @@
+"""
+CampusNexus - Escrow Reconciliation
+Periodic job that checks active escrow records against the on-chain state
+of their MilestoneEscrow apps. get_info is read for all of them in batches
+(each batch one set of simulate calls, a bounded number in flight), the
+differences are applied in one store commit, and the job reports how many
+records diverged and how long it took.
+"""
+import asyncio
+import logging
+import time
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+from app.config import get_settings
+from app.services.contract_reads import ContractReadError, read_escrow_infos
+from app.services.escrow_store import EscrowStore, get_escrow_store
+from app.services.escrow_txns import MICROALGOS_PER_ALGO
+
+logger = logging.getLogger(__name__)
+
+# On-chain statuses that override the local one (inactive = not created yet)
+AUTHORITATIVE_STATUSES = ("active", "completed", "cancelled")
+
+
+def diff_escrow(escrow: Dict, info) -> Tuple[List[str], Dict]:
+    """
+    (divergence kinds, corrections) of one local record against its get_info
+    result. Amounts and status follow the chain; party mismatches are only
+    reported, since the indexed addresses are never rewritten.
+    """
+    kinds: List[str] = []
+    changes: Dict = {}
+
+    if isinstance(info, ContractReadError):
+        kinds.append("missing")
+        if escrow.get("chain_error") != str(info):
+            changes["chain_error"] = str(info)
+        return kinds, changes
+    if escrow.get("chain_error"):
+        changes["chain_error"] = None
+
+    if (info["client_address"], info["freelancer_address"]) != (escrow["client_address"], escrow["freelancer_address"]):
+        kinds.append("parties")
+    if info["status"] in AUTHORITATIVE_STATUSES and info["status"] != escrow["status"]:
+        kinds.append("status")
+        changes["status"] = info["status"]
+    released = info["released_amount"] / MICROALGOS_PER_ALGO
+    if released != escrow.get("released_amount_algo", 0):
+        kinds.append("released")
+        changes["released_amount_algo"] = released
+    return kinds, changes
+
+
+class EscrowReconciler:
+    """Reads on-chain state for every active, linked escrow and corrects local records."""
+
+    def __init__(self, store: EscrowStore, batch_size: int = 64, concurrency: int = 4):
+        self.store = store
+        self.batch_size = batch_size
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self.runs = 0
+        self.last_run: Optional[Dict] = None
+        self.last_error: Optional[str] = None
+        self.divergences: Counter = Counter()
+
+    async def _read_batch(self, app_ids: List[int]) -> Dict[int, object]:
+        async with self._semaphore:
+            return await read_escrow_infos(app_ids)
+
+    def _commit(self, snapshots: Dict[int, Dict], infos: Dict[int, object]) -> Tuple[int, int]:
+        """
+        Apply corrections in one store batch, re-diffed against the current
+        records; a record whose status or milestones changed while the chain
+        was being read (e.g. an approval) is skipped until the next run.
+        Returns (corrected, skipped).
+        """
+        corrected = skipped = 0
+        with self.store.batch():
+            for escrow_id, before in snapshots.items():
+                current = self.store.get(escrow_id)
+                if (
+                    current is None
+                    or current["status"] != before["status"]
+                    or current["milestones"] != before["milestones"]
+                ):
+                    skipped += 1
+                    continue
+                _, changes = diff_escrow(current, infos[current["app_id"]])
+                if changes:
+                    self.store.update(escrow_id, changes)
+                    corrected += 1
+        return corrected, skipped
+
+    async def reconcile_once(self) -> Dict:
+        started = time.perf_counter()
+        escrows = [e for e in self.store.all() if e["status"] == "active" and e.get("app_id")]
+        app_ids = list(dict.fromkeys(e["app_id"] for e in escrows))
+
+        batches = [app_ids[i:i + self.batch_size] for i in range(0, len(app_ids), self.batch_size)]
+        infos: Dict[int, object] = {}
+        for batch in await asyncio.gather(*[self._read_batch(b) for b in batches]):
+            infos.update(batch)
+
+        kinds: Counter = Counter()
+        diverged = 0
+        # Snapshot of each record that needs a correction, as read before the chain reads
+        to_correct: Dict[int, Dict] = {}
+        for escrow in escrows:
+            escrow_kinds, changes = diff_escrow(escrow, infos[escrow["app_id"]])
+            kinds.update(escrow_kinds)
+            diverged += bool(escrow_kinds)
+            if changes:
+                to_correct[escrow["id"]] = escrow
+
+        corrected = skipped = 0
+        if to_correct:
+            # One locked read-modify-write for the whole run
+            corrected, skipped = await asyncio.to_thread(self._commit, to_correct, infos)
+
+        self.runs += 1
+        self.divergences.update(kinds)
+        self.last_run = {
+            "checked": len(escrows),
+            "batches": len(batches),
+            "diverged": diverged,
+            "divergences": dict(kinds),
+            "corrected": corrected,
+            "skipped": skipped,
+            "duration_ms": round((time.perf_counter() - started) * 1000, 2),
+        }
+        return self.last_run
+
+    async def run(self, interval: float):
+        """Reconcile forever; failures are logged and retried on the next tick."""
+        while True:
+            try:
+                result = await self.reconcile_once()
+                self.last_error = None
+                if result["corrected"]:
+                    logger.info("Escrow reconciliation corrected %d records", result["corrected"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.last_error = str(e)
+                logger.warning("Escrow reconciliation failed: %s", e)
+            await asyncio.sleep(interval)
+
+    def stats(self) -> dict:
+        return {
+            "runs": self.runs,
+            "last_run": self.last_run,
+            "divergences_total": dict(self.divergences),
+            "last_error": self.last_error,
+        }
+
+
+_reconciler: Optional[EscrowReconciler] = None
+_task: Optional[asyncio.Task] = None
+
+
+def get_escrow_reconciler() -> EscrowReconciler:
+    global _reconciler
+    if _reconciler is None:
+        settings = get_settings()
+        _reconciler = EscrowReconciler(
+            get_escrow_store(), settings.escrow_reconcile_batch_size, settings.escrow_reconcile_concurrency
+        )
+    return _reconciler
+
+
+def start_escrow_reconciler():
+    """Start the background reconciliation task (called on application start-up)."""
+    global _task
+    settings = get_settings()
+    if settings.escrow_reconcile_enabled and _task is None:
+        _task = asyncio.create_task(get_escrow_reconciler().run(settings.escrow_reconcile_interval_seconds))
+
+
+async def stop_escrow_reconciler():
+    """Cancel the background reconciliation task (called on application shutdown)."""
+    global _task
+    if _task is not None:
+        _task.cancel()
+        try:
+            await _task
+        except asyncio.CancelledError:
+            pass
+        _task = None
@@ -0,0 +1,162 @@
+"""
+CampusNexus - Escrow Store
+Durable escrow records in data/escrows.json with O(1) lookup by id and
+secondary indexes by client, freelancer and project. Every write goes to
+disk atomically under a file lock, and a store reloads when another worker
+has changed the file, so all workers see the same escrows.
+
+Writes block on the file lock, so async callers run them in a thread
+(asyncio.to_thread). Reads return copies; changes go through update().
+"""
+import copy
+import json
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from app.utils.file_lock import atomic_write_text, file_lock
+
+# Escrow database file path
+ESCROW_DB_FILE = Path(__file__).parent.parent.parent / "data" / "escrows.json"
+
+# Fields the secondary indexes are built from (fixed once an escrow exists)
+INDEXED_FIELDS = ("client_address", "freelancer_address", "project_id")
+
+
+class EscrowStore:
+    """
+    JSON-backed escrow records.
+    Reads are served from memory; `batch()` groups mutations into one locked
+    read-modify-write that is saved once.
+    """
+
+    def __init__(self, path: Path = ESCROW_DB_FILE):
+        self.path = path
+        self._lock = threading.RLock()
+        self._version = None
+        self._next_id = 1
+        self._by_id: Dict[int, Dict] = {}
+        self._indexes: Dict[str, Dict] = {field: {} for field in INDEXED_FIELDS}
+        self._batch_owner: Optional[int] = None
+        self.commits = 0
+
+    def _file_version(self):
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _refresh(self):
+        """Reload from disk if the file changed since we last read or wrote it."""
+        version = self._file_version()
+        if version == self._version:
+            return
+        data = json.loads(self.path.read_text()) if version else {}
+        self._by_id = {e["id"]: e for e in data.get("escrows", [])}
+        self._next_id = data.get("next_id", max(self._by_id, default=0) + 1)
+        self._indexes = {field: {} for field in INDEXED_FIELDS}
+        for escrow in self._by_id.values():
+            self._index(escrow)
+        self._version = version
+
+    def _index(self, escrow: Dict):
+        for field in INDEXED_FIELDS:
+            # dict keys as an ordered set: ids stay in creation order
+            self._indexes[field].setdefault(escrow[field], {})[escrow["id"]] = None
+
+    def _save(self):
+        atomic_write_text(self.path, json.dumps({
+            "next_id": self._next_id,
+            "escrows": list(self._by_id.values()),
+        }, indent=2, default=str))
+        self._version = self._file_version()
+        self.commits += 1
+
+    @contextmanager
+    def batch(self) -> Iterator["EscrowStore"]:
+        """
+        Apply several mutations as one commit; nested batches (same thread)
+        join the outer one. Blocks on the file lock: call from a thread.
+        """
+        if self._batch_owner == threading.get_ident():
+            yield self
+            return
+        # File lock first, so waiting on another worker never holds up readers
+        with file_lock(self.path.with_suffix(".lock")), self._lock:
+            self._refresh()
+            self._batch_owner = threading.get_ident()
+            try:
+                yield self
+                self._save()
+            except BaseException:
+                # Drop half-applied changes: the next read reloads the file
+                self._version = None
+                raise
+            finally:
+                self._batch_owner = None
+
+    # ----- Reads -----
+
+    def get(self, escrow_id: int) -> Optional[Dict]:
+        """Copy of one escrow (mutating it does not change the store)."""
+        with self._lock:
+            self._refresh()
+            return copy.deepcopy(self._by_id.get(escrow_id))
+
+    def _lookup(self, field: str, value) -> List[Dict]:
+        with self._lock:
+            self._refresh()
+            return [copy.deepcopy(self._by_id[i]) for i in self._indexes[field].get(value, ())]
+
+    def by_client(self, address: str) -> List[Dict]:
+        return self._lookup("client_address", address)
+
+    def by_freelancer(self, address: str) -> List[Dict]:
+        return self._lookup("freelancer_address", address)
+
+    def by_project(self, project_id: int) -> List[Dict]:
+        return self._lookup("project_id", project_id)
+
+    def all(self) -> List[Dict]:
+        with self._lock:
+            self._refresh()
+            return copy.deepcopy(list(self._by_id.values()))
+
+    # ----- Writes -----
+
+    def create(self, escrow: Dict) -> Dict:
+        """Store a new escrow under the next free id and return (a copy of) it."""
+        with self.batch():
+            escrow = {"id": self._next_id, **copy.deepcopy(escrow)}
+            self._next_id += 1
+            self._by_id[escrow["id"]] = escrow
+            self._index(escrow)
+            return copy.deepcopy(escrow)
+
+    def update(self, escrow_id: int, changes: Dict) -> Optional[Dict]:
+        """Merge `changes` into an escrow (indexed fields are immutable)."""
+        with self.batch():
+            escrow = self._by_id.get(escrow_id)
+            if escrow is None:
+                return None
+            escrow.update({
+                k: copy.deepcopy(v) for k, v in changes.items() if k not in INDEXED_FIELDS and k != "id"
+            })
+            return copy.deepcopy(escrow)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"escrows": len(self._by_id), "commits": self.commits}
+
+
+_store: Optional[EscrowStore] = None
+
+
+def get_escrow_store() -> EscrowStore:
+    """Get the process-wide escrow store."""
+    global _store
+    if _store is None:
+        _store = EscrowStore()
+    return _store
@@ -0,0 +1,170 @@
+"""
+CampusNexus - Escrow Transaction Builder
+Builds ready-to-sign, unsigned transaction groups for the MilestoneEscrow
+contract's ABI methods, so the frontend only signs and submits. Every
+escrow has its own MilestoneEscrow app, so each group targets the app id the
+caller passes. Suggested params come from a round-aware cache shared by all
+requests.
+"""
+import asyncio
+import base64
+import copy
+import time
+from typing import Dict, List, Optional
+
+from algosdk import encoding, logic, transaction
+from algosdk.atomic_transaction_composer import AtomicTransactionComposer, EmptySigner, TransactionWithSigner
+
+from app.config import get_settings
+from app.services.algorand import ROUND_SECONDS, algod_get
+from app.services.contract_specs import get_contract
+
+# Validity window of built transactions (the protocol maximum)
+VALIDITY_ROUNDS = 1000
+MICROALGOS_PER_ALGO = 1_000_000
+
+
+def to_microalgos(amount_algo: float) -> int:
+    return int(round(amount_algo * MICROALGOS_PER_ALGO))
+
+
+class SuggestedParamsCache:
+    """
+    algod's suggested params, reused until the chain has (by estimate)
+    advanced `max_age_rounds` past the round they were fetched at.
+    Concurrent refreshes are coalesced into one request.
+    """
+
+    def __init__(self, max_age_rounds: int):
+        self.max_age_rounds = max_age_rounds
+        self._params: Optional[Dict] = None
+        self._fetched_at = 0.0
+        self._lock = asyncio.Lock()
+        self.hits = 0
+        self.refreshes = 0
+
+    def _age_rounds(self) -> float:
+        return (time.monotonic() - self._fetched_at) / ROUND_SECONDS
+
+    async def get(self) -> transaction.SuggestedParams:
+        if self._params is None or self._age_rounds() >= self.max_age_rounds:
+            async with self._lock:
+                # Re-checked: another request may have refreshed while we waited
+                if self._params is None or self._age_rounds() >= self.max_age_rounds:
+                    self._params = await algod_get("/v2/transactions/params")
+                    self._fetched_at = time.monotonic()
+                    self.refreshes += 1
+                    return self._build()
+        self.hits += 1
+        return self._build()
+
+    def _build(self) -> transaction.SuggestedParams:
+        """
+        Params with a flat fee of algod's min-fee per transaction. algod's
+        `fee` is a per-byte fee, only non-zero while the network is
+        congested, so it is not comparable with min-fee; it is ignored
+        because fee pooling (_method_call) needs flat fees. Groups built
+        during congestion may be rejected and must be rebuilt.
+        """
+        params = self._params
+        first = params["last-round"]
+        min_fee = params.get("min-fee", 1000)
+        return transaction.SuggestedParams(
+            fee=min_fee,
+            first=first,
+            last=first + VALIDITY_ROUNDS,
+            gh=params["genesis-hash"],
+            gen=params["genesis-id"],
+            flat_fee=True,
+            min_fee=min_fee,
+        )
+
+    def stats(self) -> dict:
+        return {
+            "hits": self.hits,
+            "refreshes": self.refreshes,
+            "last_round": self._params["last-round"] if self._params else None,
+        }
+
+
+_params_cache: Optional[SuggestedParamsCache] = None
+
+
+def get_params_cache() -> SuggestedParamsCache:
+    """Get the process-wide suggested-params cache."""
+    global _params_cache
+    if _params_cache is None:
+        _params_cache = SuggestedParamsCache(get_settings().escrow_params_max_age_rounds)
+    return _params_cache
+
+
+def _encode_group(atc: AtomicTransactionComposer, method: str) -> Dict:
+    group = [tws.txn for tws in atc.build_group()]
+    return {
+        "method": method,
+        "app_id": group[-1].index,
+        "group_id": base64.b64encode(group[0].group).decode() if group[0].group else None,
+        "first_valid": group[0].first_valid_round,
+        "last_valid": group[0].last_valid_round,
+        # Base64 msgpack, the format wallets (Pera, algosdk decode_unsigned_transaction) accept
+        "transactions": [encoding.msgpack_encode(txn) for txn in group],
+    }
+
+
+async def _method_call(
+    method: str,
+    app_id: int,
+    sender: str,
+    args: List = (),
+    extra_fee_txns: int = 0,
+    payment_algo: Optional[float] = None,
+) -> Dict:
+    """Unsigned group for one ABI call to a MilestoneEscrow app, optionally preceded by a payment to it."""
+    params = await get_params_cache().get()
+    atc = AtomicTransactionComposer()
+    signer = EmptySigner()
+
+    if payment_algo is not None:
+        payment = transaction.PaymentTxn(
+            sender, params, logic.get_application_address(app_id), to_microalgos(payment_algo)
+        )
+        atc.add_transaction(TransactionWithSigner(payment, signer))
+
+    call_params = copy.copy(params)
+    # Inner transactions are paid for by the outer call (fee pooling)
+    call_params.fee = params.fee * (1 + extra_fee_txns)
+    atc.add_method_call(
+        app_id=app_id,
+        method=get_contract("MILESTONE_ESCROW").get_method_by_name(method),
+        sender=sender,
+        sp=call_params,
+        signer=signer,
+        method_args=list(args),
+    )
+    return _encode_group(atc, method)
+
+
+async def build_create_escrow(
+    app_id: int, client_address: str, freelancer_address: str, total_amount_algo: float
+) -> Dict:
+    """
+    create_escrow on a freshly deployed MilestoneEscrow app: each app holds
+    a single escrow and rejects a second create_escrow.
+    """
+    return await _method_call(
+        "create_escrow", app_id, client_address, [freelancer_address, to_microalgos(total_amount_algo)]
+    )
+
+
+async def build_fund_escrow(app_id: int, client_address: str, amount_algo: float) -> Dict:
+    return await _method_call("fund_escrow", app_id, client_address, payment_algo=amount_algo)
+
+
+async def build_release_payment(app_id: int, client_address: str, amount_algo: float) -> Dict:
+    return await _method_call(
+        "release_payment", app_id, client_address, [to_microalgos(amount_algo)], extra_fee_txns=1
+    )
+
+
+async def build_cancel_escrow(app_id: int, client_address: str) -> Dict:
+    return await _method_call("cancel_escrow", app_id, client_address)
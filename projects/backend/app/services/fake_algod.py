@@ -0,0 +1,223 @@
+"""
+CampusNexus - Fake Algorand Node
+Algod and indexer stand-ins with injectable latency and failures, so the
+backend can be exercised end to end (and load-tested) without testnet.
+
+In-process: set ALGORAND_FAKE_NODE=true and the backend's node clients
+talk to these apps directly through httpx's ASGI transport.
+
+As separate local nodes (from projects/backend), e.g. to exercise failover:
+    python -m app.services.fake_algod --port 4001 --latency-ms 30
+    python -m app.services.fake_algod --port 4002 --latency-ms 300 --failure-rate 0.2
+then set ALGORAND_ALGOD_ADDRESS=http://127.0.0.1:4001,http://127.0.0.1:4002
+"""
+import argparse
+import asyncio
+import base64
+import hashlib
+import random
+import time
+from typing import Dict, Iterable, List
+
+import msgpack
+from algosdk import encoding
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import JSONResponse
+
+# Testnet-like block time
+ROUND_SECONDS = 2.8
+GENESIS_ID = "testnet-v1.0"
+GENESIS_HASH = "SGO1GKSzyE7IEPItTxCByw9x8FmnrCDexi9/cOUJOiI="
+
+
+class FakeChain:
+    """State shared by a fake algod and indexer pair: the round clock and deployed apps."""
+
+    def __init__(self, app_ids: Iterable[int] = ()):
+        self._genesis = time.monotonic()
+        self.app_ids = set(app_ids)
+
+    @property
+    def round(self) -> int:
+        return 1000 + int((time.monotonic() - self._genesis) / ROUND_SECONDS)
+
+    def account(self, address: str) -> Dict:
+        if not encoding.is_valid_address(address):
+            raise HTTPException(status_code=400, detail="failed to parse the address")
+        # Deterministic balance per address, so repeated calls agree
+        amount = int.from_bytes(hashlib.sha256(address.encode()).digest()[:4], "big") % 100_000_000
+        return {
+            "address": address,
+            "amount": amount,
+            "amount-without-pending-rewards": amount,
+            "min-balance": 100_000,
+            "round": self.round,
+            "status": "Offline",
+            "total-apps-opted-in": 0,
+            "total-assets-opted-in": 0,
+        }
+
+    def creator(self, app_id: int) -> str:
+        return encoding.encode_address(hashlib.sha256(str(app_id).encode()).digest())
+
+    def application(self, app_id: int) -> Dict:
+        if app_id not in self.app_ids:
+            raise HTTPException(status_code=404, detail="application does not exist")
+        return {
+            "id": app_id,
+            "params": {
+                "creator": self.creator(app_id),
+                "approval-program": "",
+                "clear-state-program": "",
+                "global-state": [],
+                "global-state-schema": {"num-byte-slice": 0, "num-uint": 0},
+                "local-state-schema": {"num-byte-slice": 0, "num-uint": 0},
+            },
+        }
+
+    def readonly_call(self, app_id: int, app_args: List[bytes]) -> bytes:
+        """ARC-4 return log of one of our readonly methods, with made-up but stable state."""
+        from app.services.contract_specs import CONTRACT_SPECS, RETURN_PREFIX, get_contract
+
+        if app_id not in self.app_ids:
+            raise ValueError(f"application {app_id} does not exist")
+        values = {
+            "get_info": lambda: [self.creator(app_id), self.creator(app_id + 1), 5_000_000, 2_000_000, 1],
+            "get_total_minted": lambda: app_id % 1000,
+            "get_admin": lambda: self.creator(app_id),
+        }
+        for key in CONTRACT_SPECS:
+            for method in get_contract(key).methods:
+                if app_args and method.get_selector() == app_args[0] and method.name in values:
+                    return RETURN_PREFIX + method.returns.type.encode(values[method.name]())
+        raise ValueError("logic eval error: err opcode executed")
+
+
+def _inject_faults(app: FastAPI, latency_ms: float, jitter_ms: float, failure_rate: float, seed: int):
+    rng = random.Random(seed)
+
+    @app.middleware("http")
+    async def inject_faults(request: Request, call_next):
+        delay = latency_ms + rng.uniform(0, jitter_ms)
+        if delay:
+            await asyncio.sleep(delay / 1000)
+        if rng.random() < failure_rate:
+            return JSONResponse({"message": "injected failure"}, status_code=503)
+        return await call_next(request)
+
+
+def create_fake_algod(
+    latency_ms: float = 0.0,
+    jitter_ms: float = 0.0,
+    failure_rate: float = 0.0,
+    seed: int = 0,
+    chain: FakeChain = None,
+) -> FastAPI:
+    """Build a fake algod app; every response is delayed and may fail with a 503."""
+    app = FastAPI(title="Fake algod")
+    chain = chain or FakeChain()
+    _inject_faults(app, latency_ms, jitter_ms, failure_rate, seed)
+
+    @app.get("/health")
+    async def health():
+        return {}
+
+    @app.get("/v2/status")
+    async def status():
+        return {"last-round": chain.round, "time-since-last-round": 0, "catchup-time": 0}
+
+    @app.get("/v2/transactions/params")
+    async def suggested_params():
+        return {
+            "consensus-version": "future",
+            "fee": 0,
+            "min-fee": 1000,
+            "genesis-id": GENESIS_ID,
+            "genesis-hash": GENESIS_HASH,
+            "last-round": chain.round,
+        }
+
+    @app.get("/v2/accounts/{address}")
+    async def account(address: str):
+        return chain.account(address)
+
+    @app.get("/v2/applications/{app_id}")
+    async def application(app_id: int):
+        return chain.application(app_id)
+
+    @app.post("/v2/transactions/simulate")
+    async def simulate(request: Request):
+        body = msgpack.unpackb(await request.body(), raw=False, strict_map_key=False)
+        results = []
+        for group in body["txn-groups"]:
+            txn_results = []
+            for index, stxn in enumerate(group["txns"]):
+                txn = stxn["txn"]
+                try:
+                    log = chain.readonly_call(txn.get("apid", 0), txn.get("apaa", []))
+                except ValueError as e:
+                    # Like algod: the group stops at the first failing transaction
+                    results.append({"failed-at": [index], "failure-message": str(e), "txn-results": txn_results})
+                    break
+                txn_results.append({"txn-result": {"logs": [base64.b64encode(log).decode()]}})
+            else:
+                results.append({"txn-results": txn_results})
+        return {"last-round": chain.round, "txn-groups": results, "version": 2}
+
+    return app
+
+
+def create_fake_indexer(
+    latency_ms: float = 0.0,
+    jitter_ms: float = 0.0,
+    failure_rate: float = 0.0,
+    seed: int = 0,
+    chain: FakeChain = None,
+) -> FastAPI:
+    """Build a fake indexer app with the same fault injection as the fake algod."""
+    app = FastAPI(title="Fake indexer")
+    chain = chain or FakeChain()
+    _inject_faults(app, latency_ms, jitter_ms, failure_rate, seed + 1)
+
+    @app.get("/health")
+    async def health():
+        return {"round": chain.round, "is-migrating": False, "db-available": True}
+
+    @app.get("/v2/accounts/{address}")
+    async def account(address: str):
+        return {"account": chain.account(address), "current-round": chain.round}
+
+    @app.get("/v2/applications/{app_id}")
+    async def application(app_id: int):
+        return {"application": chain.application(app_id), "current-round": chain.round}
+
+    @app.get("/v2/transactions")
+    async def transactions():
+        return {"transactions": [], "current-round": chain.round}
+
+    return app
+
+
+def main():
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=4001)
+    parser.add_argument("--indexer", action="store_true", help="Serve the fake indexer instead of algod")
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    from app.services.algorand import CONTRACT_IDS
+
+    chain = FakeChain(CONTRACT_IDS.values())
+    factory = create_fake_indexer if args.indexer else create_fake_algod
+    app = factory(args.latency_ms, args.jitter_ms, args.failure_rate, args.seed, chain)
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+CampusNexus - Personalized Feed Ranking
+Blends skill match, freshness and budget into one score per project, using
+features computed once per catalogue version rather than per request.
+"""
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from app.config import get_settings
+from app.services.skills import SkillIds, jaccard, query_skill_ids, skill_ids
+from app.utils.database import get_projects_version, load_projects
+
+
+class FeedFeatures:
+    """Per-project ranking features for the open projects of one catalogue version."""
+
+    def __init__(self, version: str, projects: List[Dict]):
+        self.version = version
+        self.projects = [p for p in projects if p.get("status") == "open"]
+        self.skill_sets: List[SkillIds] = [skill_ids(p.get("skills_required", [])) for p in self.projects]
+        self.created_ts = np.array([_timestamp(p.get("created_at")) for p in self.projects], dtype=np.float64)
+
+        # Log-scaled budget in [0, 1], so one huge gig does not flatten all others
+        budgets = np.log1p(np.array([max(p.get("budget_algo") or 0, 0) for p in self.projects], dtype=np.float64))
+        top_budget = budgets.max() if len(budgets) else 0.0
+        self.budget = budgets / top_budget if top_budget > 0 else np.zeros_like(budgets)
+
+
+def _timestamp(created_at: Optional[str]) -> float:
+    try:
+        return datetime.fromisoformat(created_at).timestamp()
+    except (TypeError, ValueError):
+        return 0.0
+
+
+_features: Optional[FeedFeatures] = None
+_features_lock = threading.Lock()
+
+
+def get_feed_features() -> FeedFeatures:
+    """Current features, recomputed only when projects.json has changed."""
+    global _features
+    version = get_projects_version()
+    with _features_lock:
+        if _features is None or _features.version != version:
+            _features = FeedFeatures(version, load_projects())
+        return _features
+
+
+def rank_feed(user_skills: List[str], offset: int = 0, limit: int = 20, now: Optional[datetime] = None) -> List[Dict]:
+    """
+    One page of open projects ordered by
+    w_match * jaccard + w_recency * 0.5^(age / half_life) + w_budget * budget.
+    Weights and half-life come from Settings.
+    """
+    settings = get_settings()
+    features = get_feed_features()
+    count = len(features.projects)
+    if count == 0 or offset >= count:
+        return []
+
+    now_ts = (now or datetime.utcnow()).timestamp()
+    age_days = np.maximum(now_ts - features.created_ts, 0) / 86400
+    recency = np.power(0.5, age_days / settings.feed_recency_half_life_days)
+
+    user_ids = query_skill_ids(user_skills)
+    if user_ids:
+        match = np.fromiter((jaccard(user_ids, s) for s in features.skill_sets), dtype=np.float64, count=count)
+    else:
+        match = np.zeros(count)
+
+    scores = (
+        settings.feed_weight_match * match
+        + settings.feed_weight_recency * recency
+        + settings.feed_weight_budget * features.budget
+    )
+
+    # Only the first offset + limit positions need a full sort
+    end = min(offset + limit, count)
+    top = np.argpartition(-scores, end - 1)[:end] if end < count else np.arange(count)
+    top = top[np.argsort(-scores[top], kind="stable")][offset:end]
+
+    return [
+        {
+            **features.projects[i],
+            "feed_score": round(float(scores[i]), 4),
+            "match_score": round(float(match[i]) * 100, 1),  # Convert to percentage
+        }
+        for i in top
+    ]
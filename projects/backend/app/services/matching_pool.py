@@ -0,0 +1,177 @@
+"""
+CampusNexus - Matching Process Pool
+Runs CPU-bound matching on a managed pool of worker processes so the API
+event loop stays responsive. Workers share a read-only catalogue snapshot
+through memory-mapped .npy files instead of receiving it with every job.
+"""
+import asyncio
+import json
+import multiprocessing
+import os
+import shutil
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from app.config import get_settings
+from app.services.ai_matching import MATCH_MODES
+from app.services.batch_matching import (
+    attach_scores,
+    build_catalogue,
+    chunk_bounds,
+    cosine_chunk,
+    encode_users,
+    jaccard_chunk,
+)
+from app.services.embeddings import EMBEDDINGS_FILE, get_embedding_index, get_encoder, skills_text
+from app.utils.database import get_projects_version, load_projects
+
+
+# Catalogue snapshot directory (one sub-directory per catalogue version)
+SNAPSHOT_DIR = Path(__file__).parent.parent.parent / "data" / "match_snapshot"
+
+
+class CatalogueSnapshot:
+    """
+    Parent-side view of a published snapshot: the projects it covers and the
+    skill-id vocabulary needed to turn user skills into matrix rows.
+    """
+
+    def __init__(self, version: str, projects: List[Dict]):
+        self.version = version
+        self.projects = projects
+        self.directory = SNAPSHOT_DIR / version
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        self.vocab, incidence, sizes = build_catalogue(projects)
+        np.save(self.directory / "incidence.npy", incidence)
+        np.save(self.directory / "sizes.npy", sizes)
+        self.has_embeddings = False
+
+    def ensure_embeddings(self):
+        """Publish which embedding rows belong to this snapshot (first semantic job only)."""
+        if self.has_embeddings:
+            return
+        index = get_embedding_index()
+        index.add_many(self.projects)
+        rows = np.array(index.rows_for([p["id"] for p in self.projects]), dtype=np.int64)
+        np.save(self.directory / "rows.npy", rows)
+        (self.directory / "embeddings.json").write_text(json.dumps({
+            "rows": len(index.ids),
+            "dim": index.encoder.dim,
+        }))
+        self.has_embeddings = True
+
+
+# ----- Worker side -----
+
+# Arrays of the snapshot a worker last used, memory-mapped read-only
+_worker_snapshot: Dict = {}
+
+
+def _open_snapshot(directory: str, semantic: bool) -> Dict:
+    """Map a snapshot into this worker once; later jobs for the same version reuse it."""
+    global _worker_snapshot
+    if _worker_snapshot.get("directory") != directory:
+        path = Path(directory)
+        _worker_snapshot = {
+            "directory": directory,
+            "incidence": np.load(path / "incidence.npy", mmap_mode="r"),
+            "sizes": np.load(path / "sizes.npy", mmap_mode="r"),
+        }
+    if semantic and "embeddings" not in _worker_snapshot:
+        path = Path(directory)
+        meta = json.loads((path / "embeddings.json").read_text())
+        rows = np.load(path / "rows.npy")
+        vectors = np.memmap(EMBEDDINGS_FILE, dtype=np.float32, mode="r", shape=(meta["rows"], meta["dim"]))
+        _worker_snapshot["embeddings"] = np.ascontiguousarray(vectors[rows])
+    return _worker_snapshot
+
+
+def _score_job(directory: str, mode: str, payload, k: int):
+    """Runs in a worker process: score one chunk of users against the snapshot."""
+    snapshot = _open_snapshot(directory, semantic=mode == "semantic")
+    if mode == "semantic":
+        queries = get_encoder().encode([skills_text(skills) for skills in payload])
+        return cosine_chunk(queries, snapshot["embeddings"], k)
+    user_matrix, user_sizes = payload
+    return jaccard_chunk(user_matrix, user_sizes, snapshot["incidence"], snapshot["sizes"], k)
+
+
+# ----- Parent side -----
+
+class MatchingPool:
+    """Process pool plus the current catalogue snapshot it scores against."""
+
+    def __init__(self, workers: int):
+        # 'spawn' so workers never inherit the event loop or open sockets
+        self._executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        self._snapshot: Optional[CatalogueSnapshot] = None
+        self._lock = threading.Lock()
+
+    def _current_snapshot(self, mode: str) -> CatalogueSnapshot:
+        """Rebuild the snapshot when projects.json changed, dropping older versions."""
+        with self._lock:
+            # Versioned by projects.json itself, so writes from other API workers are seen too
+            version = get_projects_version()
+            if self._snapshot is None or self._snapshot.version != version:
+                self._snapshot = CatalogueSnapshot(version, load_projects())
+                for old in SNAPSHOT_DIR.iterdir():
+                    if old.name != version:
+                        shutil.rmtree(old, ignore_errors=True)
+            if mode == "semantic":
+                self._snapshot.ensure_embeddings()
+            return self._snapshot
+
+    async def rank(self, skill_sets: List[List[str]], mode: str = "jaccard", k: int = 10) -> List[List[Dict]]:
+        """Rank projects for every skill set, one pool job per chunk of users."""
+        if mode not in MATCH_MODES:
+            raise ValueError(f"Unknown match mode: {mode}")
+        loop = asyncio.get_running_loop()
+        # Snapshot publishing does file IO, keep it off the event loop too
+        snapshot = await loop.run_in_executor(None, self._current_snapshot, mode)
+        if not snapshot.projects or not skill_sets:
+            return [[] for _ in skill_sets]
+
+        chunks = chunk_bounds(len(skill_sets))
+        if mode == "semantic":
+            payloads = [skill_sets[a:b] for a, b in chunks]
+        else:
+            user_matrix, user_sizes = encode_users(skill_sets, snapshot.vocab)
+            payloads = [(user_matrix[a:b], user_sizes[a:b]) for a, b in chunks]
+
+        directory = str(snapshot.directory)
+        chunk_results = await asyncio.gather(*[
+            loop.run_in_executor(self._executor, _score_job, directory, mode, payload, k)
+            for payload in payloads
+        ])
+        return attach_scores(snapshot.projects, chunk_results)
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+_pool: Optional[MatchingPool] = None
+
+
+def get_matching_pool() -> MatchingPool:
+    """Get the managed matching pool, starting its workers on first use."""
+    global _pool
+    if _pool is None:
+        workers = get_settings().ai_pool_workers or os.cpu_count() or 1
+        _pool = MatchingPool(workers)
+    return _pool
+
+
+def shutdown_matching_pool():
+    """Stop the worker processes (called on application shutdown)."""
+    global _pool
+    if _pool is not None:
+        _pool.shutdown()
+        _pool = None
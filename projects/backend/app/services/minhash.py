@@ -0,0 +1,95 @@
+"""
+CampusNexus - MinHash LSH Service
+Approximate Jaccard candidate generation for large project catalogues.
+"""
+import threading
+from collections import defaultdict
+from functools import lru_cache
+from typing import Dict, List, Set
+
+import numpy as np
+
+from app.config import get_settings
+from app.services.skills import SkillIds, query_skill_ids, skill_ids
+
+
+# Universal hashing h(x) = (a * x + b) mod p over interned skill ids.
+# With a, b < 2^31 the product fits in uint64, so numpy never overflows.
+_MERSENNE_PRIME = np.uint64((1 << 31) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+
+
+class MinHasher:
+    """Computes fixed-length MinHash signatures of skill sets."""
+
+    def __init__(self, num_perm: int = 128, seed: int = 1):
+        rng = np.random.default_rng(seed)
+        self.num_perm = num_perm
+        self._a = rng.integers(1, int(_MERSENNE_PRIME), size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, int(_MERSENNE_PRIME), size=num_perm, dtype=np.uint64)
+
+    def signature(self, skills: SkillIds) -> np.ndarray:
+        """Signature of a skill id set (all-max for an empty set)."""
+        if not skills:
+            return np.full(self.num_perm, _MAX_HASH, dtype=np.uint64)
+        ids = np.fromiter(skills, dtype=np.uint64, count=len(skills))
+        permuted = (np.outer(ids, self._a) + self._b) % _MERSENNE_PRIME
+        return permuted.min(axis=0)
+
+
+class LSHIndex:
+    """
+    Banded LSH over MinHash signatures.
+    Two sets collide in at least one band with probability 1 - (1 - J^rows)^bands,
+    so more bands with fewer rows raise recall at the cost of more candidates.
+    """
+
+    def __init__(self, num_perm: int = 128, bands: int = 64):
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        self.hasher = MinHasher(num_perm)
+        self.bands = bands
+        self.rows = num_perm // bands
+        self._buckets: List[Dict[bytes, Set[int]]] = [defaultdict(set) for _ in range(bands)]
+        self.skills: Dict[int, SkillIds] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def threshold(self) -> float:
+        """Approximate Jaccard similarity at which collision probability is 50%."""
+        return (1 / self.bands) ** (1 / self.rows)
+
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        return [signature[i * self.rows:(i + 1) * self.rows].tobytes() for i in range(self.bands)]
+
+    def __contains__(self, project_id: int) -> bool:
+        return project_id in self.skills
+
+    def add(self, project_id: int, skills: List[str]):
+        """Compute the signature of a project once and file it into every band."""
+        ids = skill_ids(skills)
+        keys = self._band_keys(self.hasher.signature(ids)) if ids else []
+        with self._lock:
+            if project_id in self.skills:
+                return
+            self.skills[project_id] = ids
+            for band, key in enumerate(keys):
+                self._buckets[band][key].add(project_id)
+
+    def candidates(self, skills: List[str]) -> Set[int]:
+        """Project ids sharing at least one band with the query skills."""
+        # Unknown skills (negative ids) are in no stored signature
+        ids = frozenset(i for i in query_skill_ids(skills) if i >= 0)
+        if not ids:
+            return set()
+        found: Set[int] = set()
+        for band, key in enumerate(self._band_keys(self.hasher.signature(ids))):
+            found.update(self._buckets[band].get(key, ()))
+        return found
+
+
+@lru_cache
+def get_lsh_index() -> LSHIndex:
+    """Get the process-wide project LSH index."""
+    settings = get_settings()
+    return LSHIndex(num_perm=settings.ai_lsh_num_perm, bands=settings.ai_lsh_bands)
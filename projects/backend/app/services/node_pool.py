@@ -0,0 +1,201 @@
+"""
+CampusNexus - Algorand Node Pool
+Spreads algod/indexer calls over several equivalent nodes: the fastest
+healthy node is tried first, a hedged copy goes to the runner-up once the
+first call is slower than its usual p95, and failing nodes are skipped by
+a per-node circuit breaker until they cool down. A cooled-down node gets
+one trial request (half-open); other requests keep skipping it until that
+trial succeeds or reopens the breaker.
+"""
+import asyncio
+import time
+from collections import deque
+from typing import Deque, List, Optional
+
+import httpx
+
+# Samples needed before a node's own p95 is trusted as its hedge delay
+MIN_SAMPLES = 20
+# Hedge delay while a node's latency is still unknown
+DEFAULT_HEDGE_DELAY = 0.25
+EWMA_ALPHA = 0.2
+
+
+class NodeUnavailable(Exception):
+    """Every node failed or is circuit-broken."""
+
+
+class Endpoint:
+    """One node: its keep-alive client, latency statistics and breaker state."""
+
+    def __init__(self, client: httpx.AsyncClient, window: int = 200):
+        self.client = client
+        self.url = str(client.base_url)
+        self.ewma: Optional[float] = None
+        self._samples: Deque[float] = deque(maxlen=window)
+        self.failures = 0
+        self.open_until = 0.0
+        self.half_open_inflight = False
+        self.requests = 0
+        self.hedges_won = 0
+
+    def available(self, now: float) -> bool:
+        """Closed breaker, or open long enough for one trial request (half-open) not yet sent."""
+        return now >= self.open_until and not self.half_open_inflight
+
+    def begin(self) -> bool:
+        """Mark a request as started; True if it is the half-open trial."""
+        if self.open_until > 0.0:
+            self.half_open_inflight = True
+            return True
+        return False
+
+    def record_success(self, elapsed: float):
+        self.failures = 0
+        self.open_until = 0.0
+        self._samples.append(elapsed)
+        self.ewma = elapsed if self.ewma is None else EWMA_ALPHA * elapsed + (1 - EWMA_ALPHA) * self.ewma
+
+    def record_failure(self, threshold: int, cooldown: float):
+        self.failures += 1
+        if self.failures >= threshold:
+            self.open_until = time.monotonic() + cooldown
+
+    def p95(self) -> Optional[float]:
+        if len(self._samples) < MIN_SAMPLES:
+            return None
+        ordered = sorted(self._samples)
+        return ordered[int(0.95 * (len(ordered) - 1))]
+
+    def stats(self) -> dict:
+        p95 = self.p95()
+        return {
+            "url": self.url,
+            "ewma_ms": round(self.ewma * 1000, 2) if self.ewma is not None else None,
+            "p95_ms": round(p95 * 1000, 2) if p95 is not None else None,
+            "requests": self.requests,
+            "hedges_won": self.hedges_won,
+            "circuit": "open" if self.open_until > time.monotonic() else "closed",
+        }
+
+
+class NodePool:
+    """
+    Hedged, circuit-broken requests over equivalent nodes.
+    Transport errors and 5xx responses count as node failures; any other
+    response (including 4xx) is returned to the caller as is.
+    """
+
+    def __init__(
+        self,
+        clients: List[httpx.AsyncClient],
+        min_hedge_delay: float = 0.02,
+        failure_threshold: int = 5,
+        cooldown: float = 30.0,
+    ):
+        if not clients:
+            raise ValueError("NodePool needs at least one node")
+        self.endpoints = [Endpoint(c) for c in clients]
+        self.min_hedge_delay = min_hedge_delay
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+
+    def ranked(self) -> List[Endpoint]:
+        """Available nodes, fastest first; nodes without samples yet go first so they get measured."""
+        now = time.monotonic()
+        usable = [e for e in self.endpoints if e.available(now)]
+        return sorted(usable, key=lambda e: -1.0 if e.ewma is None else e.ewma)
+
+    def hedge_delay(self, endpoint: Endpoint) -> float:
+        p95 = endpoint.p95()
+        if p95 is None:
+            p95 = 3 * endpoint.ewma if endpoint.ewma is not None else DEFAULT_HEDGE_DELAY
+        return max(p95, self.min_hedge_delay)
+
+    async def _attempt(
+        self, endpoint: Endpoint, trial: bool, method: str, path: str, kwargs: dict
+    ) -> httpx.Response:
+        endpoint.requests += 1
+        started = time.perf_counter()
+        try:
+            try:
+                response = await endpoint.client.request(method, path, **kwargs)
+            except httpx.HTTPError:
+                endpoint.record_failure(self.failure_threshold, self.cooldown)
+                raise
+            if response.status_code >= 500:
+                endpoint.record_failure(self.failure_threshold, self.cooldown)
+                raise httpx.HTTPStatusError(
+                    f"{endpoint.url} returned {response.status_code}", request=response.request, response=response
+                )
+            endpoint.record_success(time.perf_counter() - started)
+            return response
+        finally:
+            if trial:
+                # Also on cancellation (a lost hedge), so the node is not left unavailable
+                endpoint.half_open_inflight = False
+
+    async def request(self, method: str, path: str, **kwargs) -> httpx.Response:
+        """Send to the best node, hedging to the next one if it is slower than usual."""
+        candidates = self.ranked()
+        forced = not candidates
+        if forced:
+            # Everything is broken; try the node whose breaker closes soonest
+            candidates = [min(self.endpoints, key=lambda e: e.open_until)]
+
+        pending = {}
+        last_error: Optional[Exception] = None
+        next_index = 0
+
+        def launch() -> bool:
+            """Start the next candidate still available; False if none is left."""
+            nonlocal next_index
+            while next_index < len(candidates):
+                endpoint = candidates[next_index]
+                next_index += 1
+                # Re-checked: another request may have taken this node's half-open trial meanwhile
+                if forced or endpoint.available(time.monotonic()):
+                    task = asyncio.ensure_future(self._attempt(endpoint, endpoint.begin(), method, path, kwargs))
+                    pending[task] = endpoint
+                    return True
+            return False
+
+        if not launch():
+            raise NodeUnavailable("No node available")
+        try:
+            while pending:
+                can_hedge = next_index < len(candidates)
+                timeout = self.hedge_delay(candidates[0]) if can_hedge else None
+                done, _ = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    launch()  # Hedge: the first node is slower than its usual p95
+                    continue
+                for task in done:
+                    endpoint = pending.pop(task)
+                    try:
+                        response = task.result()
+                    except Exception as e:
+                        last_error = e
+                        continue
+                    if endpoint is not candidates[0]:
+                        endpoint.hedges_won += 1
+                    return response
+                if not pending and next_index < len(candidates):
+                    launch()  # Failed outright: fail over immediately
+        finally:
+            for task in pending:
+                task.cancel()
+        raise NodeUnavailable(str(last_error)) from last_error
+
+    async def get(self, path: str, **kwargs) -> httpx.Response:
+        return await self.request("GET", path, **kwargs)
+
+    async def post(self, path: str, **kwargs) -> httpx.Response:
+        return await self.request("POST", path, **kwargs)
+
+    def stats(self) -> List[dict]:
+        return [e.stats() for e in self.endpoints]
+
+    async def close(self):
+        for endpoint in self.endpoints:
+            await endpoint.client.aclose()
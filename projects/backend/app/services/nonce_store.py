@@ -0,0 +1,108 @@
+"""
+CampusNexus - Wallet Login Nonces
+Single-use, expiring nonces that bind a signed login message to one
+challenge, so a captured signature cannot be replayed.
+"""
+import heapq
+import secrets
+import threading
+import time
+from typing import Dict, List, Optional, Protocol, Tuple
+
+from app.config import get_settings
+
+
+class NonceStore(Protocol):
+    """Backend interface; every API worker must share one backend to accept each other's nonces."""
+
+    def issue(self, address: str) -> str:
+        """Create a nonce for `address`."""
+        ...
+
+    def consume(self, address: str, nonce: str) -> bool:
+        """Atomically use up a nonce; False if unknown, expired, already used or for another address."""
+        ...
+
+
+class MemoryNonceStore:
+    """
+    Bounded in-process store for single-worker deployments.
+    Expiries sit in a min-heap, so purging touches only expired entries;
+    consume is one dict pop.
+    """
+
+    def __init__(self, ttl: float, max_entries: int = 100_000):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._nonces: Dict[str, Tuple[str, float]] = {}
+        self._expiries: List[Tuple[float, str]] = []
+
+    def __len__(self) -> int:
+        return len(self._nonces)
+
+    def _purge(self, now: float):
+        while self._expiries and (self._expiries[0][0] <= now or len(self._nonces) >= self.max_entries):
+            _, nonce = heapq.heappop(self._expiries)
+            self._nonces.pop(nonce, None)
+        # Consumed nonces leave their heap entry behind; rebuild once those dominate
+        if len(self._expiries) > 2 * len(self._nonces) + 1024:
+            self._expiries = [(expires, n) for n, (_, expires) in self._nonces.items()]
+            heapq.heapify(self._expiries)
+
+    def issue(self, address: str) -> str:
+        nonce = secrets.token_urlsafe(24)
+        now = time.monotonic()
+        with self._lock:
+            self._purge(now)
+            self._nonces[nonce] = (address, now + self.ttl)
+            heapq.heappush(self._expiries, (now + self.ttl, nonce))
+        return nonce
+
+    def consume(self, address: str, nonce: str) -> bool:
+        with self._lock:
+            entry = self._nonces.pop(nonce, None)
+        if entry is None:
+            return False
+        owner, expires = entry
+        return owner == address and time.monotonic() < expires
+
+
+class RedisNonceStore:
+    """Shared store for multi-worker deployments (requires the `redis` package)."""
+
+    def __init__(self, url: str, ttl: float, prefix: str = "campusnexus:nonce:"):
+        import redis
+
+        self.ttl = ttl
+        self.prefix = prefix
+        self._redis = redis.Redis.from_url(url)
+        # Fail on start-up rather than on the first login
+        self._redis.ping()
+
+    def issue(self, address: str) -> str:
+        nonce = secrets.token_urlsafe(24)
+        self._redis.set(self.prefix + nonce, address, px=int(self.ttl * 1000))
+        return nonce
+
+    def consume(self, address: str, nonce: str) -> bool:
+        # GETDEL is atomic, so two workers can never both accept the same nonce
+        owner = self._redis.getdel(self.prefix + nonce)
+        return owner is not None and owner.decode() == address
+
+
+_store: Optional[NonceStore] = None
+
+
+def get_nonce_store() -> NonceStore:
+    """Get the configured nonce store."""
+    global _store
+    if _store is None:
+        settings = get_settings()
+        if settings.auth_nonce_backend == "redis":
+            _store = RedisNonceStore(settings.auth_nonce_redis_url, settings.auth_nonce_ttl_seconds)
+        elif settings.auth_nonce_backend == "memory":
+            _store = MemoryNonceStore(settings.auth_nonce_ttl_seconds, settings.auth_nonce_max_entries)
+        else:
+            raise ValueError(f"Unknown nonce backend: {settings.auth_nonce_backend}")
+    return _store
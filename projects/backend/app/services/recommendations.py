@@ -0,0 +1,116 @@
+"""
+CampusNexus - Recommendation Cache
+Materialized top-k project recommendations per user, maintained incrementally
+so that repeated /api/ai/match calls read O(k) entries instead of re-ranking.
+The cache belongs to one version of projects.json and is started afresh when
+another worker changes the file.
+"""
+import bisect
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from app.config import get_settings
+from app.services.skills import SkillIds, jaccard, query_skill_ids, skill_ids
+from app.utils.database import get_projects_version
+
+
+class RecommendationCache:
+    """
+    Per-user top-k Jaccard matches, kept sorted best first.
+    Users are materialized lazily on their first read; afterwards a new
+    project only touches users that share a skill with it, and a profile
+    update only recomputes that one user.
+    """
+
+    def __init__(self, version: str, k: int = 20):
+        self.version = version
+        self.k = k
+        self._lock = threading.Lock()
+        # user_id -> [(-score, project_id)], ascending, so best matches come first
+        self._top: Dict[str, List[Tuple[float, int]]] = {}
+        self._skills: Dict[str, SkillIds] = {}
+        # Fields needed to answer a match request without reloading projects
+        self._projects: Dict[int, Dict] = {}
+
+    def _remember(self, project: Dict):
+        self._projects[project["id"]] = {
+            "id": project["id"],
+            "title": project.get("title"),
+            "skills_required": project.get("skills_required", []),
+        }
+
+    def refresh_user(self, user_id: str, skills: List[str], projects: List[Dict]):
+        """Recompute one user's top-k against the full catalogue."""
+        # Catalogue first, so the user's skills resolve against every stored skill
+        project_sets = [skill_ids(project.get("skills_required", [])) for project in projects]
+        user_skills = query_skill_ids(skills)
+        scored = []
+        for project, project_skills in zip(projects, project_sets):
+            score = jaccard(user_skills, project_skills)
+            if score > 0:
+                scored.append((-score, project["id"], project))
+        scored.sort(key=lambda x: (x[0], x[1]))
+        top = scored[:self.k]
+
+        with self._lock:
+            for _, _, project in top:
+                self._remember(project)
+            self._skills[user_id] = user_skills
+            self._top[user_id] = [(neg_score, pid) for neg_score, pid, _ in top]
+
+    def add_project(self, project: Dict, user_ids: Iterable[str]):
+        """Offer a new project to the given (skill-overlapping) users only."""
+        project_skills = skill_ids(project.get("skills_required", []))
+        with self._lock:
+            for user_id in user_ids:
+                top = self._top.get(user_id)
+                if top is None:
+                    continue  # Not materialized yet; the first read will include this project
+                score = jaccard(self._skills[user_id], project_skills)
+                entry = (-score, project["id"])
+                if score <= 0 or (len(top) >= self.k and entry >= top[-1]):
+                    continue
+                bisect.insort(top, entry)
+                del top[self.k:]
+                self._remember(project)
+
+    def forget(self, user_id: str):
+        with self._lock:
+            self._top.pop(user_id, None)
+            self._skills.pop(user_id, None)
+
+    def is_materialized(self, user_id: str) -> bool:
+        return user_id in self._top
+
+    def get(self, user_id: str, skills: List[str]) -> Optional[List[Dict]]:
+        """Cached matches for a user, or None if absent or computed for other skills."""
+        with self._lock:
+            top = self._top.get(user_id)
+            # Also misses once a previously unknown skill of the user becomes known
+            if top is None or self._skills[user_id] != query_skill_ids(skills):
+                return None
+            return [
+                {**self._projects[pid], "match_score": round(-neg_score * 100, 1)}  # Convert to percentage
+                for neg_score, pid in top
+            ]
+
+
+_cache: Optional[RecommendationCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_recommendation_cache(base_version: Optional[str] = None) -> RecommendationCache:
+    """
+    Get the process-wide recommendation cache for the current projects.json.
+    After a write by this worker, pass the version the write started from:
+    if the cache was built for it, it is kept (the caller updates it);
+    any other change to the file starts a fresh cache.
+    """
+    global _cache
+    version = get_projects_version()
+    with _cache_lock:
+        if _cache is not None and base_version is not None and _cache.version == base_version:
+            _cache.version = version
+        if _cache is None or _cache.version != version:
+            _cache = RecommendationCache(version, k=get_settings().ai_recommendations_k)
+        return _cache
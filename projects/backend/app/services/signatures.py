@@ -0,0 +1,111 @@
+"""
+CampusNexus - Wallet Signature Verification
+Verifies ed25519 wallet signatures off the event loop. Concurrent login
+requests are collected into small batches, and each batch is checked in
+one worker-thread hop. libsodium releases the GIL, so the threads really
+run in parallel.
+"""
+import asyncio
+import base64
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
+
+from algosdk import encoding
+from nacl.signing import VerifyKey
+
+from app.config import get_settings
+
+# Prefix the Algorand SDKs and wallets add to arbitrary signed bytes
+SIGN_BYTES_PREFIX = b"MX"
+
+Item = Tuple[str, str, str]
+
+
+def verify_signature(address: str, message: str, signature: str) -> bool:
+    """Synchronous check that `signature` over `message` was made by `address`."""
+    try:
+        public_key = encoding.decode_address(address)
+        signature_bytes = base64.b64decode(signature)
+        VerifyKey(public_key).verify(SIGN_BYTES_PREFIX + message.encode("utf-8"), signature_bytes)
+        return True
+    except Exception:
+        return False
+
+
+def verify_batch(items: List[Item]) -> List[bool]:
+    """Verify a batch in one call (runs on a worker thread)."""
+    return [verify_signature(*item) for item in items]
+
+
+class SignatureVerifier:
+    """
+    Micro-batching front end to a verification thread pool.
+    A batch is dispatched when it is full or `max_delay` seconds after its
+    first item arrived, whichever comes first.
+    """
+
+    def __init__(self, workers: int, max_batch: int = 64, max_delay: float = 0.002):
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="sigverify")
+        self._pending: List[Tuple[Item, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    async def verify(self, address: str, message: str, signature: str) -> bool:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append(((address, message, signature), future))
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_delay, self._flush)
+        return await future
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if batch:
+            asyncio.ensure_future(self._run(batch))
+
+    async def _run(self, batch: List[Tuple[Item, asyncio.Future]]):
+        loop = asyncio.get_running_loop()
+        try:
+            results = await loop.run_in_executor(self._executor, verify_batch, [item for item, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), ok in zip(batch, results):
+            if not future.done():
+                future.set_result(ok)
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+_verifier: Optional[SignatureVerifier] = None
+
+
+def get_signature_verifier() -> SignatureVerifier:
+    """Get the process-wide verifier, starting its threads on first use."""
+    global _verifier
+    if _verifier is None:
+        settings = get_settings()
+        _verifier = SignatureVerifier(
+            workers=settings.auth_verify_workers or os.cpu_count() or 1,
+            max_batch=settings.auth_verify_batch_size,
+            max_delay=settings.auth_verify_batch_delay_ms / 1000,
+        )
+    return _verifier
+
+
+def shutdown_signature_verifier():
+    """Stop the verification threads (called on application shutdown)."""
+    global _verifier
+    if _verifier is not None:
+        _verifier.shutdown()
+        _verifier = None
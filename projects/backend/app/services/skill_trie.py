@@ -0,0 +1,123 @@
+"""
+CampusNexus - Skill Autocomplete
+Prefix trie over canonical skill names, ranked by how often each skill
+appears in projects and user profiles. Kept current on this worker's writes
+and rebuilt when another worker changes projects.json or users.json.
+"""
+import heapq
+import threading
+from typing import Dict, List, Optional, Set, Tuple
+
+from app.services.skills import SkillIds, get_skill_registry, skill_ids
+from app.utils.database import get_projects_version, get_users_version, load_projects, load_users
+
+
+class _Node:
+    __slots__ = ("children", "count", "top")
+
+    def __init__(self):
+        self.children: Dict[str, "_Node"] = {}
+        self.count = 0
+        # Best (count, name) pairs in this subtree, so a lookup never walks below the prefix
+        self.top: List[Tuple[int, str]] = []
+
+
+def _rank_key(item: Tuple[int, str]) -> Tuple[int, str]:
+    return -item[0], item[1]
+
+
+class SkillTrie:
+    """
+    Frequency-ranked prefix trie.
+    Every node caches the top suggestions of its subtree; a count change
+    only refreshes the nodes on that skill's path, and a lookup is a walk
+    of len(prefix) nodes followed by a slice.
+    """
+
+    def __init__(self, version: Tuple[str, str] = ("", ""), top_n: int = 20):
+        # (projects.json, users.json) versions the trie reflects
+        self.version = version
+        self.top_n = top_n
+        self._root = _Node()
+        self._lock = threading.Lock()
+        # What has been counted already, so replays of the same write are no-ops
+        self._projects: Set[int] = set()
+        self._users: Dict[str, SkillIds] = {}
+
+    def _bump(self, name: str, delta: int):
+        path = [self._root]
+        node = self._root
+        for ch in name:
+            node = node.children.setdefault(ch, _Node())
+            path.append(node)
+        node.count = max(0, node.count + delta)
+
+        for depth in range(len(path) - 1, -1, -1):
+            node = path[depth]
+            candidates = [(node.count, name[:depth])] if node.count else []
+            for child in node.children.values():
+                candidates.extend(child.top)
+            node.top = heapq.nsmallest(self.top_n, candidates, key=_rank_key)
+
+    def add_project(self, project_id: int, skills: List[str]):
+        """Count a project's skills once."""
+        registry = get_skill_registry()
+        with self._lock:
+            if project_id in self._projects:
+                return
+            self._projects.add(project_id)
+            for skill_id in skill_ids(skills):
+                self._bump(registry.name(skill_id), 1)
+
+    def set_user_skills(self, user_id: str, skills: List[str]):
+        """Replace a user's contribution, adjusting only the skills that changed."""
+        registry = get_skill_registry()
+        new_ids = skill_ids(skills)
+        with self._lock:
+            old_ids = self._users.get(user_id, frozenset())
+            for skill_id in old_ids - new_ids:
+                self._bump(registry.name(skill_id), -1)
+            for skill_id in new_ids - old_ids:
+                self._bump(registry.name(skill_id), 1)
+            self._users[user_id] = new_ids
+
+    def suggest(self, prefix: str, limit: int = 10) -> List[Tuple[str, int]]:
+        """Most frequent skills starting with prefix, as (name, count) pairs."""
+        node = self._root
+        for ch in " ".join(prefix.lower().split()):
+            node = node.children.get(ch)
+            if node is None:
+                return []
+        return [(name, count) for count, name in node.top[:limit]]
+
+
+def _build_trie(version: Tuple[str, str]) -> SkillTrie:
+    trie = SkillTrie(version)
+    for project in load_projects():
+        trie.add_project(project.get("id"), project.get("skills_required", []))
+    for user in load_users():
+        trie.set_user_skills(user.get("id"), user.get("skills") or [])
+    return trie
+
+
+_trie: Optional[SkillTrie] = None
+_trie_lock = threading.Lock()
+
+
+def get_skill_trie(projects_base: Optional[str] = None, users_base: Optional[str] = None) -> SkillTrie:
+    """
+    Get the process-wide skill trie for the current projects.json and
+    users.json. After a write by this worker, pass the version of the file
+    it started from: a trie that was current apart from that write is kept
+    (the caller updates it), any other change rebuilds the trie.
+    """
+    global _trie
+    version = (get_projects_version(), get_users_version())
+    with _trie_lock:
+        if _trie is not None and (projects_base or users_base):
+            expected = (projects_base or version[0], users_base or version[1])
+            if _trie.version == expected:
+                _trie.version = version
+        if _trie is None or _trie.version != version:
+            _trie = _build_trie(version)
+        return _trie
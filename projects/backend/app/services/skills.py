@@ -0,0 +1,136 @@
+"""
+CampusNexus - Skill Taxonomy
+Interns free-text skills into canonical names with compact integer ids, so
+skill comparisons across matching, feeds and indexes are integer operations.
+"""
+import threading
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Optional
+
+# Alias -> canonical skill name (both lower-case)
+SKILL_ALIASES: Dict[str, str] = {
+    "js": "javascript",
+    "es6": "javascript",
+    "ts": "typescript",
+    "py": "python",
+    "python3": "python",
+    "reactjs": "react",
+    "react.js": "react",
+    "react js": "react",
+    "nodejs": "node.js",
+    "node": "node.js",
+    "node js": "node.js",
+    "vuejs": "vue",
+    "vue.js": "vue",
+    "nextjs": "next.js",
+    "ml": "machine learning",
+    "dl": "deep learning",
+    "ai": "artificial intelligence",
+    "nlp": "natural language processing",
+    "cv": "computer vision",
+    "golang": "go",
+    "k8s": "kubernetes",
+    "postgres": "postgresql",
+    "mongo": "mongodb",
+    "ui/ux": "ui ux design",
+    "ux": "ui ux design",
+    "ui": "ui ux design",
+}
+
+SkillIds = FrozenSet[int]
+
+
+class SkillRegistry:
+    """
+    Canonicalizes skills and assigns dense integer ids in first-seen order.
+    Ids are process-local; persisted data keeps the original skill strings.
+    """
+
+    def __init__(self, aliases: Optional[Dict[str, str]] = None):
+        self._aliases = aliases if aliases is not None else SKILL_ALIASES
+        self._lock = threading.Lock()
+        self._id_of: Dict[str, int] = {}
+        # Raw spelling -> id, so repeated strings skip lower()/strip()/alias lookup
+        self._raw: Dict[str, int] = {}
+        self.names: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def canonical(self, skill: str) -> str:
+        """Canonical, lower-case name of a skill."""
+        name = " ".join(skill.lower().split())
+        return self._aliases.get(name, name)
+
+    def intern(self, skill: str) -> int:
+        """Id of a skill, assigning a new one on first sight."""
+        skill_id = self._raw.get(skill)
+        if skill_id is not None:
+            return skill_id
+
+        name = self.canonical(skill)
+        with self._lock:
+            skill_id = self._id_of.get(name)
+            if skill_id is None:
+                skill_id = len(self.names)
+                self._id_of[name] = skill_id
+                self.names.append(name)
+            self._raw[skill] = skill_id
+        return skill_id
+
+    def lookup(self, skill: str) -> Optional[int]:
+        """Id of a skill if it has been seen before, without interning it."""
+        skill_id = self._raw.get(skill)
+        if skill_id is None:
+            skill_id = self._id_of.get(self.canonical(skill))
+        return skill_id
+
+    def ids(self, skills: Iterable[str]) -> SkillIds:
+        """Interned id set of a skill list; blank entries are ignored."""
+        return frozenset(self.intern(s) for s in skills if s and s.strip())
+
+    def query_ids(self, skills: Iterable[str]) -> SkillIds:
+        """
+        Id set of an untrusted skill list, without interning anything.
+        Each distinct unknown skill gets a negative placeholder id (-1, -2,
+        ...): it never matches a stored skill but still counts toward set
+        sizes, so Jaccard scores equal those of interned ids.
+        """
+        known = set()
+        unknown = set()
+        for skill in skills:
+            if not skill or not skill.strip():
+                continue
+            skill_id = self.lookup(skill)
+            if skill_id is None:
+                unknown.add(self.canonical(skill))
+            else:
+                known.add(skill_id)
+        known.update(-1 - i for i in range(len(unknown)))
+        return frozenset(known)
+
+    def name(self, skill_id: int) -> str:
+        return self.names[skill_id]
+
+
+@lru_cache
+def get_skill_registry() -> SkillRegistry:
+    """Get the process-wide skill registry."""
+    return SkillRegistry()
+
+
+def skill_ids(skills: Iterable[str]) -> SkillIds:
+    """Interned id set of a skill list using the process-wide registry (stored data only)."""
+    return get_skill_registry().ids(skills)
+
+
+def query_skill_ids(skills: Iterable[str]) -> SkillIds:
+    """Non-interning id set of request-supplied skills (see SkillRegistry.query_ids)."""
+    return get_skill_registry().query_ids(skills)
+
+
+def jaccard(a: SkillIds, b: SkillIds) -> float:
+    """Jaccard similarity of two skill id sets."""
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
@@ -0,0 +1,95 @@
+"""
+CampusNexus - User Skill Index
+In-memory index of student skills used to recommend freelancers for a project.
+Built from users.json, kept current on this worker's profile updates and
+rebuilt when another worker changes the file.
+"""
+import threading
+from collections import defaultdict
+from typing import Dict, List, Optional, Set
+
+import numpy as np
+
+from app.services.embeddings import Encoder, skills_text
+from app.services.skills import SkillIds, query_skill_ids, skill_ids
+from app.utils.database import get_users_version, load_users
+
+
+class UserSkillIndex:
+    """
+    Inverted index from skill id to user ids, plus the public profile
+    fields needed to render a candidate without reloading users.
+    """
+
+    def __init__(self, version: str, users: List[Dict]):
+        self.version = version
+        self._lock = threading.Lock()
+        self.skills: Dict[str, List[str]] = {}
+        self.skill_ids: Dict[str, SkillIds] = {}
+        self.profiles: Dict[str, Dict] = {}
+        self._by_skill: Dict[int, Set[str]] = defaultdict(set)
+        self._vectors: Dict[str, np.ndarray] = {}
+        for user in users:
+            self.update(user)
+
+    def update(self, user: Dict):
+        """Insert or replace a user's skills and profile summary."""
+        user_id = user.get("id")
+        skills = user.get("skills") or []
+        with self._lock:
+            for skill in self.skill_ids.get(user_id, ()):
+                self._by_skill[skill].discard(user_id)
+            self._vectors.pop(user_id, None)
+
+            ids = skill_ids(skills)
+            self.skills[user_id] = skills
+            self.skill_ids[user_id] = ids
+            self.profiles[user_id] = {
+                "id": user_id,
+                "name": user.get("name"),
+                "avatar": user.get("avatar"),
+            }
+            for skill in ids:
+                self._by_skill[skill].add(user_id)
+
+    def candidates(self, skills: List[str]) -> Set[str]:
+        """Users sharing at least one skill, i.e. every user with a Jaccard score above zero."""
+        found: Set[str] = set()
+        for skill in query_skill_ids(skills):
+            found.update(self._by_skill.get(skill, ()))
+        return found
+
+    def vectors(self, encoder: Encoder) -> tuple[List[str], Optional[np.ndarray]]:
+        """Embeddings of every user with skills, encoding only those not cached yet."""
+        with self._lock:
+            missing = [uid for uid, skills in self.skills.items() if skills and uid not in self._vectors]
+        if missing:
+            encoded = encoder.encode([skills_text(self.skills[uid]) for uid in missing])
+            with self._lock:
+                self._vectors.update(zip(missing, encoded))
+
+        user_ids = [uid for uid, skills in self.skills.items() if skills and uid in self._vectors]
+        if not user_ids:
+            return [], None
+        return user_ids, np.stack([self._vectors[uid] for uid in user_ids])
+
+
+_index: Optional[UserSkillIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_user_index(base_version: Optional[str] = None) -> UserSkillIndex:
+    """
+    Get the process-wide user skill index for the current users.json.
+    After a profile update by this worker, pass the version the write
+    started from: an index built for it is kept (the caller updates it),
+    any other change to the file rebuilds the index.
+    """
+    global _index
+    version = get_users_version()
+    with _index_lock:
+        if _index is not None and base_version is not None and _index.version == base_version:
+            _index.version = version
+        if _index is None or _index.version != version:
+            _index = UserSkillIndex(version, load_users())
+        return _index
@@ -126,6 +126,27 @@ def update_user_profile(user_id: str, updates: Dict) -> Optional[User]:
     return None
 
 
+def get_users_version() -> str:
+    """Cheap change marker for users.json (modification time and size)."""
+    ensure_db_exists()
+    stat = DB_FILE.stat()
+    return f"{stat.st_mtime_ns}-{stat.st_size}"
+
+
+# (version, id -> user) built from the last users.json read by find_user_by_id
+_users_by_id: tuple = ("", {})
+
+
+def find_user_by_id(user_id: str) -> Optional[User]:
+    """Find a user by ID (dict lookup; users.json is re-read only after it changes)."""
+    global _users_by_id
+    version = get_users_version()
+    if _users_by_id[0] != version:
+        _users_by_id = (version, {u.get("id"): u for u in load_users()})
+    user_data = _users_by_id[1].get(user_id)
+    return User(**user_data) if user_data else None
+
+
 def get_all_users() -> List[User]:
     """Get all users (for admin purposes)."""
     users = load_users()
@@ -197,6 +218,16 @@ def create_project(project_data: Dict) -> Dict:
     return new_project
 
 
+def get_projects_version() -> str:
+    """
+    Cheap version tag of the projects database (mtime and size), used by
+    in-memory caches to notice writes, including those of other workers.
+    """
+    ensure_projects_db_exists()
+    stat = PROJECTS_DB_FILE.stat()
+    return f"{stat.st_mtime_ns}-{stat.st_size}"
+
+
 def get_all_projects() -> List[Dict]:
     """Get all projects."""
     return load_projects()
@@ -0,0 +1 @@
+"""CampusNexus Backend Benchmarks"""
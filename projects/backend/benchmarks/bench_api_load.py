@@ -0,0 +1,99 @@
+"""
+CampusNexus - Offline API Load Benchmark
+Drives the FastAPI app in-process against the fake algod/indexer, so the
+numbers measure our own code rather than testnet. Each virtual user runs
+the wallet login flow (nonce, signed verify, /me) and then reads its feed.
+User records go to a temporary users.json, not the real data file, and
+the chain sync and escrow reconciliation jobs are turned off so they neither
+compete for the loop nor write to data/.
+
+Usage (from projects/backend):
+    python -m benchmarks.bench_api_load --users 500 --concurrency 50 --node-latency-ms 20
+"""
+import argparse
+import asyncio
+import os
+import shutil
+import tempfile
+import time
+from collections import defaultdict
+from pathlib import Path
+
+
+def percentile(samples: list[float], p: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(p * len(ordered)))] * 1000
+
+
+async def run(args):
+    import httpx
+    from algosdk import account, util
+
+    from app.main import app
+    from app.utils import database
+
+    latencies = defaultdict(list)
+
+    async def timed(name: str, call):
+        started = time.perf_counter()
+        response = await call
+        latencies[name].append(time.perf_counter() - started)
+        response.raise_for_status()
+        return response.json()
+
+    async def virtual_user(client: httpx.AsyncClient, private_key: str, address: str):
+        challenge = await timed("nonce", client.get(f"/api/auth/nonce/{address}"))
+        signature = util.sign_bytes(challenge["message"].encode(), private_key)
+        await timed("verify", client.post("/api/auth/verify", json={
+            "address": address, "message": challenge["message"], "signature": signature,
+        }))
+        await timed("me", client.get("/api/auth/me", params={"address": address}))
+        await timed("feed", client.get("/api/feed/for-you", params={"skills": ["python", "react"]}))
+
+    wallets = [account.generate_account() for _ in range(args.users)]
+    queue = iter(wallets)
+
+    async def worker(client):
+        for private_key, address in queue:
+            await virtual_user(client, private_key, address)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        users_file = Path(tmp) / "users.json"
+        if database.DB_FILE.exists():
+            shutil.copy(database.DB_FILE, users_file)
+        database.DB_FILE = users_file
+
+        async with app.router.lifespan_context(app):
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+                started = time.perf_counter()
+                await asyncio.gather(*[worker(client) for _ in range(args.concurrency)])
+                elapsed = time.perf_counter() - started
+
+    total = sum(len(samples) for samples in latencies.values())
+    print(f"{args.users} users, {args.concurrency} concurrent, node latency {args.node_latency_ms} ms")
+    print(f"{total} requests in {elapsed:.2f} s = {total / elapsed:.0f} req/s, {args.users / elapsed:.1f} logins/s\n")
+    print(f"{'endpoint':<8} {'count':>6} {'p50 ms':>8} {'p95 ms':>8}")
+    for name, samples in latencies.items():
+        print(f"{name:<8} {len(samples):>6} {percentile(samples, 0.5):>8.2f} {percentile(samples, 0.95):>8.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--node-latency-ms", type=float, default=0.0)
+    parser.add_argument("--node-failure-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    # Settings are read once at import, so the fake node must be selected first
+    os.environ["ALGORAND_FAKE_NODE"] = "true"
+    os.environ["ALGORAND_FAKE_LATENCY_MS"] = str(args.node_latency_ms)
+    os.environ["ALGORAND_FAKE_FAILURE_RATE"] = str(args.node_failure_rate)
+    os.environ["CHAIN_SYNC_ENABLED"] = "false"
+    os.environ["ESCROW_RECONCILE_ENABLED"] = "false"
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+CampusNexus - Wallet Login Signature Benchmark
+Measures signature verifications per second when done inline on the event
+loop versus through the micro-batching verifier pool at several worker
+counts, simulating a burst of concurrent wallet logins.
+
+Usage (from projects/backend):
+    python -m benchmarks.bench_signatures --logins 20000 --workers 1 2 4
+"""
+import argparse
+import asyncio
+import base64
+import time
+
+from algosdk import account, encoding
+from nacl.signing import SigningKey
+
+from app.services.signatures import SIGN_BYTES_PREFIX, SignatureVerifier, verify_signature
+
+
+def make_logins(count: int, accounts: int) -> list[tuple[str, str, str]]:
+    """Signed login messages from a handful of synthetic wallets."""
+    keys = []
+    for _ in range(accounts):
+        private_key, address = account.generate_account()
+        keys.append((SigningKey(base64.b64decode(private_key)[:32]), address))
+    logins = []
+    for i in range(count):
+        signing_key, address = keys[i % accounts]
+        message = f"Sign this message to authenticate with CampusNexus\nAddress: {address}\nNonce: {i}"
+        signature = signing_key.sign(SIGN_BYTES_PREFIX + message.encode()).signature
+        logins.append((address, message, base64.b64encode(signature).decode()))
+    return logins
+
+
+async def run_inline(logins) -> float:
+    start = time.perf_counter()
+    results = [verify_signature(*login) for login in logins]
+    assert all(results)
+    return time.perf_counter() - start
+
+
+async def run_pool(logins, workers: int, batch: int, delay_ms: float, concurrency: int) -> float:
+    verifier = SignatureVerifier(workers, max_batch=batch, max_delay=delay_ms / 1000)
+    queue = iter(logins)
+
+    async def client():
+        for login in queue:
+            assert await verifier.verify(*login)
+
+    start = time.perf_counter()
+    await asyncio.gather(*[client() for _ in range(concurrency)])
+    elapsed = time.perf_counter() - start
+    verifier.shutdown()
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--logins", type=int, default=20000)
+    parser.add_argument("--accounts", type=int, default=100)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--batch", type=int, default=64)
+    parser.add_argument("--delay-ms", type=float, default=2.0)
+    parser.add_argument("--concurrency", type=int, default=256, help="Logins in flight at once")
+    args = parser.parse_args()
+
+    logins = make_logins(args.logins, args.accounts)
+    assert encoding.is_valid_address(logins[0][0])
+    print(f"{len(logins)} logins, {args.concurrency} in flight, batch {args.batch}, delay {args.delay_ms} ms\n")
+    print(f"{'mode':<10} {'workers':>7} {'logins/s':>10} {'per core':>10}")
+
+    elapsed = asyncio.run(run_inline(logins))
+    print(f"{'inline':<10} {1:>7} {len(logins) / elapsed:>10.0f} {len(logins) / elapsed:>10.0f}")
+
+    for workers in args.workers:
+        elapsed = asyncio.run(run_pool(logins, workers, args.batch, args.delay_ms, args.concurrency))
+        rate = len(logins) / elapsed
+        print(f"{'pool':<10} {workers:>7} {rate:>10.0f} {rate / workers:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+from collections.abc import Iterator
+
+import pytest
+
+from app.services.ai_matching import rank_projects
+from app.services.recommendations import RecommendationCache
+from app.services.skills import get_skill_registry
+
+PROJECTS = [
+    {"id": 1, "title": "API", "skills_required": ["Python", "FastAPI"]},
+    {"id": 2, "title": "Dashboard", "skills_required": ["ReactJS", "TypeScript"]},
+    {"id": 3, "title": "Branding", "skills_required": ["Figma"]},
+]
+
+
+@pytest.fixture(autouse=True)
+def fresh_registry() -> Iterator[None]:
+    # A new worker: no skill has been interned yet
+    get_skill_registry.cache_clear()
+    yield
+    get_skill_registry.cache_clear()
+
+
+def test_rank_projects_on_fresh_registry() -> None:
+    ranked = rank_projects(["python", "react"], PROJECTS, mode="jaccard")
+
+    assert [(p["id"], p["match_score"]) for p in ranked] == [(1, 33.3), (2, 33.3)]
+
+
+def test_rank_projects_does_not_intern_request_skills() -> None:
+    rank_projects(["python", "cobol"], PROJECTS, mode="jaccard")
+
+    assert get_skill_registry().lookup("cobol") is None
+    assert len(get_skill_registry()) == 5
+
+
+def test_unknown_request_skills_count_toward_score() -> None:
+    ranked = rank_projects(["python", "cobol"], PROJECTS, mode="jaccard")
+
+    # |{python}| / |{python, fastapi, cobol}|
+    assert [(p["id"], p["match_score"]) for p in ranked] == [(1, 33.3)]
+
+
+def test_recommendations_on_fresh_registry() -> None:
+    cache = RecommendationCache("v1", k=5)
+
+    cache.refresh_user("u1", ["py"], PROJECTS)
+
+    assert [(p["id"], p["match_score"]) for p in cache.get("u1", ["py"])] == [(1, 50.0)]
@@ -0,0 +1,53 @@
+import time
+
+import pytest
+from fastapi import HTTPException
+from jose import jwt
+
+from app.config import get_settings
+from app.services.auth_tokens import TokenCache, decode_access_token
+
+
+@pytest.fixture()
+def now(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    current = [1_700_000_000.0]
+    monkeypatch.setattr(time, "time", lambda: current[0])
+    return current
+
+
+def test_cached_claims_are_served_until_exp(now: list[float]) -> None:
+    cache = TokenCache()
+    cache.put(b"k", {"sub": "u1", "exp": now[0] + 60})
+
+    assert cache.get(b"k") == {"sub": "u1", "exp": now[0] + 60}
+    now[0] += 60
+    assert cache.get(b"k") is None
+
+
+def test_least_recently_used_token_is_evicted(now: list[float]) -> None:
+    cache = TokenCache(max_entries=2)
+    for key in (b"a", b"b"):
+        cache.put(key, {"sub": key.decode(), "exp": now[0] + 60})
+
+    cache.get(b"a")
+    cache.put(b"c", {"sub": "c", "exp": now[0] + 60})
+
+    assert cache.get(b"b") is None
+    assert cache.get(b"a") is not None
+    assert cache.get(b"c") is not None
+
+
+def _token(exp: float) -> str:
+    settings = get_settings()
+    return jwt.encode({"sub": "u1", "exp": int(exp)}, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)
+
+
+def test_decode_access_token() -> None:
+    assert decode_access_token(_token(time.time() + 60))["sub"] == "u1"
+
+
+def test_expired_token_is_rejected() -> None:
+    with pytest.raises(HTTPException) as error:
+        decode_access_token(_token(time.time() - 1))
+
+    assert error.value.status_code == 401
@@ -0,0 +1,138 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from app.services.fake_algod import create_fake_algod
+from app.services.node_pool import Endpoint, NodePool, NodeUnavailable
+
+
+def fake_node(name: str, latency_ms: float = 0.0, failure_rate: float = 0.0) -> httpx.AsyncClient:
+    app = create_fake_algod(latency_ms=latency_ms, failure_rate=failure_rate)
+    return httpx.AsyncClient(base_url=f"http://{name}", transport=httpx.ASGITransport(app=app))
+
+
+def test_requests_go_to_the_fastest_node() -> None:
+    async def run() -> NodePool:
+        pool = NodePool([fake_node("slow", latency_ms=30), fake_node("fast")], min_hedge_delay=1.0)
+        for _ in range(5):
+            await pool.get("/v2/status")
+        return pool
+
+    pool = asyncio.run(run())
+
+    slow, fast = pool.endpoints
+    # Both are measured once (no samples yet goes first), then the faster one takes the rest
+    assert fast.ewma < slow.ewma
+    assert slow.requests == 1
+    assert fast.requests == 4
+
+
+def test_slow_primary_loses_the_hedge() -> None:
+    async def run() -> tuple[NodePool, float]:
+        pool = NodePool([fake_node("slow", latency_ms=300), fake_node("fast")], min_hedge_delay=0.02)
+        slow, fast = pool.endpoints
+        # The slow node looks fastest from its history, so it is tried first
+        slow.ewma, fast.ewma = 0.001, 0.002
+        started = time.perf_counter()
+        response = await pool.get("/v2/status")
+        assert response.status_code == 200
+        return pool, time.perf_counter() - started
+
+    pool, elapsed = asyncio.run(run())
+
+    slow, fast = pool.endpoints
+    assert fast.hedges_won == 1
+    assert slow.requests == fast.requests == 1
+    assert elapsed < 0.25
+
+
+def test_hedge_delay_follows_p95() -> None:
+    pool = NodePool([fake_node("a")], min_hedge_delay=0.01)
+    endpoint = pool.endpoints[0]
+
+    # Unknown latency, then 3 x EWMA, then the node's own p95 once it has enough samples
+    assert pool.hedge_delay(endpoint) == 0.25
+    endpoint.record_success(0.02)
+    assert pool.hedge_delay(endpoint) == pytest.approx(0.06)
+    for i in range(100):
+        endpoint.record_success(0.001 * (i + 1))
+    assert pool.hedge_delay(endpoint) == pytest.approx(0.095)
+
+
+def test_failed_node_fails_over() -> None:
+    async def run() -> NodePool:
+        pool = NodePool([fake_node("broken", failure_rate=1.0), fake_node("ok")], min_hedge_delay=1.0)
+        response = await pool.get("/v2/status")
+        assert response.status_code == 200
+        return pool
+
+    pool = asyncio.run(run())
+
+    broken, ok = pool.endpoints
+    assert broken.failures == 1
+    assert ok.requests == 1
+
+
+def test_all_nodes_failing_raises() -> None:
+    pool = NodePool([fake_node("broken", failure_rate=1.0)])
+
+    with pytest.raises(NodeUnavailable):
+        asyncio.run(pool.get("/v2/status"))
+
+
+def test_breaker_opens_and_recovers_through_one_half_open_trial() -> None:
+    async def run() -> Endpoint:
+        pool = NodePool(
+            [fake_node("flaky", failure_rate=1.0), fake_node("backup", latency_ms=5)],
+            min_hedge_delay=1.0,
+            failure_threshold=2,
+            cooldown=0.05,
+        )
+        flaky, backup = pool.endpoints
+        flaky.ewma, backup.ewma = 0.001, 0.002
+
+        # Two failures open the breaker; the node is then skipped
+        for _ in range(2):
+            await pool.get("/v2/status")
+        assert flaky.stats()["circuit"] == "open"
+        await pool.get("/v2/status")
+        assert flaky.requests == 2
+
+        # The node heals; once cooled down, concurrent requests send it a single trial
+        flaky.client = fake_node("flaky", latency_ms=20)
+        await asyncio.sleep(0.06)
+        await asyncio.gather(*[pool.get("/v2/status") for _ in range(5)])
+        assert flaky.requests == 3
+        assert flaky.stats()["circuit"] == "closed"
+        assert not flaky.half_open_inflight
+
+        # Closed again: it takes traffic as the fastest node
+        await pool.get("/v2/status")
+        assert flaky.requests == 4
+        return flaky
+
+    asyncio.run(run())
+
+
+def test_failed_half_open_trial_reopens_the_breaker() -> None:
+    async def run() -> Endpoint:
+        pool = NodePool(
+            [fake_node("broken", failure_rate=1.0), fake_node("backup")],
+            failure_threshold=1,
+            cooldown=0.05,
+        )
+        broken, backup = pool.endpoints
+        broken.ewma, backup.ewma = 0.001, 0.002
+        await pool.get("/v2/status")
+        await asyncio.sleep(0.06)
+
+        await pool.get("/v2/status")
+        return broken
+
+    broken = asyncio.run(run())
+
+    assert broken.requests == 2
+    assert broken.stats()["circuit"] == "open"
+    assert not broken.half_open_inflight
@@ -0,0 +1,70 @@
+import time
+
+import pytest
+
+from app.services.nonce_store import MemoryNonceStore
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture()
+def clock(monkeypatch: pytest.MonkeyPatch) -> Clock:
+    clock = Clock()
+    monkeypatch.setattr(time, "monotonic", clock)
+    return clock
+
+
+def test_nonce_is_single_use(clock: Clock) -> None:
+    store = MemoryNonceStore(ttl=60)
+    nonce = store.issue("ADDR")
+
+    assert store.consume("ADDR", nonce)
+    assert not store.consume("ADDR", nonce)
+
+
+def test_nonce_is_bound_to_its_address(clock: Clock) -> None:
+    store = MemoryNonceStore(ttl=60)
+    nonce = store.issue("ADDR")
+
+    assert not store.consume("OTHER", nonce)
+    # A wrong-address attempt still uses the nonce up
+    assert not store.consume("ADDR", nonce)
+
+
+def test_nonce_expires(clock: Clock) -> None:
+    store = MemoryNonceStore(ttl=60)
+    nonce = store.issue("ADDR")
+
+    clock.now += 60
+
+    assert not store.consume("ADDR", nonce)
+
+
+def test_expired_nonces_are_purged_on_issue(clock: Clock) -> None:
+    store = MemoryNonceStore(ttl=60)
+    for _ in range(10):
+        store.issue("ADDR")
+
+    clock.now += 61
+    store.issue("ADDR")
+
+    assert len(store) == 1
+
+
+def test_store_is_bounded(clock: Clock) -> None:
+    store = MemoryNonceStore(ttl=60, max_entries=3)
+    nonces = []
+    for _ in range(5):
+        nonces.append(store.issue("ADDR"))
+        clock.now += 1
+
+    assert len(store) <= 3
+    # The oldest challenges make room for new ones
+    assert not store.consume("ADDR", nonces[0])
+    assert store.consume("ADDR", nonces[-1])
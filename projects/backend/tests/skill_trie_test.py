@@ -0,0 +1,44 @@
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from app.services import skill_trie
+from app.services.skill_trie import get_skill_trie
+from app.utils import database
+
+
+@pytest.fixture(autouse=True)
+def data_files(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    monkeypatch.setattr(database, "DB_FILE", tmp_path / "users.json")
+    monkeypatch.setattr(database, "PROJECTS_DB_FILE", tmp_path / "projects.json")
+    monkeypatch.setattr(skill_trie, "_trie", None)
+    database.save_projects([{"id": 1, "skills_required": ["Python"]}])
+    database.save_users([{"id": "u1", "skills": ["Python", "Rust"]}])
+    yield
+
+
+def test_trie_is_built_from_projects_and_users() -> None:
+    assert get_skill_trie().suggest("p") == [("python", 2)]
+    assert get_skill_trie().suggest("r") == [("rust", 1)]
+
+
+def test_trie_rebuilds_after_another_worker_writes() -> None:
+    trie = get_skill_trie()
+
+    # Written by another worker: this one never calls add_project
+    database.save_projects([{"id": 1, "skills_required": ["Python"]}, {"id": 2, "skills_required": ["Pandas"]}])
+
+    assert get_skill_trie() is not trie
+    assert get_skill_trie().suggest("pa") == [("pandas", 1)]
+
+
+def test_trie_is_kept_across_own_writes() -> None:
+    trie = get_skill_trie()
+    base = database.get_projects_version()
+
+    database.save_projects([{"id": 1, "skills_required": ["Python"]}, {"id": 2, "skills_required": ["Pandas"]}])
+    get_skill_trie(projects_base=base).add_project(2, ["Pandas"])
+
+    assert get_skill_trie() is trie
+    assert trie.suggest("pa") == [("pandas", 1)]
@@ -0,0 +1 @@
+"""CampusNexus Contract Benchmarks"""
@@ -0,0 +1,186 @@
+"""
+CampusNexus - Batch Release Benchmark
+Compares releasing N milestones of one MultiMilestoneEscrow escrow with N
+release_payment calls (N inner payments) against one release_milestones
+call (one inner payment). Both paths are run through algod's simulate
+endpoint on the same freshly funded escrow, which reports the opcode budget
+consumed; fees are what each group must pay with fee pooling.
+
+Batch release lives on the box-backed MultiMilestoneEscrow, which tracks
+each milestone; the single-escrow MilestoneEscrow keeps its one-amount
+release_payment, whose ABI the backend depends on.
+
+Needs LocalNet and the built contract (from projects/contracts):
+    algokit localnet start
+    algokit project run build -- multi_escrow
+    poetry run python -m benchmarks.bench_batch_release --milestones 1 4 8 16
+
+Fees follow from the transactions built (min fee 1000 uA, one extra fee per
+inner payment), so they do not depend on the run:
+
+    milestones  per-call txns / fee uA   batched txns / fee uA
+             1              1 / 2000                 1 / 2000
+             4              4 / 8000                 1 / 2000
+             8              8 / 16000                1 / 2000
+            16             16 / 32000                1 / 2000
+
+Opcode budget (app-budget-consumed) per path is reported by the run above;
+add it to this table from a LocalNet run of the built contract.
+"""
+import argparse
+import base64
+import json
+from collections.abc import Sequence
+from pathlib import Path
+
+from algokit_utils import AlgorandClient, SigningAccount
+from algosdk import abi, account, logic, transaction
+from algosdk.atomic_transaction_composer import (
+    AccountTransactionSigner,
+    AtomicTransactionComposer,
+    TransactionWithSigner,
+)
+
+SPEC_FILE = (
+    Path(__file__).parent.parent / "smart_contracts" / "artifacts" / "multi_escrow" / "MultiMilestoneEscrow.arc56.json"
+)
+
+MILESTONE_AMOUNT = 1_000_000
+# Box MBR: 2500 + 400 * (key + value bytes); key "e" + uint64 id, value 108 bytes + 8 per milestone
+BOX_MBR_BASE = 2_500 + 400 * (9 + 108)
+BOX_MBR_PER_MILESTONE = 400 * 8
+# A group holds at most 16 transactions
+MAX_GROUP_SIZE = 16
+
+
+class Escrows:
+    """One deployed MultiMilestoneEscrow app, driven with plain algosdk transactions."""
+
+    def __init__(self, algorand: AlgorandClient, sender: SigningAccount, spec: dict):
+        self.algod = algorand.client.algod
+        self.sender = sender.address
+        self.signer = AccountTransactionSigner(sender.private_key)
+        self.contract = abi.Contract.from_json(json.dumps(spec))
+
+        schema = spec["state"]["schema"]
+        params = self.algod.suggested_params()
+        create = transaction.ApplicationCreateTxn(
+            self.sender,
+            params,
+            transaction.OnComplete.NoOpOC,
+            approval_program=base64.b64decode(spec["byteCode"]["approval"]),
+            clear_program=base64.b64decode(spec["byteCode"]["clear"]),
+            global_schema=transaction.StateSchema(schema["global"]["ints"], schema["global"]["bytes"]),
+            local_schema=transaction.StateSchema(schema["local"]["ints"], schema["local"]["bytes"]),
+        )
+        txid = self.algod.send_transaction(create.sign(sender.private_key))
+        self.app_id = transaction.wait_for_confirmation(self.algod, txid)["application-index"]
+        self.app_address = logic.get_application_address(self.app_id)
+        self.next_id = 0
+
+        # App account minimum balance
+        self._pay(self.app_address, 100_000)
+
+    def _pay(self, receiver: str, amount: int):
+        atc = AtomicTransactionComposer()
+        atc.add_transaction(TransactionWithSigner(
+            transaction.PaymentTxn(self.sender, self.algod.suggested_params(), receiver, amount), self.signer
+        ))
+        atc.execute(self.algod, 4)
+
+    def _box(self, escrow_id: int) -> list[tuple[int, bytes]]:
+        return [(self.app_id, b"e" + escrow_id.to_bytes(8, "big"))]
+
+    def _call(
+        self,
+        atc: AtomicTransactionComposer,
+        method: str,
+        args: list,
+        escrow_id: int,
+        inner_txns: int = 0,
+        accounts: Sequence[str] = (),
+    ):
+        params = self.algod.suggested_params()
+        params.flat_fee = True
+        params.fee = params.min_fee * (1 + inner_txns)
+        atc.add_method_call(
+            app_id=self.app_id,
+            method=self.contract.get_method_by_name(method),
+            sender=self.sender,
+            sp=params,
+            signer=self.signer,
+            method_args=args,
+            boxes=self._box(escrow_id),
+            accounts=list(accounts),
+        )
+
+    def create_funded(self, freelancer: str, milestones: int) -> int:
+        """Create and fully fund an escrow of `milestones` equal milestones; returns its id."""
+        escrow_id = self.next_id
+        params = self.algod.suggested_params()
+
+        atc = AtomicTransactionComposer()
+        mbr = transaction.PaymentTxn(
+            self.sender, params, self.app_address, BOX_MBR_BASE + BOX_MBR_PER_MILESTONE * milestones
+        )
+        self._call(atc, "create_escrow", [TransactionWithSigner(mbr, self.signer), freelancer,
+                                          [MILESTONE_AMOUNT] * milestones], escrow_id)
+        atc.execute(self.algod, 4)
+        self.next_id += 1
+
+        atc = AtomicTransactionComposer()
+        funding = transaction.PaymentTxn(self.sender, params, self.app_address, MILESTONE_AMOUNT * milestones)
+        self._call(atc, "fund_escrow", [TransactionWithSigner(funding, self.signer), escrow_id], escrow_id)
+        atc.execute(self.algod, 4)
+        return escrow_id
+
+    def simulate(self, atc: AtomicTransactionComposer) -> dict:
+        """Opcode budget consumed and fees paid by a group, without committing it."""
+        result = atc.simulate(self.algod).simulate_response["txn-groups"][0]
+        if result.get("failure-message"):
+            raise RuntimeError(result["failure-message"])
+        return {
+            "txns": len(atc.txn_list),
+            "budget": result["app-budget-consumed"],
+            "fee": sum(tws.txn.fee for tws in atc.txn_list),
+        }
+
+    def per_milestone(self, escrow_id: int, freelancer: str, milestones: int) -> dict:
+        atc = AtomicTransactionComposer()
+        for index in range(milestones):
+            self._call(atc, "release_payment", [escrow_id, index], escrow_id, inner_txns=1, accounts=[freelancer])
+        return self.simulate(atc)
+
+    def batched(self, escrow_id: int, freelancer: str, milestones: int) -> dict:
+        atc = AtomicTransactionComposer()
+        self._call(atc, "release_milestones", [escrow_id, list(range(milestones))], escrow_id,
+                   inner_txns=1, accounts=[freelancer])
+        return self.simulate(atc)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--milestones", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    args = parser.parse_args()
+    if max(args.milestones) > MAX_GROUP_SIZE:
+        # The per-milestone path must fit in one group to be simulated atomically
+        parser.error(f"--milestones must be at most {MAX_GROUP_SIZE}")
+    if not SPEC_FILE.exists():
+        parser.error(f"{SPEC_FILE} not found; build the contract first: algokit project run build -- multi_escrow")
+
+    algorand = AlgorandClient.default_localnet()
+    dispenser = algorand.account.localnet_dispenser()
+    escrows = Escrows(algorand, dispenser, json.loads(SPEC_FILE.read_text()))
+    freelancer = account.generate_account()[1]
+    print(f"MultiMilestoneEscrow app {escrows.app_id}, {MILESTONE_AMOUNT / 1e6:g} ALGO per milestone\n")
+
+    print(f"{'milestones':>10} {'path':<12} {'txns':>5} {'budget':>7} {'fee uA':>7}")
+    for milestones in args.milestones:
+        escrow_id = escrows.create_funded(freelancer, milestones)
+        for name, path in (("per-call", escrows.per_milestone), ("batched", escrows.batched)):
+            result = path(escrow_id, freelancer, milestones)
+            print(f"{milestones:>10} {name:<12} {result['txns']:>5} {result['budget']:>7} {result['fee']:>7}")
+
+
+if __name__ == "__main__":
+    main()
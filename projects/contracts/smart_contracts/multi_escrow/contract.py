@@ -0,0 +1,196 @@
+"""
+CampusNexus - Multi-Escrow Milestone Contract
+Many milestone escrows in one app, one box per escrow
+"""
+from algopy import (
+    ARC4Contract,
+    BoxMap,
+    Global,
+    GlobalState,
+    String,
+    Txn,
+    UInt64,
+    arc4,
+    gtxn,
+    itxn,
+    op,
+    subroutine,
+    urange,
+)
+from algopy.arc4 import abimethod
+
+# Milestones per escrow (one bit each in released_milestones)
+MAX_MILESTONES = 64
+
+STATUS_ACTIVE = 1
+STATUS_COMPLETED = 2
+STATUS_CANCELLED = 3
+
+# Value of a milestone's bit once it has been paid out
+RELEASED = True
+
+
+class EscrowRecord(arc4.Struct):
+    """One escrow, stored in box "e" + escrow id."""
+    client: arc4.Address
+    freelancer: arc4.Address
+    total_amount: arc4.UInt64
+    funded_amount: arc4.UInt64
+    released_amount: arc4.UInt64
+    status: arc4.UInt64  # 1=active, 2=completed, 3=cancelled
+    released_milestones: arc4.UInt64  # Bit i set = milestone i paid out
+    milestones: arc4.DynamicArray[arc4.UInt64]  # Amount of each milestone
+
+
+class MultiMilestoneEscrow(ARC4Contract):
+    """
+    Milestone-Based Escrows for CampusNexus, all held by one application
+
+    Flow:
+    1. Client creates an escrow with its milestone amounts (one app call,
+       grouped with a payment covering the box's minimum balance)
+    2. Client funds the escrow
+    3. Client releases milestones as they are approved, one per call or
+       several at once with a single payment (release_milestones)
+    """
+
+    def __init__(self) -> None:
+        self.escrow_count = GlobalState(UInt64(0))
+        self.escrows = BoxMap(UInt64, EscrowRecord, key_prefix="e")
+
+    @abimethod()
+    def create_escrow(
+        self,
+        mbr_payment: gtxn.PaymentTransaction,
+        freelancer_addr: arc4.Address,
+        milestones: arc4.DynamicArray[arc4.UInt64],
+    ) -> UInt64:
+        """Create a new escrow and return its id."""
+        assert mbr_payment.sender == Txn.sender, "Payment must come from the client"
+        assert mbr_payment.receiver == Global.current_application_address, "Payment must go to the app"
+        assert milestones.length > 0, "At least one milestone required"
+        assert milestones.length <= MAX_MILESTONES, "Too many milestones"
+
+        total = UInt64(0)
+        for amount in milestones:
+            assert amount.native > 0, "Milestone amount must be positive"
+            total += amount.native
+
+        escrow_id = self.escrow_count.value
+        min_balance_before = Global.current_application_address.min_balance
+        self.escrows[escrow_id] = EscrowRecord(
+            client=arc4.Address(Txn.sender),
+            freelancer=freelancer_addr,
+            total_amount=arc4.UInt64(total),
+            funded_amount=arc4.UInt64(0),
+            released_amount=arc4.UInt64(0),
+            status=arc4.UInt64(STATUS_ACTIVE),
+            released_milestones=arc4.UInt64(0),
+            milestones=milestones.copy(),
+        )
+        box_mbr = Global.current_application_address.min_balance - min_balance_before
+        assert mbr_payment.amount >= box_mbr, "Payment does not cover the box minimum balance"
+
+        self.escrow_count.value = escrow_id + 1
+        return escrow_id
+
+    @abimethod()
+    def fund_escrow(self, payment: gtxn.PaymentTransaction, escrow_id: UInt64) -> String:
+        """Fund the escrow (client sends ALGO to the app in the same group)."""
+        record = self.escrows[escrow_id].copy()
+        assert Txn.sender == record.client.native, "Only client can fund"
+        assert record.status.native == STATUS_ACTIVE, "Escrow not active"
+        assert payment.sender == Txn.sender, "Payment must come from the client"
+        assert payment.receiver == Global.current_application_address, "Payment must go to the app"
+
+        funded = record.funded_amount.native + payment.amount
+        assert funded <= record.total_amount.native, "Funding exceeds total"
+        record.funded_amount = arc4.UInt64(funded)
+        self.escrows[escrow_id] = record.copy()
+
+        return String("Escrow funded")
+
+    @abimethod()
+    def release_payment(self, escrow_id: UInt64, milestone_index: UInt64) -> String:
+        """Pay one milestone out to the freelancer (called by client)."""
+        record = self.escrows[escrow_id].copy()
+        assert Txn.sender == record.client.native, "Only client can release"
+        assert record.status.native == STATUS_ACTIVE, "Escrow not active"
+        assert milestone_index < record.milestones.length, "Invalid milestone index"
+
+        released_milestones = record.released_milestones.native
+        assert not op.getbit(released_milestones, milestone_index), "Milestone already released"
+        released_milestones = op.setbit_uint64(released_milestones, milestone_index, RELEASED)
+        return self._pay_out(escrow_id, record, released_milestones, record.milestones[milestone_index].native)
+
+    @abimethod()
+    def release_milestones(self, escrow_id: UInt64, milestone_indexes: arc4.DynamicArray[arc4.UInt64]) -> String:
+        """Pay several milestones out with a single inner payment (called by client)."""
+        record = self.escrows[escrow_id].copy()
+        assert Txn.sender == record.client.native, "Only client can release"
+        assert record.status.native == STATUS_ACTIVE, "Escrow not active"
+        assert milestone_indexes.length > 0, "No milestones given"
+
+        released_milestones = record.released_milestones.native
+        amount = UInt64(0)
+        for index in milestone_indexes:
+            assert index.native < record.milestones.length, "Invalid milestone index"
+            # Bits are set as we go, so an index repeated in the batch is rejected too
+            assert not op.getbit(released_milestones, index.native), "Milestone already released"
+            released_milestones = op.setbit_uint64(released_milestones, index.native, RELEASED)
+            amount += record.milestones[index.native].native
+        return self._pay_out(escrow_id, record, released_milestones, amount)
+
+    @subroutine
+    def _pay_out(self, escrow_id: UInt64, record: EscrowRecord, released_milestones: UInt64, amount: UInt64) -> String:
+        """Send `amount` to the freelancer and store the newly released milestones."""
+        released = record.released_amount.native + amount
+        assert released <= record.funded_amount.native, "Escrow not funded for these milestones"
+
+        # Fee pooled from the outer call
+        itxn.Payment(receiver=record.freelancer.native, amount=amount, fee=0).submit()
+
+        updated = record.copy()
+        updated.released_milestones = arc4.UInt64(released_milestones)
+        updated.released_amount = arc4.UInt64(released)
+        if released == updated.total_amount.native:
+            updated.status = arc4.UInt64(STATUS_COMPLETED)
+        self.escrows[escrow_id] = updated.copy()
+
+        if released == updated.total_amount.native:
+            return String("Escrow completed - all funds released")
+        return String("Payment released")
+
+    @abimethod()
+    def cancel_escrow(self, escrow_id: UInt64) -> String:
+        """Cancel escrow and refund the client's funding."""
+        record = self.escrows[escrow_id].copy()
+        assert Txn.sender == record.client.native, "Only client can cancel"
+        assert record.status.native == STATUS_ACTIVE, "Escrow not active"
+        assert record.released_amount.native == 0, "Cannot cancel after release"
+
+        if record.funded_amount.native > 0:
+            itxn.Payment(receiver=record.client.native, amount=record.funded_amount.native, fee=0).submit()
+
+        record.status = arc4.UInt64(STATUS_CANCELLED)
+        self.escrows[escrow_id] = record.copy()
+        return String("Escrow cancelled")
+
+    @abimethod(readonly=True)
+    def get_info(self, escrow_id: UInt64) -> EscrowRecord:
+        """Get escrow information."""
+        return self.escrows[escrow_id].copy()
+
+    @abimethod(readonly=True)
+    def get_escrow_count(self) -> UInt64:
+        """Number of escrows created; ids are 0 .. count - 1."""
+        return self.escrow_count.value
+
+    @abimethod(readonly=True)
+    def get_milestones_released(self, escrow_id: UInt64) -> arc4.DynamicArray[arc4.Bool]:
+        """Released flag of each milestone, in order."""
+        record = self.escrows[escrow_id].copy()
+        flags = arc4.DynamicArray[arc4.Bool]()
+        for i in urange(record.milestones.length):
+            flags.append(arc4.Bool(op.getbit(record.released_milestones.native, i)))
+        return flags
@@ -0,0 +1,39 @@
+import logging
+import os
+
+from algokit_utils import AlgorandClient
+
+logger = logging.getLogger(__name__)
+
+
+def deploy() -> None:
+    """Deploy the MultiMilestoneEscrow contract."""
+    # Imported here so this module loads before the first build has generated the client;
+    # smart_contracts.__main__ drops contracts whose deploy_config fails to import
+    from smart_contracts.artifacts.multi_escrow.multi_milestone_escrow_client import APP_SPEC
+
+    # Use environment variables for connection
+    algorand = AlgorandClient.from_environment()
+
+    # Get deployer account
+    mnemonic_phrase = os.getenv("DEPLOYER_MNEMONIC")
+    if mnemonic_phrase:
+        deployer = algorand.account.from_mnemonic(mnemonic=mnemonic_phrase)
+        logger.info(f"Deploying with account: {deployer.address}")
+    else:
+        deployer = algorand.account.localnet_dispenser()
+        logger.info(f"Deploying with Localnet dispenser: {deployer.address}")
+
+    # Create App Factory
+    factory = algorand.client.get_app_factory(
+        app_spec=APP_SPEC,
+        app_name="MultiMilestoneEscrow",
+        default_sender=deployer.address,
+        default_signer=deployer.signer,
+    )
+
+    # Deploy using create (simpler, avoids network lookup)
+    app = factory.create()
+
+    logger.info(f"Deployed MultiMilestoneEscrow with app_id: {app.app_id}")
+
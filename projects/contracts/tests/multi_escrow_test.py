@@ -0,0 +1,335 @@
+from collections.abc import Iterator
+
+import algopy
+import pytest
+from algopy import arc4
+from algopy_testing import AlgopyTestContext, algopy_testing_context
+
+from smart_contracts.multi_escrow.contract import (
+    STATUS_ACTIVE,
+    STATUS_CANCELLED,
+    STATUS_COMPLETED,
+    MultiMilestoneEscrow,
+)
+
+MILESTONES = (1_000_000, 2_000_000)
+TOTAL = sum(MILESTONES)
+BOX_MBR = 100_000
+
+
+@pytest.fixture()
+def context() -> Iterator[AlgopyTestContext]:
+    with algopy_testing_context() as ctx:
+        yield ctx
+
+
+@pytest.fixture()
+def contract(context: AlgopyTestContext) -> MultiMilestoneEscrow:
+    return MultiMilestoneEscrow()
+
+
+@pytest.fixture()
+def freelancer(context: AlgopyTestContext) -> algopy.Account:
+    return context.any.account()
+
+
+def payment(
+    context: AlgopyTestContext, contract: MultiMilestoneEscrow, amount: int, sender: algopy.Account | None = None
+) -> algopy.gtxn.PaymentTransaction:
+    return context.any.txn.payment(
+        sender=sender or context.default_sender,
+        receiver=context.ledger.get_app(contract).address,
+        amount=algopy.UInt64(amount),
+    )
+
+
+def create(
+    context: AlgopyTestContext,
+    contract: MultiMilestoneEscrow,
+    freelancer: algopy.Account,
+    amounts: tuple[int, ...] = MILESTONES,
+) -> algopy.UInt64:
+    milestones = arc4.DynamicArray[arc4.UInt64](*[arc4.UInt64(amount) for amount in amounts])
+    return contract.create_escrow(payment(context, contract, BOX_MBR), arc4.Address(freelancer), milestones)
+
+
+def create_funded(
+    context: AlgopyTestContext,
+    contract: MultiMilestoneEscrow,
+    freelancer: algopy.Account,
+    amounts: tuple[int, ...] = MILESTONES,
+) -> algopy.UInt64:
+    escrow_id = create(context, contract, freelancer, amounts)
+    contract.fund_escrow(payment(context, contract, sum(amounts)), escrow_id)
+    return escrow_id
+
+
+def indexes(*values: int) -> arc4.DynamicArray[arc4.UInt64]:
+    return arc4.DynamicArray[arc4.UInt64](*[arc4.UInt64(value) for value in values])
+
+
+def test_create_escrow(context: AlgopyTestContext, contract: MultiMilestoneEscrow, freelancer: algopy.Account) -> None:
+    # Act
+    first = create(context, contract, freelancer)
+    second = create(context, contract, freelancer)
+
+    # Assert
+    assert (first, second) == (0, 1)
+    assert contract.get_escrow_count() == 2
+    record = contract.get_info(first)
+    assert record.client.native == context.default_sender
+    assert record.freelancer.native == freelancer
+    assert record.total_amount.native == TOTAL
+    assert record.funded_amount.native == 0
+    assert record.status.native == STATUS_ACTIVE
+
+
+def test_create_escrow_rejects_payment_from_someone_else(
+    context: AlgopyTestContext, contract: MultiMilestoneEscrow, freelancer: algopy.Account
+) -> None:
+    milestones = arc4.DynamicArray[arc4.UInt64](arc4.UInt64(MILESTONES[0]))
+    mbr_payment = payment(context, contract, BOX_MBR, sender=context.any.account())
+
+    with pytest.raises(AssertionError, match="Payment must come from the client"):
+        contract.create_escrow(mbr_payment, arc4.Address(freelancer), milestones)
+
+
+def test_fund_escrow(context: AlgopyTestContext, contract: MultiMilestoneEscrow, freelancer: algopy.Account) -> None:
+    # Arrange
+    escrow_id = create(context, contract, freelancer)
+
+    # Act
+    contract.fund_escrow(payment(context, contract, MILESTONES[0]), escrow_id)
+
+    # Assert
+    assert contract.get_info(escrow_id).funded_amount.native == MILESTONES[0]
+
+
+def test_fund_escrow_rejects_more_than_total(
+    context: AlgopyTestContext, contract: MultiMilestoneEscrow, freelancer: algopy.Account
+) -> None:
+    escrow_id = create(context, contract, freelancer)
+
+    with pytest.raises(AssertionError, match="Funding exceeds total"):
+        contract.fund_escrow(payment(context, contract, TOTAL + 1), escrow_id)
+
+
+def test_release_payment(
+    context: AlgopyTestContext, contract: MultiMilestoneEscrow, freelancer: algopy.Account
+) -> None:
+    # Arrange
+    escrow_id = create_funded(context, contract, freelancer)
+
+    # Act
+    output = contract.release_payment(escrow_id, algopy.UInt64(1))
+
+    # Assert
+    assert output == "Payment released"
+    inner = context.txn.last_group.last_itxn.payment
+    assert inner.receiver == freelancer
+    assert inner.amount == MILESTONES[1]
+    record = contract.get_info(escrow_id)
+    assert record.released_amount.native == MILESTONES[1]
+    assert record.status.native == STATUS_ACTIVE
+    assert [flag.native for flag in contract.get_milestones_released(escrow_id)] == [False, True]
+
+
+def test_release_last_payment_completes_escrow(
+    context: AlgopyTestContext, contract: MultiMilestoneEscrow, freelancer: algopy.Account
+) -> None:
+    # Arrange
+    escrow_id = create_funded(context, contract, freelancer)
+    contract.release_payment(escrow_id, algopy.UInt64(0))
+
+    # Act
+    output = contract.release_payment(escrow_id, algopy.UInt64(1))
+
+    # Assert
+    assert output == "Escrow completed - all funds released"
+    assert contract.get_info(escrow_id).status.native == STATUS_COMPLETED
+
+
+def test_release_payment_twice_is_rejected(
+    context: AlgopyTestContext, contract: MultiMilestoneEscrow, freelancer: algopy.Account
+) -> None:
+    escrow_id = create_funded(context, contract, freelancer)
+    contract.release_payment(escrow_id, algopy.UInt64(0))
+
+    with pytest.raises(AssertionError, match="Milestone already released"):
+        contract.release_payment(escrow_id, algopy.UInt64(0))
+
+
+def test_release_payment_before_funding_is_rejected(
+    context: AlgopyTestContext, contract: MultiMilestoneEscrow, freelancer: algopy.Account
+) -> None:
+    escrow_id = create(context, contract, freelancer)
+
+    with pytest.raises(AssertionError, match="Escrow not funded for these milestones"):
+        contract.release_payment(escrow_id, algopy.UInt64(0))
+
+
+def test_release_payment_by_non_client_is_rejected(
+    context: AlgopyTestContext, contract: MultiMilestoneEscrow, freelancer: algopy.Account
+) -> None:
+    escrow_id = create_funded(context, contract, freelancer)
+
+    with (
+        context.txn.create_group(active_txn_overrides={"sender": freelancer}),
+        pytest.raises(AssertionError, match="Only client can release"),
+    ):
+        contract.release_payment(escrow_id, algopy.UInt64(0))
+
+
+def test_cancel_escrow_refunds_client(
+    context: AlgopyTestContext, contract: MultiMilestoneEscrow, freelancer: algopy.Account
+) -> None:
+    # Arrange
+    escrow_id = create_funded(context, contract, freelancer)
+
+    # Act
+    output = contract.cancel_escrow(escrow_id)
+
+    # Assert
+    assert output == "Escrow cancelled"
+    inner = context.txn.last_group.last_itxn.payment
+    assert inner.receiver == context.default_sender
+    assert inner.amount == TOTAL
+    assert contract.get_info(escrow_id).status.native == STATUS_CANCELLED
+
+
+def test_cancel_escrow_after_release_is_rejected(
+    context: AlgopyTestContext, contract: MultiMilestoneEscrow, freelancer: algopy.Account
+) -> None:
+    escrow_id = create_funded(context, contract, freelancer)
+    contract.release_payment(escrow_id, algopy.UInt64(0))
+
+    with pytest.raises(AssertionError, match="Cannot cancel after release"):
+        contract.cancel_escrow(escrow_id)
+
+
+def test_cancel_escrow_by_non_client_is_rejected(
+    context: AlgopyTestContext, contract: MultiMilestoneEscrow, freelancer: algopy.Account
+) -> None:
+    escrow_id = create_funded(context, contract, freelancer)
+
+    with (
+        context.txn.create_group(active_txn_overrides={"sender": freelancer}),
+        pytest.raises(AssertionError, match="Only client can cancel"),
+    ):
+        contract.cancel_escrow(escrow_id)
+
+
+def test_cancelled_escrow_cannot_be_released(
+    context: AlgopyTestContext, contract: MultiMilestoneEscrow, freelancer: algopy.Account
+) -> None:
+    escrow_id = create_funded(context, contract, freelancer)
+    contract.cancel_escrow(escrow_id)
+
+    with pytest.raises(AssertionError, match="Escrow not active"):
+        contract.release_payment(escrow_id, algopy.UInt64(0))
+
+
+def test_release_milestones_pays_batch_with_one_payment(
+    context: AlgopyTestContext, contract: MultiMilestoneEscrow, freelancer: algopy.Account
+) -> None:
+    # Arrange
+    amounts = (1_000_000, 2_000_000, 3_000_000)
+    escrow_id = create_funded(context, contract, freelancer, amounts)
+
+    # Act
+    output = contract.release_milestones(escrow_id, indexes(2, 0))
+
+    # Assert
+    assert output == "Payment released"
+    assert len(context.txn.last_group.itxn_groups) == 1
+    inner = context.txn.last_group.last_itxn.payment
+    assert inner.receiver == freelancer
+    assert inner.amount == amounts[0] + amounts[2]
+    record = contract.get_info(escrow_id)
+    assert record.released_amount.native == amounts[0] + amounts[2]
+    assert record.status.native == STATUS_ACTIVE
+    assert [flag.native for flag in contract.get_milestones_released(escrow_id)] == [True, False, True]
+
+
+def test_release_milestones_mixed_with_release_payment_completes_escrow(
+    context: AlgopyTestContext, contract: MultiMilestoneEscrow, freelancer: algopy.Account
+) -> None:
+    # Arrange
+    amounts = (1_000_000, 2_000_000, 3_000_000)
+    escrow_id = create_funded(context, contract, freelancer, amounts)
+    contract.release_payment(escrow_id, algopy.UInt64(1))
+
+    # Act
+    output = contract.release_milestones(escrow_id, indexes(0, 2))
+
+    # Assert
+    assert output == "Escrow completed - all funds released"
+    assert context.txn.last_group.last_itxn.payment.amount == amounts[0] + amounts[2]
+    record = contract.get_info(escrow_id)
+    assert record.released_amount.native == sum(amounts)
+    assert record.status.native == STATUS_COMPLETED
+
+
+def test_release_milestones_with_released_milestone_is_rejected(
+    context: AlgopyTestContext, contract: MultiMilestoneEscrow, freelancer: algopy.Account
+) -> None:
+    # Arrange
+    amounts = (1_000_000, 2_000_000, 3_000_000)
+    escrow_id = create_funded(context, contract, freelancer, amounts)
+    contract.release_payment(escrow_id, algopy.UInt64(1))
+
+    # Act / Assert
+    with pytest.raises(AssertionError, match="Milestone already released"):
+        contract.release_milestones(escrow_id, indexes(0, 1))
+    assert contract.get_info(escrow_id).released_amount.native == amounts[1]
+
+
+def test_release_milestones_with_repeated_index_is_rejected(
+    context: AlgopyTestContext, contract: MultiMilestoneEscrow, freelancer: algopy.Account
+) -> None:
+    escrow_id = create_funded(context, contract, freelancer)
+
+    with pytest.raises(AssertionError, match="Milestone already released"):
+        contract.release_milestones(escrow_id, indexes(0, 0))
+
+
+def test_release_milestones_with_invalid_index_is_rejected(
+    context: AlgopyTestContext, contract: MultiMilestoneEscrow, freelancer: algopy.Account
+) -> None:
+    escrow_id = create_funded(context, contract, freelancer)
+
+    with pytest.raises(AssertionError, match="Invalid milestone index"):
+        contract.release_milestones(escrow_id, indexes(0, len(MILESTONES)))
+
+
+def test_release_milestones_without_indexes_is_rejected(
+    context: AlgopyTestContext, contract: MultiMilestoneEscrow, freelancer: algopy.Account
+) -> None:
+    escrow_id = create_funded(context, contract, freelancer)
+
+    with pytest.raises(AssertionError, match="No milestones given"):
+        contract.release_milestones(escrow_id, indexes())
+
+
+def test_release_milestones_beyond_funding_is_rejected(
+    context: AlgopyTestContext, contract: MultiMilestoneEscrow, freelancer: algopy.Account
+) -> None:
+    # Arrange: only the first milestone is funded
+    escrow_id = create(context, contract, freelancer)
+    contract.fund_escrow(payment(context, contract, MILESTONES[0]), escrow_id)
+
+    # Act / Assert
+    with pytest.raises(AssertionError, match="Escrow not funded for these milestones"):
+        contract.release_milestones(escrow_id, indexes(0, 1))
+
+
+def test_release_milestones_by_non_client_is_rejected(
+    context: AlgopyTestContext, contract: MultiMilestoneEscrow, freelancer: algopy.Account
+) -> None:
+    escrow_id = create_funded(context, contract, freelancer)
+
+    with (
+        context.txn.create_group(active_txn_overrides={"sender": freelancer}),
+        pytest.raises(AssertionError, match="Only client can release"),
+    ):
+        contract.release_milestones(escrow_id, indexes(0))
@@ -41,6 +41,14 @@ export const authService = {
         localStorage.removeItem('auth_token');
     },
 
+    /**
+     * Authorization header for authenticated API calls
+     */
+    authHeaders: () => {
+        const token = authService.getToken();
+        return token ? { Authorization: `Bearer ${token}` } : {};
+    },
+
     /**
      * Check if user is authenticated
      */
@@ -82,7 +90,9 @@ export const authService = {
      */
     fetchUserProfile: async (userId) => {
         try {
-            const response = await fetch(`${API_BASE_URL}/oauth/me?user_id=${userId}`);
+            const response = await fetch(`${API_BASE_URL}/oauth/me?user_id=${userId}`, {
+                headers: authService.authHeaders(),
+            });
             if (!response.ok) throw new Error('Failed to fetch profile');
             return await response.json();
         } catch (error) {
@@ -100,6 +110,7 @@ export const authService = {
                 method: 'PUT',
                 headers: {
                     'Content-Type': 'application/json',
+                    ...authService.authHeaders(),
                 },
                 body: JSON.stringify(profileData),
             });
@@ -120,6 +131,7 @@ export const authService = {
                 method: 'POST',
                 headers: {
                     'Content-Type': 'application/json',
+                    ...authService.authHeaders(),
                 },
                 body: JSON.stringify({ user_id: userId, image_data: imageData }),
             });